@@ -0,0 +1,302 @@
+"""
+Benchmark de las operaciones de OperadorConjuntos a distintas escalas.
+Genera conjuntos y relaciones aleatorios con semilla fija, de 10^2 a 10^6
+elementos o pares y con varias densidades, mide el tiempo de cada operación
+y su pico de memoria, y guarda los resultados en JSON para comparar corridas.
+
+Uso:
+    python benchmarks/bench_operaciones.py [--tamanos 100 1000 10000 100000]
+        [--densidades 0.001 0.01 0.1] [--operaciones union composicion ...]
+        [--repeticiones 3] [--salida resultados.json]
+        [--comparar base.json] [--umbral 1.25] [--sin-limites]
+
+El tiempo es el mejor de varias repeticiones sin instrumentar; la memoria
+se mide en una ejecución aparte con tracemalloc, porque tracemalloc hace
+más lenta cada asignación.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.conjuntos import OperadorConjuntos  # noqa: E402
+from src import matriz_numpy  # noqa: E402
+
+
+# === GENERACIÓN DE DATOS ===
+
+def generar_conjunto(tamano, semilla, desplazamiento=0):
+    """Conjunto de 'tamano' enteros tomados de un rango el doble de grande"""
+    aleatorio = random.Random(semilla)
+    return set(aleatorio.sample(range(desplazamiento, desplazamiento + 2 * tamano), tamano))
+
+
+def lado_para(pares, densidad):
+    """Número de elementos del dominio para tener 'pares' pares con la densidad dada"""
+    return max(2, int(round((pares / densidad) ** 0.5)))
+
+
+def generar_relacion(pares, densidad, semilla):
+    """
+    Relación aleatoria con aproximadamente 'pares' pares sobre un dominio de
+    n elementos, donde densidad = pares / n².
+    """
+    aleatorio = random.Random(semilla)
+    lado = lado_para(pares, densidad)
+    pares = min(pares, lado * lado)
+    relacion = set()
+    while len(relacion) < pares:
+        relacion.add((aleatorio.randrange(lado), aleatorio.randrange(lado)))
+    return relacion
+
+
+def generar_relacion_transitiva(pares, densidad, semilla):
+    """
+    Relación de equivalencia (unión de bloques completos) con unos 'pares'
+    pares: es reflexiva, simétrica y transitiva, el peor caso de las
+    verificaciones porque ninguna puede terminar antes.
+    """
+    aleatorio = random.Random(semilla)
+    lado = lado_para(pares, densidad)
+    bloque = max(1, min(lado, int(round(densidad * lado))))
+    bloques = max(1, pares // (bloque * bloque))
+    elementos = aleatorio.sample(range(bloques * bloque * 4), bloques * bloque)
+    relacion = set()
+    for inicio in range(0, len(elementos), bloque):
+        grupo = elementos[inicio:inicio + bloque]
+        relacion.update((a, b) for a in grupo for b in grupo)
+    return relacion
+
+
+def dominio(relacion):
+    """Elementos que aparecen como primer componente de la relación"""
+    return {a for a, _ in relacion}
+
+
+# === CASOS ===
+# Cada caso prepara sus datos a partir de (tamaño, densidad, semilla) y retorna
+# una función que recibe un operador nuevo y ejecuta la operación sobre él.
+# 'maximo' limita el tamaño por defecto de las operaciones cuyo resultado
+# crece más rápido que la entrada (se ignora con --sin-limites).
+
+def caso_union(tamano, densidad, semilla):
+    a = generar_conjunto(tamano, semilla)
+    b = generar_conjunto(tamano, semilla + 1, tamano)
+    return lambda operador: operador.union_conjuntos(a, b)
+
+
+def caso_producto(tamano, densidad, semilla):
+    lado = max(1, int(tamano ** 0.5))
+    a = generar_conjunto(lado, semilla)
+    b = generar_conjunto(lado, semilla + 1)
+    return lambda operador: set(operador.producto_cartesiano(a, b))
+
+
+def caso_reflexiva(tamano, densidad, semilla):
+    relacion = generar_relacion_transitiva(tamano, densidad, semilla)
+    conjunto = dominio(relacion)
+    return lambda operador: operador.es_reflexiva(relacion, conjunto)
+
+
+def caso_simetrica(tamano, densidad, semilla):
+    relacion = generar_relacion_transitiva(tamano, densidad, semilla)
+    return lambda operador: operador.es_simetrica(relacion)
+
+
+def caso_transitiva(tamano, densidad, semilla):
+    relacion = generar_relacion_transitiva(tamano, densidad, semilla)
+    return lambda operador: operador.es_transitiva(relacion)
+
+
+def caso_transitiva_aleatoria(tamano, densidad, semilla):
+    relacion = generar_relacion(tamano, densidad, semilla)
+    return lambda operador: operador.es_transitiva(relacion)
+
+
+def caso_composicion(tamano, densidad, semilla):
+    r1 = generar_relacion(tamano, densidad, semilla)
+    r2 = generar_relacion(tamano, densidad, semilla + 1)
+    return lambda operador: operador.composicion_relaciones(r1, r2)
+
+
+def caso_potencia(tamano, densidad, semilla):
+    relacion = generar_relacion(tamano, densidad, semilla)
+    return lambda operador: operador.potencia_relacion(relacion, 3)
+
+
+def caso_bin(tamano, densidad, semilla):
+    relacion = generar_relacion(tamano, densidad, semilla)
+    elementos = sorted(dominio(relacion) | {b for _, b in relacion})
+    aleatorio = random.Random(semilla + 2)
+    c = set(aleatorio.sample(elementos, len(elementos) // 2))
+    b = set(aleatorio.sample(elementos, len(elementos) // 2))
+    return lambda operador: operador.operacion_bin(relacion, c, b)
+
+
+CASOS = {
+    'union': {'preparar': caso_union, 'densidad': False, 'maximo': None},
+    'producto': {'preparar': caso_producto, 'densidad': False, 'maximo': None},
+    'reflexiva': {'preparar': caso_reflexiva, 'densidad': True, 'maximo': None},
+    'simetrica': {'preparar': caso_simetrica, 'densidad': True, 'maximo': None},
+    'transitiva': {'preparar': caso_transitiva, 'densidad': True, 'maximo': 10 ** 5},
+    'transitiva_aleatoria': {'preparar': caso_transitiva_aleatoria, 'densidad': True, 'maximo': None},
+    'composicion': {'preparar': caso_composicion, 'densidad': True, 'maximo': 10 ** 5},
+    'potencia': {'preparar': caso_potencia, 'densidad': True, 'maximo': 10 ** 4},
+    'bin': {'preparar': caso_bin, 'densidad': True, 'maximo': None},
+}
+
+
+# === MEDICIÓN ===
+
+def tamano_resultado(valor):
+    """Número de elementos del resultado (1 para booleanos)"""
+    try:
+        return len(valor)
+    except TypeError:
+        return 1
+
+
+def medir_caso(ejecutar, repeticiones):
+    """
+    Mide una operación. Cada repetición usa un operador nuevo, para que ni la
+    caché de resultados ni los ciclos de potencias recordados afecten la medida.
+
+    Returns:
+        dict: Tiempos, pico de memoria y tamaño del resultado
+    """
+    tiempos = []
+    resultado = None
+    for _ in range(repeticiones):
+        operador = OperadorConjuntos(capacidad_cache=0)
+        inicio = time.perf_counter()
+        resultado = ejecutar(operador)
+        tiempos.append(time.perf_counter() - inicio)
+    tamano = tamano_resultado(resultado)
+    del resultado
+
+    operador = OperadorConjuntos(capacidad_cache=0)
+    tracemalloc.start()
+    try:
+        ejecutar(operador)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'segundos': min(tiempos),
+        'mediana_segundos': statistics.median(tiempos),
+        'memoria_pico_bytes': pico,
+        'tamano_resultado': tamano,
+    }
+
+
+def formatear_densidad(densidad):
+    """Texto de la densidad para las tablas ('-' si el caso no la usa)"""
+    return f"{densidad:g}" if densidad is not None else "-"
+
+
+def clave_resultado(registro):
+    """Identifica un resultado para compararlo entre corridas"""
+    return (registro['operacion'], registro['tamano'], registro['densidad'])
+
+
+def ejecutar_suite(argumentos):
+    """Ejecuta todas las combinaciones pedidas y retorna la lista de registros"""
+    registros = []
+    for nombre in argumentos.operaciones:
+        caso = CASOS[nombre]
+        densidades = argumentos.densidades if caso['densidad'] else [None]
+        for tamano in argumentos.tamanos:
+            if not argumentos.sin_limites and caso['maximo'] is not None and tamano > caso['maximo']:
+                print(f"{nombre:>22} {tamano:>9}  omitido (use --sin-limites)")
+                continue
+            for densidad in densidades:
+                ejecutar = caso['preparar'](tamano, densidad, argumentos.semilla)
+                medida = medir_caso(ejecutar, argumentos.repeticiones)
+                registro = dict({'operacion': nombre, 'tamano': tamano, 'densidad': densidad}, **medida)
+                registros.append(registro)
+                print(f"{nombre:>22} {tamano:>9} {formatear_densidad(densidad):>8} "
+                      f"{medida['segundos'] * 1000:12.3f} ms "
+                      f"{medida['memoria_pico_bytes'] / 1024:12.1f} KiB "
+                      f"{medida['tamano_resultado']:>10}")
+    return registros
+
+
+def comparar(registros, ruta_base, umbral):
+    """
+    Compara contra una corrida anterior e imprime la razón de tiempos.
+
+    Returns:
+        int: Número de operaciones más lentas que la base por encima del umbral
+    """
+    with open(ruta_base, encoding='utf-8') as archivo:
+        base = {clave_resultado(registro): registro for registro in json.load(archivo)['resultados']}
+
+    regresiones = 0
+    print(f"\nComparación con {ruta_base} (umbral {umbral:.2f}x):")
+    for registro in registros:
+        anterior = base.get(clave_resultado(registro))
+        if anterior is None:
+            continue
+        razon = registro['segundos'] / max(anterior['segundos'], 1e-9)
+        razon_memoria = registro['memoria_pico_bytes'] / max(anterior['memoria_pico_bytes'], 1)
+        marca = ""
+        if razon > umbral:
+            marca = "  ← REGRESIÓN"
+            regresiones += 1
+        print(f"{registro['operacion']:>22} {registro['tamano']:>9} "
+              f"{formatear_densidad(registro['densidad']):>8}  tiempo {razon:6.2f}x  memoria {razon_memoria:6.2f}x{marca}")
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--densidades", type=float, nargs="+", default=[0.001, 0.01, 0.1])
+    parser.add_argument("--operaciones", nargs="+", choices=sorted(CASOS), default=list(CASOS))
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--salida", default="resultados_benchmark.json")
+    parser.add_argument("--comparar", metavar="BASE.json",
+                        help="corrida anterior contra la que comparar los tiempos")
+    parser.add_argument("--umbral", type=float, default=1.25,
+                        help="razón de tiempo a partir de la cual se reporta una regresión")
+    parser.add_argument("--sin-limites", action="store_true",
+                        help="no omitir los tamaños grandes en composición, potencia y transitividad")
+    argumentos = parser.parse_args()
+
+    print(f"{'operación':>22} {'tamaño':>9} {'densidad':>8} {'tiempo':>15} {'memoria pico':>16} {'resultado':>10}")
+    registros = ejecutar_suite(argumentos)
+
+    documento = {
+        'metadatos': {
+            'fecha': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'numpy': matriz_numpy.NUMPY_DISPONIBLE,
+            'semilla': argumentos.semilla,
+            'repeticiones': argumentos.repeticiones,
+        },
+        'resultados': registros,
+    }
+    with open(argumentos.salida, 'w', encoding='utf-8') as archivo:
+        json.dump(documento, archivo, ensure_ascii=False, indent=2)
+    print(f"\nResultados guardados en {argumentos.salida}")
+
+    if argumentos.comparar:
+        regresiones = comparar(registros, argumentos.comparar, argumentos.umbral)
+        if regresiones:
+            raise SystemExit(f"{regresiones} operaciones más lentas que la base")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark del tokenizador de una sola pasada.
+Compara el camino anterior (validar con dos pasadas de regex y luego
+convertir con una tercera) contra analizar_relacion sobre entradas de
+varios megabytes.
+
+Uso:
+    python benchmarks/bench_tokenizador.py [--megabytes 1 4 16] [--repeticiones 3]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.tokenizador import analizar_relacion  # noqa: E402
+
+
+# === CAMINO ANTERIOR (referencia) ===
+
+def convertir_elemento_anterior(elemento_str):
+    """Conversión original: int() y float() dentro de try/except por token"""
+    elemento_str = elemento_str.strip()
+    try:
+        if '.' not in elemento_str:
+            return int(elemento_str)
+        else:
+            return float(elemento_str)
+    except ValueError:
+        return elemento_str
+
+
+def validar_y_crear_anterior(entrada):
+    """Validación con findall + sub y conversión con un tercer findall"""
+    patron_validacion = r'\([^,]+,[^)]+\)'
+    if not re.findall(patron_validacion, entrada):
+        raise ValueError("sin pares")
+    resto = re.sub(patron_validacion, '', entrada)
+    resto = resto.replace('{', '').replace('}', '').replace(',', '').replace(' ', '')
+    if resto:
+        raise ValueError("formato incorrecto")
+
+    entrada = entrada.strip().replace('{', '').replace('}', '')
+    pares = set()
+    for par in re.findall(r'\(([^,]+),([^)]+)\)', entrada):
+        pares.add((convertir_elemento_anterior(par[0]), convertir_elemento_anterior(par[1])))
+    return pares
+
+
+# === GENERACIÓN DE DATOS ===
+
+def generar_entrada(megabytes, semilla=0):
+    """Genera una relación en texto de aproximadamente el tamaño pedido"""
+    aleatorio = random.Random(semilla)
+    objetivo = int(megabytes * 1024 * 1024)
+    partes = []
+    longitud = 0
+    while longitud < objetivo:
+        if aleatorio.random() < 0.5:
+            par = f"({aleatorio.randrange(100000)},{aleatorio.randrange(100000)})"
+        else:
+            par = f"(x{aleatorio.randrange(5000)},{aleatorio.randrange(1000)})"
+        partes.append(par)
+        longitud += len(par) + 1
+    return "{" + ",".join(partes) + "}"
+
+
+def medir(funcion, entrada, repeticiones):
+    """Retorna el mejor tiempo de varias ejecuciones y el último resultado"""
+    mejor = float('inf')
+    resultado = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(entrada)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--megabytes", type=float, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--repeticiones", type=int, default=3)
+    argumentos = parser.parse_args()
+
+    print(f"{'MB':>6} {'anterior MB/s':>14} {'una pasada MB/s':>16} {'mejora':>7}")
+    for megabytes in argumentos.megabytes:
+        entrada = generar_entrada(megabytes)
+        tamano = len(entrada) / (1024 * 1024)
+        tiempo_anterior, esperado = medir(validar_y_crear_anterior, entrada, argumentos.repeticiones)
+        tiempo_nuevo, obtenido = medir(analizar_relacion, entrada, argumentos.repeticiones)
+        if obtenido != esperado:
+            raise SystemExit("Los resultados de ambos caminos no coinciden")
+        print(f"{tamano:6.1f} {tamano / tiempo_anterior:14.1f} {tamano / tiempo_nuevo:16.1f} "
+              f"{tiempo_anterior / tiempo_nuevo:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,8 @@ Casos de prueba y ejemplos predefinidos del enunciado.
 Ejecuta los ejemplos específicos mencionados en la tarea.
 """
 
-from src.utilidades import mostrar_conjunto_formateado, mostrar_relacion_formateada, mostrar_separador
+from src.perfil import PROPIEDADES, NOMBRES_PROPIEDADES, describir_contraejemplo
+from src.utilidades import clave_orden, mostrar_conjunto_formateado, mostrar_relacion_formateada, mostrar_separador
 
 
 def ejecutar_ejemplos_predefinidos(operador):
@@ -91,30 +92,36 @@ def ejemplo_propiedades_relacion(operador):
     print("En el conjunto:")
     mostrar_conjunto_formateado(conjunto_A, "A")
     
+    # Las tres propiedades salen del mismo perfil (una sola pasada sobre R)
+    perfil = operador.perfil_relacion(relacion_R, conjunto_A)
+    
     # Reflexividad
-    es_reflexiva = operador.es_reflexiva(relacion_R, conjunto_A)
+    es_reflexiva = perfil['reflexiva']['cumple']
     print(f"\nref(R,A): ¿Es R reflexiva en A?")
     print(f"Para ser reflexiva, debe contener (a,a) para todo a ∈ A")
     print(f"Verificando: (1,1), (a,a), (b,b) en R...")
     print(f"Resultado: {es_reflexiva}")
     
     # Simetría
-    es_simetrica = operador.es_simetrica(relacion_R)
+    es_simetrica = perfil['simetrica']['cumple']
     print(f"\nsim(R,A): ¿Es R simétrica?")
     print(f"Para ser simétrica, si (a,b) ∈ R entonces (b,a) ∈ R")
     print(f"Resultado: {es_simetrica}")
     
     # Transitividad
-    es_transitiva = operador.es_transitiva(relacion_R)
+    es_transitiva = perfil['transitiva']['cumple']
     print(f"\ntra(R,A): ¿Es R transitiva?")
     print(f"Para ser transitiva, si (a,b) ∈ R y (b,c) ∈ R entonces (a,c) ∈ R")
     print(f"Resultado: {es_transitiva}")
     
     # Resumen
-    print(f"\n✓ Resumen de propiedades de R:")
-    print(f"  - Reflexiva en A: {es_reflexiva}")
-    print(f"  - Simétrica: {es_simetrica}")
-    print(f"  - Transitiva: {es_transitiva}")
+    print(f"\n✓ Perfil completo de R en A:")
+    for propiedad in PROPIEDADES:
+        resultado = perfil[propiedad]
+        linea = f"  - {NOMBRES_PROPIEDADES[propiedad]}: {resultado['cumple']}"
+        if not resultado['cumple']:
+            linea += f"  ({describir_contraejemplo(propiedad, resultado['contraejemplo'])})"
+        print(linea)
 
 
 def ejemplo_potencia_relacion(operador):
@@ -141,6 +148,12 @@ def ejemplo_potencia_relacion(operador):
     print(f"\nR^3 = R^2 ∘ R:")
     mostrar_relacion_formateada(r_cubo)
     
+    # Los testigos de cada composición permiten reconstruir un camino
+    caminos = operador.potencia_con_caminos(relacion_R, 3)
+    if caminos:
+        a, c = min(caminos, key=clave_orden)
+        print(f"\nPor ejemplo, ({a},{c}) ∈ R^3 por el camino " + " → ".join(map(str, caminos.camino(a, c))))
+    
     print(f"\n✓ Resultado final R^3 = {r_cubo}")
 
 
@@ -161,8 +174,8 @@ def ejemplo_composicion_relacion(operador):
     print("\nRelación E:")
     mostrar_relacion_formateada(relacion_E, "E")
     
-    # Calcular composición
-    composicion_RE = operador.composicion_relaciones(relacion_R, relacion_E)
+    # Calcular composición registrando el elemento intermedio de cada par
+    composicion_RE = operador.composicion_con_testigos(relacion_R, relacion_E)
     
     print(f"\nR ∘ E:")
     mostrar_relacion_formateada(composicion_RE)
@@ -175,16 +188,11 @@ def ejemplo_composicion_relacion(operador):
     if composicion_RE:
         print(f"Por ejemplo:")
         for par in list(composicion_RE)[:3]:  # Mostrar máximo 3 ejemplos
-            a, c = par
-            # Buscar el elemento intermedio
-            for par_r in relacion_R:
-                for par_e in relacion_E:
-                    if len(par_r) == 2 and len(par_e) == 2:
-                        if par_r[0] == a and par_r[1] == par_e[0] and par_e[1] == c:
-                            print(f"  - ({a},{c}) está porque ({a},{par_r[1]}) ∈ R y ({par_e[0]},{c}) ∈ E")
-                            break
-    
-    print(f"\n✓ Resultado final R∘E = {composicion_RE}")
+            # El elemento intermedio se guardó al componer
+            a, b, c = composicion_RE.explicar(*par)
+            print(f"  - ({a},{c}) está porque ({a},{b}) ∈ R y ({b},{c}) ∈ E")
+    
+    print(f"\n✓ Resultado final R∘E = {composicion_RE.copy()}")
 
 
 def ejecutar_casos_adicionales(operador):
@@ -7,12 +7,133 @@ Fecha: Septiembre 2025
 Punto de entrada principal del programa.
 """
 
+import argparse
+import sys
+
+from src.cargador import cargar_conjunto, cargar_relacion, ErrorCarga
 from src.conjuntos import OperadorConjuntos
+from src.espacio_trabajo import cargar_espacio_trabajo, guardar_espacio_trabajo, ErrorEspacioTrabajo
 from src.interfaz import ejecutar_menu_principal
+from src.lote import ejecutar_lote
+from src.perfilado import activar_perfilado, ruta_desde_entorno, ARCHIVO_POR_DEFECTO
+from src.validadores import validar_nombre_conjunto
+
+
+def crear_parser_argumentos():
+    """Define los argumentos de línea de comandos del programa"""
+    parser = argparse.ArgumentParser(
+        description="Operaciones con conjuntos y relaciones"
+    )
+    parser.add_argument(
+        "--indexado", action="store_true",
+        help="guardar los conjuntos como máscaras de bits sobre el universo U"
+    )
+    parser.add_argument(
+        "--cargar-conjunto", action="append", default=[], metavar="NOMBRE=RUTA",
+        help="cargar un conjunto desde un archivo (se puede repetir)"
+    )
+    parser.add_argument(
+        "--cargar-relacion", action="append", default=[], metavar="NOMBRE=RUTA",
+        help="cargar una relación desde un archivo (se puede repetir)"
+    )
+    parser.add_argument(
+        "--formato", choices=["pares", "lineas"],
+        help="formato de los archivos de relación (por defecto se detecta)"
+    )
+    parser.add_argument(
+        "--compacto", action="store_true",
+        help="guardar las relaciones cargadas en formato compacto CSR"
+    )
+    parser.add_argument(
+        "--trabajadores", type=int, default=1, metavar="N",
+        help="procesos para composición, potencia y transitividad de relaciones "
+             "grandes (0 = todos los núcleos; por defecto 1)"
+    )
+    parser.add_argument(
+        "--espacio", metavar="ARCHIVO",
+        help="cargar al inicio un espacio de trabajo guardado (reemplaza los ejemplos)"
+    )
+    parser.add_argument(
+        "--guardar-espacio", metavar="ARCHIVO",
+        help="guardar el espacio de trabajo en ARCHIVO al terminar"
+    )
+    parser.add_argument(
+        "--perfil", nargs="?", const=ARCHIVO_POR_DEFECTO, metavar="ARCHIVO",
+        help="registrar estadísticas de cada operación y guardarlas en ARCHIVO al salir "
+             f"(por defecto {ARCHIVO_POR_DEFECTO}; también con la variable CONJUNTOS_PERFIL)"
+    )
+    parser.add_argument(
+        "guion", nargs="?",
+        help="archivo de comandos a ejecutar sin menú ('-' para leer de la entrada estándar)"
+    )
+    return parser
+
+
+def separar_nombre_ruta(parser, valor):
+    """Separa un argumento NOMBRE=RUTA validando el nombre"""
+    nombre, separador, ruta = valor.partition("=")
+    es_valido, mensaje = validar_nombre_conjunto(nombre)
+    if not separador or not ruta or not es_valido:
+        parser.error(f"se esperaba NOMBRE=RUTA, se recibió '{valor}' {mensaje}".rstrip())
+    return nombre.upper(), ruta
+
+
+def cargar_archivos(parser, argumentos, operador):
+    """Carga en el operador los conjuntos y relaciones indicados por línea de comandos"""
+    try:
+        if argumentos.espacio:
+            cargar_espacio_trabajo(operador, argumentos.espacio)
+        for valor in argumentos.cargar_conjunto:
+            nombre, ruta = separar_nombre_ruta(parser, valor)
+            operador.agregar_conjunto(nombre, cargar_conjunto(ruta))
+        for valor in argumentos.cargar_relacion:
+            nombre, ruta = separar_nombre_ruta(parser, valor)
+            tabla = operador.tabla_compartida() if argumentos.compacto else None
+            relacion = cargar_relacion(ruta, argumentos.formato, argumentos.compacto, tabla)
+            operador.agregar_relacion(nombre, relacion)
+    except (OSError, ErrorCarga, ErrorEspacioTrabajo) as error:
+        parser.error(str(error))
+
+
+def guardar_al_salir(argumentos, operador):
+    """Guarda el espacio de trabajo si se pidió con --guardar-espacio"""
+    if not argumentos.guardar_espacio:
+        return
+    try:
+        guardar_espacio_trabajo(operador, argumentos.guardar_espacio)
+    except (OSError, ErrorEspacioTrabajo) as error:
+        print(f"Error al guardar el espacio de trabajo: {error}", file=sys.stderr)
+
+
+def ejecutar_guion(operador, ruta):
+    """Ejecuta un guion de comandos en modo por lotes y retorna el código de salida"""
+    if ruta == "-":
+        errores = ejecutar_lote(operador, sys.stdin, sys.stdout)
+    else:
+        with open(ruta, encoding="utf-8") as archivo:
+            errores = ejecutar_lote(operador, archivo, sys.stdout)
+    return 1 if errores else 0
 
 
 def main():
     """Función principal del programa"""
+    parser = crear_parser_argumentos()
+    argumentos = parser.parse_args()
+    
+    # Crear instancia del operador
+    operador = OperadorConjuntos(modo_indexado=argumentos.indexado,
+                                 trabajadores=argumentos.trabajadores)
+    ruta_perfil = argumentos.perfil or ruta_desde_entorno()
+    if ruta_perfil:
+        activar_perfilado(operador, ruta_perfil)
+    cargar_archivos(parser, argumentos, operador)
+    
+    # Modo por lotes: sin encabezado, menús ni pausas
+    if argumentos.guion is not None:
+        codigo = ejecutar_guion(operador, argumentos.guion)
+        guardar_al_salir(argumentos, operador)
+        sys.exit(codigo)
+    
     print("=" * 60)
     print("    PROGRAMA DE OPERACIONES CON CONJUNTOS Y RELACIONES")
     print("=" * 60)
@@ -20,11 +141,9 @@ def main():
     print("Permite crear conjuntos, relaciones y realizar operaciones entre ellos")
     print()
     
-    # Crear instancia del operador
-    operador = OperadorConjuntos()
-    
     # Ejecutar menú principal
     ejecutar_menu_principal(operador)
+    guardar_al_salir(argumentos, operador)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,122 @@
+"""
+Caché de resultados con desalojo LRU.
+Guarda resultados de operaciones indexados por el nombre de la operación y
+las versiones de sus operandos, con límite de entradas y de elementos.
+"""
+
+import functools
+from collections import OrderedDict
+
+
+class CacheResultados:
+    """Caché LRU con contadores de aciertos y fallos"""
+
+    def __init__(self, capacidad=128, presupuesto_elementos=None):
+        """
+        Args:
+            capacidad (int): Número máximo de resultados guardados
+            presupuesto_elementos (int): Máximo de elementos o pares sumando
+                todos los resultados guardados (None = sin límite)
+        """
+        self.capacidad = capacidad
+        self.presupuesto_elementos = presupuesto_elementos
+        self.entradas = OrderedDict()
+        self.elementos_guardados = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def obtener(self, clave):
+        """
+        Busca un resultado y lo marca como usado recientemente.
+
+        Returns:
+            tuple: (encontrado, valor)
+        """
+        entrada = self.entradas.get(clave)
+        if entrada is None:
+            self.fallos += 1
+            return False, None
+        self.entradas.move_to_end(clave)
+        self.aciertos += 1
+        return True, entrada[0]
+
+    def guardar(self, clave, valor):
+        """Guarda un resultado, desalojando los menos usados si hace falta"""
+        if self.capacidad <= 0:
+            return
+        tamano = tamano_resultado(valor)
+        if self.presupuesto_elementos is not None and tamano > self.presupuesto_elementos:
+            return  # No cabe ni con la caché vacía
+        if clave in self.entradas:
+            self._eliminar(clave)
+        self.entradas[clave] = (valor, tamano)
+        self.elementos_guardados += tamano
+        while (len(self.entradas) > self.capacidad
+               or (self.presupuesto_elementos is not None
+                   and self.elementos_guardados > self.presupuesto_elementos)):
+            self._eliminar(next(iter(self.entradas)))
+            self.desalojos += 1
+
+    def _eliminar(self, clave):
+        _, tamano = self.entradas.pop(clave)
+        self.elementos_guardados -= tamano
+
+    def invalidar(self, predicado):
+        """Elimina todas las entradas cuya clave cumple el predicado"""
+        for clave in [clave for clave in self.entradas if predicado(clave)]:
+            self._eliminar(clave)
+
+    def limpiar(self):
+        """Vacía la caché sin reiniciar los contadores"""
+        self.entradas.clear()
+        self.elementos_guardados = 0
+
+    def estadisticas(self):
+        """Retorna un diccionario con el estado y los contadores de la caché"""
+        consultas = self.aciertos + self.fallos
+        return {
+            'entradas': len(self.entradas),
+            'capacidad': self.capacidad,
+            'elementos_guardados': self.elementos_guardados,
+            'presupuesto_elementos': self.presupuesto_elementos,
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'desalojos': self.desalojos,
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+        }
+
+
+def tamano_resultado(valor):
+    """Tamaño aproximado de un resultado: número de elementos o pares"""
+    try:
+        return max(len(valor), 1)
+    except TypeError:  # Booleanos y otros valores escalares
+        return 1
+
+
+def memorizado(operacion, operandos=1):
+    """
+    Decorador para métodos de OperadorConjuntos cuyo resultado puede guardarse.
+    Los primeros 'operandos' argumentos se identifican por su versión; el resto
+    de argumentos (por ejemplo, el exponente) forma parte de la clave tal cual.
+    Si algún operando no es un conjunto o relación guardado, no se usa la caché.
+    Los resultados memorizados se comparten entre llamadas: no deben mutarse.
+    """
+    def decorador(metodo):
+        @functools.wraps(metodo)
+        def envoltura(self, *args, **kwargs):
+            if kwargs:
+                # Con argumentos por nombre no hay una clave canónica: calcular directamente
+                return metodo(self, *args, **kwargs)
+            clave = self._clave_cache(operacion, args[:operandos], args[operandos:])
+            if clave is None:
+                return metodo(self, *args)
+            encontrado, valor = self.cache.obtener(clave)
+            if encontrado:
+                return valor
+            valor = metodo(self, *args)
+            self.cache.guardar(clave, valor)
+            return valor
+        return envoltura
+    return decorador
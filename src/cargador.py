@@ -0,0 +1,187 @@
+"""
+Carga incremental de conjuntos y relaciones desde archivos grandes.
+El archivo se abre con mmap y se recorre sin copiarlo completo en memoria;
+cada par se entrega a la relación en cuanto se reconoce.
+
+Formatos aceptados para relaciones:
+    'pares'   El mismo formato de la entrada interactiva: (a,b),(c,d),...
+    'lineas'  Un par por línea: "a b", "a,b" o "a<TAB>b"
+Para conjuntos: elementos separados por comas, espacios o saltos de línea.
+"""
+
+import mmap
+import re
+
+from src.relacion import Relacion
+from src.relacion_csr import RelacionCSR
+from src.utilidades import convertir_elemento
+
+
+# Igual que el tokenizador interactivo: exactamente dos componentes por par.
+# Los separadores previos forman parte de la coincidencia, así cada par debe
+# empezar justo donde terminó el anterior
+SEPARADORES_PARES_BYTES = b' \t\r\n{},'
+PATRON_PAR_BYTES = re.compile(rb'[ \t\r\n{},]*\(([^,()]*),([^,()]*)\)')
+
+PATRON_SEPARADOR_LINEA = re.compile(rb'[,\t ]+')
+PATRON_ELEMENTO_BYTES = re.compile(rb'[^,\s{}]+')
+
+
+class ErrorCarga(Exception):
+    """Error de formato al cargar un archivo"""
+
+
+def _abrir_mapa(archivo):
+    """Mapea el archivo en memoria de solo lectura (None si está vacío)"""
+    try:
+        return mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:  # mmap no admite archivos vacíos
+        return None
+
+
+def _decodificar(token):
+    """Convierte un token en bytes al elemento tipado (int, float o str)"""
+    return convertir_elemento(token.decode('utf-8'))
+
+
+def _error_codificacion(donde, error):
+    """ErrorCarga para un token que no es UTF-8 válido"""
+    return ErrorCarga(f"{donde}: el elemento {error.object[:60]!r} no es UTF-8 válido")
+
+
+def _verificar_separador(mapa, inicio, fin):
+    """
+    Verifica que entre dos pares solo haya comas, espacios y llaves.
+
+    Raises:
+        ErrorCarga: Con el byte donde empieza el texto inválido
+    """
+    if inicio == fin:
+        return
+    hueco = mapa[inicio:fin]
+    resto = hueco.lstrip(SEPARADORES_PARES_BYTES)
+    if not resto:
+        return
+    posicion = inicio + len(hueco) - len(resto)
+    fragmento = resto[:60]
+    cierre = fragmento.find(b')')
+    if fragmento.startswith(b'(') and fragmento.count(b',', 0, cierre) > 1:
+        raise ErrorCarga(f"Byte {posicion}: par con más de dos componentes {fragmento[:cierre + 1]!r}")
+    raise ErrorCarga(f"Byte {posicion}: se esperaba un par (a,b), se encontró {fragmento!r}")
+
+
+def detectar_formato(mapa):
+    """Detecta el formato mirando el primer carácter significativo"""
+    coincidencia = re.search(rb'\S', mapa)
+    if coincidencia is None:
+        return 'lineas'
+    return 'pares' if coincidencia.group() in (b'(', b'{') else 'lineas'
+
+
+def iterar_pares_mapa(mapa, formato):
+    """
+    Genera los pares de un archivo mapeado, uno a la vez.
+
+    Args:
+        mapa (mmap.mmap): Archivo mapeado en memoria
+        formato (str): 'pares' o 'lineas'
+    """
+    if formato == 'pares':
+        # re.finditer recorre el mmap directamente, sin copiar el archivo;
+        # solo un hueco con texto inválido se copia para reportarlo
+        fin_anterior = 0
+        for coincidencia in PATRON_PAR_BYTES.finditer(mapa):
+            if coincidencia.start() != fin_anterior:
+                _verificar_separador(mapa, fin_anterior, coincidencia.start())
+            fin_anterior = coincidencia.end()
+            primero = coincidencia.group(1).strip()
+            segundo = coincidencia.group(2).strip()
+            if not primero or not segundo:
+                inicio = coincidencia.start(1) - 1
+                raise ErrorCarga(f"Byte {inicio}: par con un elemento vacío "
+                                 f"{mapa[inicio:fin_anterior][:60]!r}")
+            try:
+                par = (_decodificar(primero), _decodificar(segundo))
+            except UnicodeDecodeError as error:
+                raise _error_codificacion(f"Byte {coincidencia.start(1) - 1}", error) from error
+            yield par
+        _verificar_separador(mapa, fin_anterior, len(mapa))
+        return
+
+    numero = 0
+    for linea in iter(mapa.readline, b''):
+        numero += 1
+        linea = linea.strip()
+        if not linea or linea.startswith(b'#'):
+            continue
+        partes = PATRON_SEPARADOR_LINEA.split(linea)
+        if len(partes) != 2:
+            raise ErrorCarga(f"Línea {numero}: se esperaba un par 'a b', se encontró {linea[:60]!r}")
+        try:
+            par = (_decodificar(partes[0]), _decodificar(partes[1]))
+        except UnicodeDecodeError as error:
+            raise _error_codificacion(f"Línea {numero}", error) from error
+        yield par
+
+
+def iterar_pares_archivo(ruta, formato=None):
+    """
+    Genera los pares de un archivo de relación sin cargarlo completo.
+
+    Args:
+        ruta (str): Ruta del archivo
+        formato (str): 'pares', 'lineas' o None para detectarlo
+    """
+    if formato not in (None, 'pares', 'lineas'):
+        raise ErrorCarga(f"Formato desconocido: {formato}")
+    with open(ruta, 'rb') as archivo:
+        mapa = _abrir_mapa(archivo)
+        if mapa is None:
+            return
+        with mapa:
+            yield from iterar_pares_mapa(mapa, formato or detectar_formato(mapa))
+
+
+def cargar_relacion(ruta, formato=None, compacta=False, tabla=None):
+    """
+    Carga una relación desde un archivo, alimentándola par por par.
+
+    Args:
+        ruta (str): Ruta del archivo
+        formato (str): 'pares', 'lineas' o None para detectarlo
+        compacta (bool): Si es True se construye una RelacionCSR en lugar de
+            una Relacion
+        tabla (TablaElementos): Tabla de elementos para la versión compacta
+
+    Returns:
+        Relacion | RelacionCSR: La relación cargada, construida directamente
+            desde los pares leídos (agregar_relacion la guarda sin copiarla)
+    """
+    pares = iterar_pares_archivo(ruta, formato)
+    if compacta:
+        return RelacionCSR.desde_pares(pares, tabla)
+    return Relacion(pares)
+
+
+def cargar_conjunto(ruta):
+    """
+    Carga un conjunto desde un archivo, elemento por elemento.
+
+    Args:
+        ruta (str): Ruta del archivo
+
+    Returns:
+        set: Conjunto con los elementos del archivo
+    """
+    conjunto = set()
+    with open(ruta, 'rb') as archivo:
+        mapa = _abrir_mapa(archivo)
+        if mapa is None:
+            return conjunto
+        with mapa:
+            for coincidencia in PATRON_ELEMENTO_BYTES.finditer(mapa):
+                try:
+                    conjunto.add(_decodificar(coincidencia.group()))
+                except UnicodeDecodeError as error:
+                    raise _error_codificacion(f"Byte {coincidencia.start()}", error) from error
+    return conjunto
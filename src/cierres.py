@@ -0,0 +1,140 @@
+"""
+Cierres de relaciones.
+Calcula el cierre transitivo R⁺ condensando las componentes fuertemente
+conexas del grafo de la relación y propagando el alcance como máscaras de
+bits en orden topológico inverso.
+"""
+
+from src.indices import indexar_sucesores
+from src.relacion_bits import iterar_bits
+
+
+def componentes_fuertemente_conexas(sucesores):
+    """
+    Algoritmo de Tarjan iterativo (sin recursión, apto para relaciones grandes).
+
+    Args:
+        sucesores (dict): Índice a -> conjunto de sucesores
+
+    Returns:
+        tuple: (componentes, componente_de) donde componentes es una lista de
+               listas de elementos en orden topológico inverso (sumideros
+               primero) y componente_de mapea cada elemento a su componente
+    """
+    indice = {}
+    bajo = {}
+    en_pila = set()
+    pila = []
+    componentes = []
+    componente_de = {}
+    contador = 0
+
+    nodos = set(sucesores)
+    for destinos in sucesores.values():
+        nodos.update(destinos)
+
+    for raiz in nodos:
+        if raiz in indice:
+            continue
+        indice[raiz] = bajo[raiz] = contador
+        contador += 1
+        pila.append(raiz)
+        en_pila.add(raiz)
+        trabajo = [(raiz, iter(sucesores.get(raiz, ())))]
+
+        while trabajo:
+            nodo, hijos = trabajo[-1]
+            avanzo = False
+            for hijo in hijos:
+                if hijo not in indice:
+                    indice[hijo] = bajo[hijo] = contador
+                    contador += 1
+                    pila.append(hijo)
+                    en_pila.add(hijo)
+                    trabajo.append((hijo, iter(sucesores.get(hijo, ()))))
+                    avanzo = True
+                    break
+                if hijo in en_pila and indice[hijo] < bajo[nodo]:
+                    bajo[nodo] = indice[hijo]
+            if avanzo:
+                continue
+
+            trabajo.pop()
+            if trabajo:
+                padre = trabajo[-1][0]
+                if bajo[nodo] < bajo[padre]:
+                    bajo[padre] = bajo[nodo]
+
+            if bajo[nodo] == indice[nodo]:
+                # El nodo es raíz de una componente: extraerla de la pila
+                numero = len(componentes)
+                miembros = []
+                while True:
+                    miembro = pila.pop()
+                    en_pila.discard(miembro)
+                    componente_de[miembro] = numero
+                    miembros.append(miembro)
+                    if miembro == nodo:
+                        break
+                componentes.append(miembros)
+
+    return componentes, componente_de
+
+
+def cierre_transitivo(relacion):
+    """
+    Calcula el cierre transitivo R⁺ (la menor relación transitiva que contiene a R).
+
+    Cada componente fuertemente conexa se reduce a un nodo; como Tarjan las
+    entrega con los sumideros primero, el alcance de cada componente se
+    obtiene con un OR de las máscaras de sus sucesoras ya calculadas.
+
+    Args:
+        relacion (set): Relación R
+
+    Returns:
+        set: Conjunto de pares de R⁺
+    """
+    sucesores = indexar_sucesores(relacion)
+    componentes, componente_de = componentes_fuertemente_conexas(sucesores)
+
+    alcance = [0] * len(componentes)
+    for numero, miembros in enumerate(componentes):
+        mascara = 0
+        for miembro in miembros:
+            for destino in sucesores.get(miembro, ()):
+                otra = componente_de[destino]
+                # Un arco interno implica un ciclo: la componente se alcanza a sí misma
+                mascara |= alcance[otra] | (1 << otra)
+        alcance[numero] = mascara
+
+    cierre = set()
+    for numero, miembros in enumerate(componentes):
+        destinos = [elemento
+                    for otra in iterar_bits(alcance[numero])
+                    for elemento in componentes[otra]]
+        for origen in miembros:
+            cierre.update((origen, destino) for destino in destinos)
+    return cierre
+
+
+def cierre_reflexivo_transitivo(relacion, conjunto=None):
+    """
+    Calcula R* = R⁺ ∪ {(a,a) | a ∈ A}.
+
+    Args:
+        relacion (set): Relación R
+        conjunto (set): Conjunto A sobre el que R* es reflexiva; si es None
+            se usan los elementos que aparecen en R
+
+    Returns:
+        set: Conjunto de pares de R*
+    """
+    cierre = cierre_transitivo(relacion)
+    if conjunto is None:
+        conjunto = set()
+        for par in relacion:
+            if len(par) == 2:
+                conjunto.update(par)
+    cierre.update((elemento, elemento) for elemento in conjunto)
+    return cierre
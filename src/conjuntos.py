@@ -3,35 +3,206 @@ Módulo principal para operaciones con conjuntos y relaciones.
 Contiene la clase OperadorConjuntos con todas las operaciones matemáticas.
 """
 
+from src.indices import indexar_sucesores, componer_indexado, buscar_violacion_transitiva
+from src.relacion import Relacion
+from src.relacion_bits import RelacionBits, TablaElementos
+from src.conjuntos_indexados import ConjuntoBits
+from src.relacion_csr import RelacionCSR
+from src.relacion_mutable import RelacionMutable
+from src.producto_perezoso import ProductoCartesiano
+from src import matriz_numpy
+from src import paralelo
+from src.cierres import cierre_transitivo, cierre_reflexivo_transitivo
+from src import particiones
+from src import ordenes
+from src import testigos
+from src.perfil import perfil_relacion
+from src.cache import CacheResultados, memorizado
+from src.potencias import potencia_detectando_ciclo
+
+
+# Número máximo de ciclos de potencias (dos enteros cada uno) recordados por el operador
+MAXIMO_CICLOS_GUARDADOS = 16
+
 
 class OperadorConjuntos:
     """Clase para manejar operaciones con conjuntos y relaciones"""
     
-    def __init__(self):
-        """Inicializa el operador con conjuntos y relaciones vacíos"""
+    def __init__(self, modo_indexado=False, capacidad_cache=128, presupuesto_cache=None,
+                 trabajadores=1):
+        """
+        Inicializa el operador con conjuntos y relaciones vacíos.
+        
+        Args:
+            modo_indexado (bool): Si es True, los conjuntos se guardan como
+                máscaras de bits sobre un universo indexado (ConjuntoBits)
+            capacidad_cache (int): Máximo de resultados memorizados (0 la desactiva)
+            presupuesto_cache (int): Máximo de elementos/pares sumando todos los
+                resultados memorizados (None = sin límite)
+            trabajadores (int): Procesos para composición, potencia y
+                transitividad de relaciones grandes (1 = sin paralelismo,
+                0 o None = todos los núcleos)
+        """
         self.conjuntos = {}
         self.relaciones = {}
+        self.modo_indexado = modo_indexado
+        self.trabajadores = trabajadores
+        self.tabla_elementos = TablaElementos() if modo_indexado else None
+        self.cache = CacheResultados(capacidad_cache, presupuesto_cache)
+        self._versiones = {}
+        self._contador_versiones = 0
+        self._operandos_guardados = {}
+        self._ciclos_potencias = {}
+        self.perfilador = None  # Ver src/perfilado.py
         self.cargar_ejemplos_iniciales()
     
     def cargar_ejemplos_iniciales(self):
         """Carga los conjuntos y relaciones de ejemplo del enunciado"""
-        self.conjuntos['U'] = {'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 1, 2, 3, 4, 5}
-        self.conjuntos['A'] = {1, 'a', 'b'}
-        self.conjuntos['C'] = {1, 2, 3}
-        self.conjuntos['B'] = {'a', 'b', 'c'}
+        self.agregar_conjunto('U', {'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 1, 2, 3, 4, 5})
+        self.agregar_conjunto('A', {1, 'a', 'b'})
+        self.agregar_conjunto('C', {1, 2, 3})
+        self.agregar_conjunto('B', {'a', 'b', 'c'})
         
-        self.relaciones['E'] = {(1, 'a'), (2, 'b'), (3, 'c')}
-        self.relaciones['R'] = {(1, 1), ('a', 'a'), ('b', 'b'), (1, 'a'), ('a', 1), 
-                               ('a', 'b'), ('b', 'a'), (1, 'b'), ('b', 1)}
+        self.agregar_relacion('E', {(1, 'a'), (2, 'b'), (3, 'c')})
+        self.agregar_relacion('R', {(1, 1), ('a', 'a'), ('b', 'b'), (1, 'a'), ('a', 1), 
+                                    ('a', 'b'), ('b', 'a'), (1, 'b'), ('b', 1)})
     
     def agregar_conjunto(self, nombre, conjunto):
         """Agrega un nuevo conjunto al diccionario"""
+        if self.modo_indexado:
+            conjunto = ConjuntoBits.desde_conjunto(conjunto, self.tabla_elementos)
+        self._registrar_version('conjunto', nombre, conjunto)
         self.conjuntos[nombre] = conjunto
     
     def agregar_relacion(self, nombre, relacion):
-        """Agrega una nueva relación al diccionario"""
+        """
+        Agrega una nueva relación al diccionario. Los sets de pares se guardan
+        como Relacion inmutable, que conserva sus índices entre operaciones;
+        las representaciones especiales (CSR, bits, mutable, vistas perezosas)
+        se guardan tal cual.
+        """
+        if isinstance(relacion, (set, frozenset)):
+            relacion = Relacion.desde(relacion)
+        self._registrar_version('relacion', nombre, relacion)
         self.relaciones[nombre] = relacion
     
+    # === VERSIONES Y CACHÉ DE RESULTADOS ===
+    
+    def _registrar_version(self, tipo, nombre, valor):
+        """
+        Asigna una versión nueva al nombre y descarta los resultados memorizados
+        que dependían de la versión anterior.
+        """
+        guardados = self.conjuntos if tipo == 'conjunto' else self.relaciones
+        anterior = guardados.get(nombre)
+        if anterior is not None:
+            self._operandos_guardados.pop(id(anterior), None)
+            self.cache.invalidar(
+                lambda clave: any(parte is not None and parte[:2] == (tipo, nombre)
+                                  for parte in clave[1])
+            )
+        self._contador_versiones += 1
+        self._versiones[(tipo, nombre)] = self._contador_versiones
+        self._operandos_guardados[id(valor)] = (tipo, nombre)
+    
+    def _version_de(self, valor):
+        """
+        Identifica un operando guardado. Las relaciones mutables agregan su
+        contador de modificaciones, así un par agregado o eliminado en el
+        lugar nunca reutiliza un resultado anterior.
+        
+        Returns:
+            tuple: (tipo, nombre, versión), o None si el valor no está guardado
+        """
+        entrada = self._operandos_guardados.get(id(valor))
+        if entrada is None:
+            return None
+        tipo, nombre = entrada
+        guardados = self.conjuntos if tipo == 'conjunto' else self.relaciones
+        if guardados.get(nombre) is not valor:
+            return None
+        if isinstance(valor, RelacionMutable):
+            return (tipo, nombre, self._versiones[entrada], valor.modificaciones)
+        return (tipo, nombre, self._versiones[entrada])
+    
+    def _clave_cache(self, operacion, operandos, parametros):
+        """Clave de caché de una operación, o None si no puede memorizarse"""
+        versiones = []
+        for operando in operandos:
+            if operando is None:
+                versiones.append(None)
+                continue
+            version = self._version_de(operando)
+            if version is None:
+                return None
+            versiones.append(version)
+        try:
+            hash(parametros)
+        except TypeError:
+            return None
+        return (operacion, tuple(versiones), parametros)
+    
+    def estadisticas_cache(self):
+        """Retorna los contadores de aciertos, fallos y ocupación de la caché"""
+        return self.cache.estadisticas()
+    
+    def vaciar(self):
+        """
+        Elimina todos los conjuntos y relaciones junto con los resultados
+        memorizados. Las versiones siguen creciendo, por lo que ninguna clave
+        antigua puede volver a coincidir.
+        """
+        self.conjuntos.clear()
+        self.relaciones.clear()
+        self._operandos_guardados.clear()
+        self._ciclos_potencias.clear()
+        self.cache.limpiar()
+        if self.modo_indexado:
+            self.tabla_elementos = TablaElementos()
+    
+    def compactar_relacion(self, nombre):
+        """
+        Reemplaza una relación guardada por su versión compacta RelacionCSR.
+        Todas las relaciones compactadas comparten la misma tabla de elementos.
+        
+        Returns:
+            RelacionCSR: La relación compactada, o None si no existe
+        """
+        relacion = self.relaciones.get(nombre)
+        if relacion is None:
+            return None
+        if not isinstance(relacion, RelacionCSR):
+            relacion = RelacionCSR.desde_pares(relacion, self.tabla_compartida())
+            self.agregar_relacion(nombre, relacion)
+        return relacion
+    
+    def hacer_mutable(self, nombre):
+        """
+        Reemplaza una relación guardada por una RelacionMutable, que admite
+        agregar_par/eliminar_par y mantiene sus propiedades incrementalmente.
+        La reflexividad se vigila sobre el conjunto U.
+        
+        Returns:
+            RelacionMutable: La relación mutable, o None si no existe
+        """
+        relacion = self.relaciones.get(nombre)
+        if relacion is None:
+            return None
+        if not isinstance(relacion, RelacionMutable):
+            relacion = RelacionMutable(relacion, self.conjuntos.get('U', ()))
+            self.agregar_relacion(nombre, relacion)
+        return relacion
+    
+    def tabla_compartida(self):
+        """
+        Retorna la tabla de elementos del operador, creándola si hace falta.
+        Las relaciones compactas (RelacionCSR) que se construyan fuera del
+        operador deben usarla para poder combinarse con las guardadas.
+        """
+        if self.tabla_elementos is None:
+            self.tabla_elementos = TablaElementos(self.conjuntos.get('U', ()))
+        return self.tabla_elementos
+    
     def obtener_conjunto(self, nombre):
         """Obtiene un conjunto por nombre"""
         return self.conjuntos.get(nombre)
@@ -66,33 +237,42 @@ class OperadorConjuntos:
         """Calcula el complemento de un conjunto respecto al universo (A^c)"""
         if universo is None:
             universo = self.conjuntos.get('U', set())
+        if isinstance(conjunto, ConjuntoBits):
+            # Un solo XOR contra la máscara del universo
+            return conjunto.complemento(universo)
         return universo.difference(conjunto)
     
     def producto_cartesiano(self, conjunto1, conjunto2):
-        """Calcula el producto cartesiano de dos conjuntos (A × B)"""
-        producto = set()
-        for elemento1 in conjunto1:
-            for elemento2 in conjunto2:
-                producto.add((elemento1, elemento2))
-        return producto
+        """
+        Calcula el producto cartesiano de dos conjuntos (A × B).
+        Retorna una vista perezosa: la pertenencia y el tamaño cuestan O(1)
+        y los pares solo se generan al recorrerla.
+        """
+        return ProductoCartesiano(conjunto1, conjunto2)
     
     # === PROPIEDADES DE RELACIONES ===
     
+    @memorizado('ref', operandos=2)
     def es_reflexiva(self, relacion, conjunto):
         """
         Verifica si una relación es reflexiva en un conjunto dado.
         Una relación R es reflexiva si para todo a ∈ A, (a,a) ∈ R
         """
+        if isinstance(relacion, (RelacionBits, RelacionMutable)):
+            return relacion.es_reflexiva(conjunto)
         for elemento in conjunto:
             if (elemento, elemento) not in relacion:
                 return False
         return True
     
+    @memorizado('sim', operandos=1)
     def es_simetrica(self, relacion):
         """
         Verifica si una relación es simétrica.
         Una relación R es simétrica si para todo (a,b) ∈ R, entonces (b,a) ∈ R
         """
+        if isinstance(relacion, (RelacionBits, RelacionMutable)):
+            return relacion.es_simetrica()
         for par in relacion:
             if len(par) == 2:  # Verificar que sea un par ordenado
                 elemento1, elemento2 = par
@@ -105,51 +285,232 @@ class OperadorConjuntos:
         Verifica si una relación es transitiva.
         Una relación R es transitiva si para todo (a,b) ∈ R y (b,c) ∈ R, entonces (a,c) ∈ R
         """
-        for par1 in relacion:
-            for par2 in relacion:
-                if len(par1) == 2 and len(par2) == 2:
-                    # Si el segundo elemento de par1 es igual al primer elemento de par2
-                    if par1[1] == par2[0]:
-                        # Entonces debe existir el par (par1[0], par2[1])
-                        if (par1[0], par2[1]) not in relacion:
-                            return False
-        return True
+        return self.contraejemplo_transitividad(relacion) is None
+    
+    @memorizado('tra', operandos=1)
+    def contraejemplo_transitividad(self, relacion):
+        """
+        Busca un contraejemplo de transitividad usando el mapa de sucesores.
+        Se detiene en la primera terna (a,b,c) con (a,b),(b,c) ∈ R y (a,c) ∉ R.
+        
+        Returns:
+            tuple: (a, b, c) que viola la transitividad, o None si R es transitiva
+        """
+        if isinstance(relacion, (RelacionBits, RelacionMutable)):
+            return relacion.contraejemplo_transitividad()
+        if matriz_numpy.es_densa(relacion):
+            return matriz_numpy.contraejemplo_transitividad(relacion)
+        if self._en_paralelo(relacion):
+            return paralelo.contraejemplo_transitividad(relacion, self.trabajadores)
+        return buscar_violacion_transitiva(indexar_sucesores(relacion))
+    
+    def es_antisimetrica(self, relacion):
+        """
+        Verifica si una relación es antisimétrica.
+        Una relación R es antisimétrica si (a,b) ∈ R y (b,a) ∈ R implican a = b
+        """
+        return self.contraejemplo_antisimetria(relacion) is None
+    
+    @memorizado('antisim', operandos=1)
+    def contraejemplo_antisimetria(self, relacion):
+        """
+        Busca un par (a,b) con a ≠ b tal que (a,b) ∈ R y (b,a) ∈ R.
+        
+        Returns:
+            tuple: (a, b) que viola la antisimetría, o None si R es antisimétrica
+        """
+        return ordenes.contraejemplo_antisimetria(relacion)
+    
+    def es_orden_parcial(self, relacion, conjunto):
+        """Verifica si R es reflexiva en A, antisimétrica y transitiva"""
+        return (self.es_reflexiva(relacion, conjunto)
+                and self.es_antisimetrica(relacion)
+                and self.es_transitiva(relacion))
+    
+    @memorizado('perfil', operandos=2)
+    def perfil_relacion(self, relacion, conjunto):
+        """
+        Evalúa en una sola pasada si R es reflexiva en A, irreflexiva,
+        simétrica, antisimétrica, transitiva, funcional, inyectiva, total y
+        sobreyectiva en A, con el primer contraejemplo de cada propiedad.
+        
+        Returns:
+            dict: propiedad -> {'cumple': bool, 'contraejemplo': tuple o None}
+                  (ver src/perfil.py)
+        """
+        return perfil_relacion(relacion, conjunto)
     
     # === OPERACIONES AVANZADAS DE RELACIONES ===
     
+    @memorizado('potencia', operandos=1)
     def potencia_relacion(self, relacion, n):
         """
         Calcula la potencia n de una relación (R^n).
         R^n = R ∘ R ∘ ... ∘ R (n veces)
+        
+        Se usan cuadrados sucesivos, O(log n) composiciones. Las potencias de
+        una relación finita terminan siendo periódicas: si dos de los cuadrados
+        calculados coinciden, el ciclo (solo su inicio y periodo) se recuerda
+        para la relación guardada y los exponentes siguientes se reducen al
+        menor equivalente, cuyo resultado queda en la caché de resultados. Las relaciones densas se delegan al backend NumPy cuando
+        está instalado.
         """
+        version = self._version_de(relacion)
+        ciclo = self._ciclos_potencias.get(version) if version is not None else None
+        if ciclo is not None and ciclo.reducir(n) != n:
+            # Exponentes equivalentes comparten la entrada memorizada
+            return self.potencia_relacion(relacion, ciclo.reducir(n))
         if n == 1:
             return relacion.copy()
         
-        resultado = relacion.copy()
-        for _ in range(n - 1):
-            resultado = self.composicion_relaciones(resultado, relacion)
+        if matriz_numpy.es_densa(relacion):
+            return matriz_numpy.potencia(relacion, n)
+        if self._en_paralelo(relacion):
+            return paralelo.potencia(relacion, n, self.trabajadores)
+        resultado, ciclo_nuevo = potencia_detectando_ciclo(relacion, n)
+        if ciclo is None and ciclo_nuevo is not None and version is not None:
+            self._guardar_ciclo_potencias(version, ciclo_nuevo)
         return resultado
     
+    def _en_paralelo(self, relacion):
+        """Indica si la relación debe procesarse con varios procesos"""
+        return self.trabajadores != 1 and paralelo.conviene(relacion, self.trabajadores)
+    
+    def _guardar_ciclo_potencias(self, clave, ciclo):
+        """Recuerda el ciclo de potencias de una relación, descartando el más antiguo"""
+        if len(self._ciclos_potencias) >= MAXIMO_CICLOS_GUARDADOS:
+            del self._ciclos_potencias[next(iter(self._ciclos_potencias))]
+        self._ciclos_potencias[clave] = ciclo
+    
+    @memorizado('composicion', operandos=2)
     def composicion_relaciones(self, relacion1, relacion2):
         """
         Calcula la composición de dos relaciones (R₁ ∘ R₂).
         (a,c) ∈ R₁ ∘ R₂ si existe b tal que (a,b) ∈ R₁ y (b,c) ∈ R₂
         """
-        composicion = set()
-        for par1 in relacion1:
-            for par2 in relacion2:
-                if len(par1) == 2 and len(par2) == 2:
-                    # Si el segundo elemento de par1 es igual al primer elemento de par2
-                    if par1[1] == par2[0]:
-                        composicion.add((par1[0], par2[1]))
-        return composicion
+        if isinstance(relacion1, RelacionBits) and isinstance(relacion2, RelacionBits):
+            return relacion1.componer(relacion2)
+        if matriz_numpy.es_densa(relacion1, relacion2):
+            return matriz_numpy.componer(relacion1, relacion2)
+        if self._en_paralelo(relacion1):
+            return paralelo.componer(relacion1, relacion2, self.trabajadores)
+        # Hash-join: indexar R₂ por su primer componente y sondear con R₁
+        return componer_indexado(relacion1, indexar_sucesores(relacion2))
+    
+    @memorizado('composicion_testigos', operandos=2)
+    def composicion_con_testigos(self, relacion1, relacion2, todos=False):
+        """
+        Calcula R₁ ∘ R₂ guardando, para cada par (a,c), el elemento b que lo
+        produjo. El resultado se usa como relación y además responde
+        testigo(a, c) y explicar(a, c) en O(1).
+        
+        Args:
+            todos (bool): Guardar todos los testigos de cada par, no solo uno
+        """
+        return testigos.componer_con_testigos(relacion1, relacion2, todos)
+    
+    @memorizado('potencia_caminos', operandos=1)
+    def potencia_con_caminos(self, relacion, n):
+        """
+        Calcula R^n guardando los testigos de cada composición, de modo que
+        camino(a, c) reconstruye un camino de n pasos sin recalcular nada.
+        """
+        return testigos.PotenciaConCaminos(relacion, n)
+    
+    @memorizado('violaciones_tra', operandos=1)
+    def violaciones_transitividad(self, relacion):
+        """
+        Retorna todos los pares de R∘R que faltan en R, con su testigo.
+        explicar(a, c) da la terna (a,b,c) en el formato de
+        contraejemplo_transitividad. Vacío si R es transitiva.
+        """
+        return testigos.violaciones_transitividad(relacion)
+    
+    @memorizado('cierre', operandos=1)
+    def cierre_transitivo(self, relacion):
+        """
+        Calcula el cierre transitivo R⁺ = R ∪ R² ∪ R³ ∪ ...
+        Usa condensación de componentes fuertemente conexas en lugar de
+        unir potencias sucesivas.
+        """
+        return cierre_transitivo(relacion)
+    
+    @memorizado('cierre_reflexivo', operandos=2)
+    def cierre_reflexivo_transitivo(self, relacion, conjunto=None):
+        """
+        Calcula el cierre reflexivo-transitivo R* = R⁺ ∪ {(a,a) | a ∈ A}.
+        Si no se indica el conjunto A se usan los elementos que aparecen en R;
+        si se indica, solo se agregan los lazos de A.
+        """
+        return cierre_reflexivo_transitivo(relacion, conjunto)
+    
+    @memorizado('clases', operandos=2)
+    def clases_equivalencia(self, relacion, conjunto=None):
+        """
+        Calcula el conjunto cociente A/R con union-find.
+        Si R no es de equivalencia se obtienen las clases de su cierre de
+        equivalencia; conviene verificarlo antes con es_equivalencia. Si se
+        indica A, las clases contienen solo elementos de A.
+        
+        Returns:
+            tuple: (clases, representantes): lista de clases (frozensets) y
+                   diccionario elemento -> representante canónico de su clase
+        """
+        return particiones.clases_equivalencia(relacion, conjunto)
+    
+    @memorizado('cierre_equivalencia', operandos=2)
+    def cierre_equivalencia(self, relacion, conjunto=None):
+        """
+        Calcula la menor relación de equivalencia que contiene a R,
+        reflexiva en A (o en los elementos de R si no se indica A).
+        """
+        return particiones.cierre_equivalencia(relacion, conjunto or ())
+    
+    def es_equivalencia(self, relacion, conjunto):
+        """Verifica si R es reflexiva en A, simétrica y transitiva"""
+        return (self.es_reflexiva(relacion, conjunto)
+                and self.es_simetrica(relacion)
+                and self.es_transitiva(relacion))
+    
+    @memorizado('topologico', operandos=2)
+    def orden_topologico(self, relacion, conjunto=None):
+        """
+        Ordena los elementos de A y de R de modo que (a,b) ∈ R, a ≠ b,
+        implique que a aparece antes que b.
+        
+        Returns:
+            list: Elementos en orden topológico, o None si R tiene un ciclo
+        """
+        return ordenes.orden_topologico(relacion, conjunto or ())
+    
+    @memorizado('hasse', operandos=1)
+    def reduccion_transitiva(self, relacion):
+        """
+        Calcula la reducción transitiva de R (sin lazos). Para un orden
+        parcial son las aristas del diagrama de Hasse.
+        
+        Returns:
+            set: Pares de la reducción, o None si R tiene un ciclo
+        """
+        return ordenes.reduccion_transitiva(relacion)
+    
+    def convertir_a_bits(self, relacion, universo=None):
+        """
+        Convierte una relación de tuplas a RelacionBits internando el universo.
+        Por defecto se usa el conjunto U como tabla de elementos.
+        """
+        if universo is None:
+            universo = self.conjuntos.get('U', set())
+        return RelacionBits.desde_pares(relacion, universo)
     
     # === OPERACIONES ESPECIALES ===
     
+    @memorizado('bin', operandos=3)
     def operacion_bin(self, relacion_E, conjunto_C, conjunto_B):
         """
         Operación bin(E,C,B): calcula (C × B) ∩ E
         Producto cartesiano de C×B intersectado con la relación E
         """
-        producto_CB = self.producto_cartesiano(conjunto_C, conjunto_B)
+        # Filtrar E contra la vista perezosa: O(|E|) sin construir C×B
+        producto_CB = ProductoCartesiano(conjunto_C, conjunto_B, copiar=False)
         return producto_CB.intersection(relacion_E)
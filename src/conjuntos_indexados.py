@@ -0,0 +1,109 @@
+"""
+Conjuntos representados como máscaras de bits sobre un universo indexado.
+Cada elemento se interna en una TablaElementos compartida; la unión, la
+intersección, la diferencia y el complemento se reducen a una operación
+de bits entre enteros.
+"""
+
+from collections.abc import Set
+
+from src.relacion_bits import iterar_bits, contar_bits
+
+
+class ConjuntoBits(Set):
+    """
+    Conjunto inmutable almacenado como máscara de bits sobre una tabla de elementos.
+    Se comporta como un conjunto normal al iterarlo, por lo que las funciones
+    de visualización lo convierten a elementos solo al mostrarlo.
+    """
+
+    def __init__(self, tabla, mascara=0):
+        """
+        Args:
+            tabla (TablaElementos): Tabla de internado compartida
+            mascara (int): Bits encendidos = elementos presentes
+        """
+        self.tabla = tabla
+        self.mascara = mascara
+
+    @classmethod
+    def desde_conjunto(cls, conjunto, tabla):
+        """Interna los elementos del conjunto en la tabla y construye su máscara"""
+        if isinstance(conjunto, ConjuntoBits) and conjunto.tabla is tabla:
+            return conjunto
+        mascara = 0
+        for elemento in conjunto:
+            mascara |= 1 << tabla.internar(elemento)
+        return cls(tabla, mascara)
+
+    def _from_iterable(self, iterable):
+        return ConjuntoBits.desde_conjunto(iterable, self.tabla)
+
+    def _mascara_de(self, otro):
+        """Máscara de otro conjunto sobre la misma tabla (internando si hace falta)"""
+        if isinstance(otro, ConjuntoBits) and otro.tabla is self.tabla:
+            return otro.mascara
+        return ConjuntoBits.desde_conjunto(otro, self.tabla).mascara
+
+    def _mascara_conocida(self, otro):
+        """
+        Máscara de otro conjunto sin internar nada: los elementos que no están
+        en la tabla no pueden estar en este conjunto y se ignoran.
+        """
+        if isinstance(otro, ConjuntoBits) and otro.tabla is self.tabla:
+            return otro.mascara
+        return self.tabla.mascara(otro)
+
+    # === PROTOCOLO DE CONJUNTO ===
+
+    def __contains__(self, elemento):
+        try:
+            indice = self.tabla.indices.get(elemento)
+        except TypeError:  # Elemento no hashable
+            return False
+        return indice is not None and bool(self.mascara >> indice & 1)
+
+    def __iter__(self):
+        elementos = self.tabla.elementos
+        for indice in iterar_bits(self.mascara):
+            yield elementos[indice]
+
+    def __len__(self):
+        return contar_bits(self.mascara)
+
+    def __repr__(self):
+        return f"ConjuntoBits({set(self)!r})"
+
+    __hash__ = Set._hash
+
+    # === OPERACIONES COMO OPERACIONES DE BITS ===
+
+    def union(self, otro):
+        """A ∪ B como OR de máscaras"""
+        return ConjuntoBits(self.tabla, self.mascara | self._mascara_de(otro))
+
+    def intersection(self, otro):
+        """A ∩ B como AND de máscaras"""
+        return ConjuntoBits(self.tabla, self.mascara & self._mascara_conocida(otro))
+
+    def difference(self, otro):
+        """A - B como AND con la negación de B"""
+        return ConjuntoBits(self.tabla, self.mascara & ~self._mascara_conocida(otro))
+
+    def complemento(self, universo):
+        """A^c como XOR con la máscara del universo (ignorando lo que está fuera de U)"""
+        mascara_universo = self._mascara_de(universo)
+        return ConjuntoBits(self.tabla, mascara_universo ^ (self.mascara & mascara_universo))
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def copy(self):
+        """El conjunto es inmutable, por lo que puede compartirse"""
+        return self
+
+    def a_conjunto(self):
+        """Convierte a un set normal de Python"""
+        return set(self)
+
@@ -0,0 +1,260 @@
+"""
+Formato binario persistente para el espacio de trabajo completo.
+Guarda todos los conjuntos y relaciones de un OperadorConjuntos en un
+archivo con una tabla de elementos internados y arreglos de pares
+empaquetados. Al cargarlo, las relaciones se abren directamente sobre el
+archivo mapeado con mmap (formato CSR), sin volver a analizar texto.
+
+Estructura del archivo:
+    MAGIA (8 bytes) | longitud del encabezado (8 bytes) | encabezado JSON |
+    secciones binarias alineadas a 8 bytes
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from src.relacion_bits import TablaElementos
+from src.relacion_csr import RelacionCSR
+
+
+MAGIA = b'RELCONJ1'
+VERSION_FORMATO = 1
+ALINEACION = 8
+
+# Tipos de elemento en la tabla
+TIPO_ENTERO = 0
+TIPO_REAL = 1
+TIPO_TEXTO = 2
+TIPO_ENTERO_GRANDE = 3  # Enteros que no caben en 64 bits, guardados como texto
+
+LIMITE_INT64 = 2 ** 63
+
+
+class ErrorEspacioTrabajo(Exception):
+    """Archivo de espacio de trabajo inválido o incompatible"""
+
+
+# === ESCRITURA ===
+
+class _Escritor:
+    """Acumula secciones binarias alineadas y registra su ubicación"""
+
+    def __init__(self):
+        self.secciones = []
+        self.tamano = 0
+
+    def agregar(self, datos):
+        """Agrega una sección y retorna su descripción (desplazamiento relativo, bytes)"""
+        datos = bytes(datos)
+        relleno = -self.tamano % ALINEACION
+        if relleno:
+            self.secciones.append(b'\0' * relleno)
+            self.tamano += relleno
+        descripcion = {'inicio': self.tamano, 'bytes': len(datos)}
+        self.secciones.append(datos)
+        self.tamano += len(datos)
+        return descripcion
+
+    def agregar_array(self, arreglo):
+        """Agrega un array y retorna su descripción incluyendo el código de tipo"""
+        descripcion = self.agregar(arreglo.tobytes())
+        descripcion['tipo'] = arreglo.typecode
+        descripcion['itemsize'] = arreglo.itemsize
+        return descripcion
+
+
+def _codificar_tabla(tabla, escritor):
+    """Codifica la tabla de elementos en columnas tipo/valor y un bloque de textos"""
+    elementos = tabla.elementos
+    if all(type(elemento) is int and -LIMITE_INT64 <= elemento < LIMITE_INT64
+           for elemento in elementos):
+        # Caso frecuente en relaciones grandes: todos los elementos son enteros
+        return {'solo_enteros': True, 'valores': escritor.agregar_array(array('q', elementos))}
+
+    tipos = array('B')
+    valores = array('q')
+    textos = bytearray()
+    for elemento in elementos:
+        if isinstance(elemento, int) and -LIMITE_INT64 <= elemento < LIMITE_INT64:
+            tipos.append(TIPO_ENTERO)
+            valores.append(int(elemento))
+        elif isinstance(elemento, float):
+            tipos.append(TIPO_REAL)
+            valores.append(struct.unpack('<q', struct.pack('<d', elemento))[0])
+        else:
+            if isinstance(elemento, int):
+                tipos.append(TIPO_ENTERO_GRANDE)
+                codificado = str(elemento).encode('utf-8')
+            elif isinstance(elemento, str):
+                tipos.append(TIPO_TEXTO)
+                codificado = elemento.encode('utf-8')
+            else:
+                raise ErrorEspacioTrabajo(f"Tipo de elemento no soportado: {type(elemento).__name__}")
+            valores.append(len(textos))
+            textos += struct.pack('<I', len(codificado))
+            textos += codificado
+    return {
+        'solo_enteros': False,
+        'tipos': escritor.agregar_array(tipos),
+        'valores': escritor.agregar_array(valores),
+        'textos': escritor.agregar(textos),
+    }
+
+
+def guardar_espacio_trabajo(operador, ruta):
+    """
+    Guarda todos los conjuntos y relaciones del operador en un archivo binario.
+
+    Args:
+        operador: Instancia de OperadorConjuntos
+        ruta (str): Ruta del archivo de destino
+    """
+    tabla = TablaElementos()
+    escritor = _Escritor()
+
+    conjuntos = {}
+    for nombre, conjunto in operador.conjuntos.items():
+        indices = array('q', (tabla.internar(elemento) for elemento in conjunto))
+        conjuntos[nombre] = escritor.agregar_array(indices)
+
+    # Todas las relaciones se reescriben en CSR sobre la misma tabla
+    csr = {}
+    for nombre, relacion in operador.relaciones.items():
+        if isinstance(relacion, RelacionCSR) and relacion.tabla is tabla:
+            csr[nombre] = relacion
+        else:
+            csr[nombre] = RelacionCSR.desde_pares(relacion, tabla)
+
+    relaciones = {}
+    for nombre, relacion in csr.items():
+        # Las filas deben cubrir toda la tabla final para poder indexarlas
+        desplazamientos = array(relacion.desplazamientos.typecode, relacion.desplazamientos)
+        faltantes = len(tabla) + 1 - len(desplazamientos)
+        if faltantes > 0:
+            desplazamientos.extend([desplazamientos[-1]] * faltantes)
+        relaciones[nombre] = {
+            'desplazamientos': escritor.agregar_array(desplazamientos),
+            'destinos': escritor.agregar_array(array(relacion.destinos.typecode, relacion.destinos)),
+        }
+
+    encabezado = {
+        'version': VERSION_FORMATO,
+        'orden_bytes': sys.byteorder,
+        'elementos': len(tabla),
+        'tabla': _codificar_tabla(tabla, escritor),
+        'conjuntos': conjuntos,
+        'relaciones': relaciones,
+    }
+    encabezado_bytes = json.dumps(encabezado, ensure_ascii=False).encode('utf-8')
+    inicio_datos = len(MAGIA) + 8 + len(encabezado_bytes)
+    relleno_encabezado = -inicio_datos % ALINEACION
+
+    # Se escribe en un archivo temporal y se reemplaza al final: si 'ruta' es el
+    # archivo actualmente mapeado, las relaciones cargadas siguen siendo válidas
+    temporal = f"{ruta}.tmp"
+    try:
+        with open(temporal, 'wb') as archivo:
+            archivo.write(MAGIA)
+            archivo.write(struct.pack('<Q', len(encabezado_bytes) + relleno_encabezado))
+            archivo.write(encabezado_bytes)
+            archivo.write(b' ' * relleno_encabezado)  # Espacios: el JSON sigue siendo válido
+            for seccion in escritor.secciones:
+                archivo.write(seccion)
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+
+
+# === LECTURA ===
+
+def _vista(mapa, base, descripcion, orden_bytes):
+    """
+    Retorna la sección como memoryview tipado sobre el mmap (sin copiar).
+    Si el archivo se escribió con otro orden de bytes se retorna una copia corregida.
+    """
+    inicio = base + descripcion['inicio']
+    crudo = memoryview(mapa)[inicio:inicio + descripcion['bytes']]
+    tipo = descripcion.get('tipo', 'B')
+    if array(tipo).itemsize != descripcion.get('itemsize', 1) or orden_bytes != sys.byteorder:
+        arreglo = array(tipo)
+        arreglo.frombytes(crudo)
+        if orden_bytes != sys.byteorder:
+            arreglo.byteswap()
+        return arreglo
+    return crudo.cast(tipo)
+
+
+def _decodificar_tabla(mapa, base, descripcion, orden_bytes):
+    """Reconstruye la lista de elementos de la tabla"""
+    valores = _vista(mapa, base, descripcion['valores'], orden_bytes)
+    if descripcion['solo_enteros']:
+        return valores.tolist()
+
+    tipos = _vista(mapa, base, descripcion['tipos'], orden_bytes)
+    inicio_textos = base + descripcion['textos']['inicio']
+    elementos = []
+    for tipo, valor in zip(tipos.tolist(), valores.tolist()):
+        if tipo == TIPO_ENTERO:
+            elementos.append(valor)
+        elif tipo == TIPO_REAL:
+            elementos.append(struct.unpack('<d', struct.pack('<q', valor))[0])
+        else:
+            posicion = inicio_textos + valor
+            longitud = struct.unpack_from('<I', mapa, posicion)[0]
+            texto = mapa[posicion + 4:posicion + 4 + longitud].decode('utf-8')
+            elementos.append(int(texto) if tipo == TIPO_ENTERO_GRANDE else texto)
+    return elementos
+
+
+def cargar_espacio_trabajo(operador, ruta):
+    """
+    Reemplaza el contenido del operador con el espacio de trabajo guardado.
+    Las relaciones quedan como RelacionCSR apoyadas directamente en el archivo
+    mapeado en memoria; solo la tabla de elementos y los conjuntos se decodifican.
+
+    Args:
+        operador: Instancia de OperadorConjuntos
+        ruta (str): Ruta del archivo
+
+    Raises:
+        ErrorEspacioTrabajo: Si el archivo no tiene el formato esperado
+    """
+    with open(ruta, 'rb') as archivo:
+        try:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as error:
+            raise ErrorEspacioTrabajo("El archivo está vacío") from error
+
+    if mapa[:len(MAGIA)] != MAGIA:
+        raise ErrorEspacioTrabajo("El archivo no es un espacio de trabajo válido")
+    longitud_encabezado = struct.unpack_from('<Q', mapa, len(MAGIA))[0]
+    base = len(MAGIA) + 8 + longitud_encabezado
+    encabezado = json.loads(mapa[len(MAGIA) + 8:base].decode('utf-8'))
+    if encabezado.get('version') != VERSION_FORMATO:
+        raise ErrorEspacioTrabajo(f"Versión de formato no soportada: {encabezado.get('version')}")
+    orden_bytes = encabezado['orden_bytes']
+
+    tabla = TablaElementos()
+    tabla.elementos = _decodificar_tabla(mapa, base, encabezado['tabla'], orden_bytes)
+    tabla.indices = {elemento: indice for indice, elemento in enumerate(tabla.elementos)}
+
+    operador.vaciar()
+    operador.tabla_elementos = tabla
+    elementos = tabla.elementos
+    for nombre, descripcion in encabezado['conjuntos'].items():
+        indices = _vista(mapa, base, descripcion, orden_bytes)
+        operador.agregar_conjunto(nombre, {elementos[indice] for indice in indices.tolist()})
+    for nombre, descripcion in encabezado['relaciones'].items():
+        relacion = RelacionCSR(
+            tabla,
+            _vista(mapa, base, descripcion['desplazamientos'], orden_bytes),
+            _vista(mapa, base, descripcion['destinos'], orden_bytes),
+        )
+        operador.agregar_relacion(nombre, relacion)
+    return operador
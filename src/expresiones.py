@@ -0,0 +1,467 @@
+"""
+Lenguaje de expresiones para el álgebra de conjuntos y relaciones.
+Analiza expresiones como ((A ∪ B) × C) ∩ E, (R∘E)^2 o A^c ∩ B, las
+convierte en un árbol sintáctico, aplica reescrituras algebraicas y evalúa
+el plan resultante sobre un OperadorConjuntos.
+
+Precedencia (de menor a mayor):
+    ∪  -        (también |)
+    ∩           (también &)
+    ×  ∘        (también * y @)
+    ^n  ^c      (potencia y complemento, posfijos)
+
+Funciones: bin(E,C,B), cierre(R), hasse(R), ref(R,A), sim(R), tra(R), ant(R)
+"""
+
+import re
+
+
+class ErrorExpresion(Exception):
+    """Error de sintaxis o de evaluación en una expresión"""
+
+
+SIMBOLOS = {
+    '∪': 'union', '|': 'union',
+    '-': 'diferencia',
+    '∩': 'interseccion', '&': 'interseccion',
+    '×': 'producto', '*': 'producto',
+    '∘': 'composicion', '@': 'composicion',
+}
+
+NIVELES = (
+    ('union', 'diferencia'),
+    ('interseccion',),
+    ('producto', 'composicion'),
+)
+
+# Funciones: nombre -> número de argumentos
+FUNCIONES = {'bin': 3, 'cierre': 1, 'hasse': 1, 'ref': 2, 'sim': 1, 'tra': 1, 'ant': 1, 'perfil': 2}
+
+PATRON_TOKEN = re.compile(r'\s*(?:([A-Za-z_][A-Za-z0-9_]*)|(\d+)|(\S))')
+
+
+class Nodo:
+    """
+    Nodo del árbol sintáctico. Es inmutable y se compara por estructura, de
+    modo que dos subexpresiones iguales pueden compartir su resultado.
+    """
+
+    __slots__ = ('operacion', 'hijos', 'dato', '_hash')
+
+    def __init__(self, operacion, *hijos, dato=None):
+        """
+        Args:
+            operacion (str): 'nombre', 'union', 'potencia', 'bin', ...
+            hijos (Nodo): Subexpresiones
+            dato: Nombre del conjunto/relación o exponente, según la operación
+        """
+        self.operacion = operacion
+        self.hijos = hijos
+        self.dato = dato
+        self._hash = hash((operacion, hijos, dato))
+
+    def __eq__(self, otro):
+        return (isinstance(otro, Nodo) and self._hash == otro._hash
+                and self.operacion == otro.operacion and self.dato == otro.dato
+                and self.hijos == otro.hijos)
+
+    def __hash__(self):
+        return self._hash
+
+    def __str__(self):
+        if self.operacion == 'nombre':
+            return self.dato
+        if self.operacion == 'potencia':
+            return f"({self.hijos[0]})^{self.dato}"
+        if self.operacion == 'complemento':
+            return f"({self.hijos[0]})^c"
+        simbolos = {'union': '∪', 'diferencia': '-', 'interseccion': '∩',
+                    'producto': '×', 'composicion': '∘'}
+        if self.operacion in simbolos:
+            return f"({self.hijos[0]} {simbolos[self.operacion]} {self.hijos[1]})"
+        return f"{self.operacion}({', '.join(str(hijo) for hijo in self.hijos)})"
+
+    __repr__ = __str__
+
+
+# === ANÁLISIS SINTÁCTICO ===
+
+def tokenizar(texto):
+    """Divide la expresión en tokens (tipo, valor, posición)"""
+    tokens = []
+    posicion = 0
+    texto = texto.rstrip()
+    while posicion < len(texto):
+        coincidencia = PATRON_TOKEN.match(texto, posicion)
+        nombre, numero, simbolo = coincidencia.groups()
+        if nombre is not None:
+            tokens.append(('nombre', nombre, coincidencia.start(1)))
+        elif numero is not None:
+            tokens.append(('numero', numero, coincidencia.start(2)))
+        else:
+            tokens.append(('simbolo', simbolo, coincidencia.start(3)))
+        posicion = coincidencia.end()
+    return tokens
+
+
+class Analizador:
+    """Analizador descendente recursivo para expresiones de conjuntos"""
+
+    def __init__(self, texto):
+        self.tokens = tokenizar(texto)
+        self.posicion = 0
+
+    def _actual(self):
+        if self.posicion < len(self.tokens):
+            return self.tokens[self.posicion]
+        return (None, None, None)
+
+    def _consumir(self, esperado=None):
+        tipo, valor, columna = self._actual()
+        if tipo is None:
+            raise ErrorExpresion("Fin inesperado de la expresión")
+        if esperado is not None and valor != esperado:
+            raise ErrorExpresion(f"Se esperaba '{esperado}' en la posición {columna}")
+        self.posicion += 1
+        return tipo, valor, columna
+
+    def analizar(self):
+        """Analiza la expresión completa y retorna su árbol"""
+        if not self.tokens:
+            raise ErrorExpresion("La expresión está vacía")
+        nodo = self._nivel(0)
+        tipo, valor, columna = self._actual()
+        if tipo is not None:
+            raise ErrorExpresion(f"Símbolo inesperado '{valor}' en la posición {columna}")
+        return nodo
+
+    def _nivel(self, nivel):
+        """Operadores binarios asociativos por la izquierda del nivel dado"""
+        if nivel == len(NIVELES):
+            return self._posfijo()
+        nodo = self._nivel(nivel + 1)
+        while True:
+            tipo, valor, _ = self._actual()
+            operacion = SIMBOLOS.get(valor) if tipo == 'simbolo' else None
+            if operacion not in NIVELES[nivel]:
+                return nodo
+            self._consumir()
+            nodo = Nodo(operacion, nodo, self._nivel(nivel + 1))
+
+    def _posfijo(self):
+        """Potencias ^n y complementos ^c"""
+        nodo = self._primario()
+        while self._actual()[1] == '^':
+            self._consumir()
+            tipo, valor, columna = self._consumir()
+            if tipo == 'numero':
+                exponente = int(valor)
+                if exponente <= 0:
+                    raise ErrorExpresion("La potencia debe ser un número entero positivo")
+                nodo = Nodo('potencia', nodo, dato=exponente)
+            elif tipo == 'nombre' and valor.lower() == 'c':
+                nodo = Nodo('complemento', nodo)
+            else:
+                raise ErrorExpresion(f"Se esperaba un exponente o 'c' en la posición {columna}")
+        return nodo
+
+    def _primario(self):
+        """Nombres, llamadas a funciones y expresiones entre paréntesis"""
+        tipo, valor, columna = self._consumir()
+        if valor == '(':
+            nodo = self._nivel(0)
+            self._consumir(')')
+            return nodo
+        if tipo != 'nombre':
+            raise ErrorExpresion(f"Símbolo inesperado '{valor}' en la posición {columna}")
+
+        funcion = valor.lower()
+        if funcion in FUNCIONES and self._actual()[1] == '(':
+            self._consumir('(')
+            argumentos = [self._nivel(0)]
+            while self._actual()[1] == ',':
+                self._consumir()
+                argumentos.append(self._nivel(0))
+            self._consumir(')')
+            aridad = FUNCIONES[funcion]
+            # sim(R,A), tra(R,A) y ant(R,A) aceptan el conjunto del enunciado aunque no lo usan
+            if funcion in ('sim', 'tra', 'ant') and len(argumentos) == 2:
+                argumentos = argumentos[:1]
+            if len(argumentos) != aridad:
+                raise ErrorExpresion(f"{funcion} espera {aridad} argumento(s)")
+            return Nodo(funcion, *argumentos)
+
+        return Nodo('nombre', dato=valor.upper())
+
+
+def analizar(texto):
+    """Convierte el texto de una expresión en su árbol sintáctico"""
+    return Analizador(texto).analizar()
+
+
+# === REESCRITURAS ALGEBRAICAS ===
+
+UNIVERSO = Nodo('nombre', dato='U')
+
+
+def _reescribir_nodo(nodo):
+    """
+    Aplica una regla algebraica a la raíz del nodo.
+
+    Returns:
+        Nodo: El nodo reescrito, o None si ninguna regla aplica
+    """
+    operacion = nodo.operacion
+    hijos = nodo.hijos
+
+    if operacion == 'interseccion':
+        izquierdo, derecho = hijos
+        # (A×B) ∩ (C×D) = (A∩C) × (B∩D)
+        if izquierdo.operacion == 'producto' and derecho.operacion == 'producto':
+            return Nodo('producto',
+                        Nodo('interseccion', izquierdo.hijos[0], derecho.hijos[0]),
+                        Nodo('interseccion', izquierdo.hijos[1], derecho.hijos[1]))
+        # (C×B) ∩ E = bin(E,C,B): filtrar E sin construir el producto
+        if derecho.operacion == 'producto':
+            return Nodo('bin', izquierdo, *derecho.hijos)
+        if izquierdo.operacion == 'producto':
+            return Nodo('bin', derecho, *izquierdo.hijos)
+        # A^c ∩ B = (B ∩ U) - A: evita construir el complemento
+        if izquierdo.operacion == 'complemento':
+            return Nodo('diferencia', _interseccion_universo(derecho), izquierdo.hijos[0])
+        if derecho.operacion == 'complemento':
+            return Nodo('diferencia', _interseccion_universo(izquierdo), derecho.hijos[0])
+
+    elif operacion == 'potencia':
+        base = hijos[0]
+        if nodo.dato == 1:
+            return base
+        # (R^m)^n = R^(m·n)
+        if base.operacion == 'potencia':
+            return Nodo('potencia', base.hijos[0], dato=base.dato * nodo.dato)
+
+    elif operacion == 'complemento':
+        # (A^c)^c = A ∩ U
+        if hijos[0].operacion == 'complemento':
+            return _interseccion_universo(hijos[0].hijos[0])
+
+    return None
+
+
+def _interseccion_universo(nodo):
+    """Retorna nodo ∩ U, omitiendo la intersección si el nodo ya es U"""
+    if nodo == UNIVERSO:
+        return nodo
+    return Nodo('interseccion', nodo, UNIVERSO)
+
+
+def optimizar(nodo):
+    """
+    Reescribe el árbol de abajo hacia arriba hasta que ninguna regla aplique.
+    Las reglas suponen, como el complemento, que U es el universo de referencia.
+    """
+    if nodo.hijos:
+        nodo = Nodo(nodo.operacion, *(optimizar(hijo) for hijo in nodo.hijos), dato=nodo.dato)
+    reescrito = _reescribir_nodo(nodo)
+    if reescrito is None:
+        return nodo
+    return optimizar(reescrito)
+
+
+# === EVALUACIÓN ===
+
+TIPO_RELACION = ('producto', 'composicion', 'potencia', 'bin', 'cierre', 'hasse')
+TIPO_BOOLEANO = ('ref', 'sim', 'tra', 'ant')
+
+# Resultados que no son conjuntos y no pueden ser operandos ni guardarse
+TIPOS_NO_OPERABLES = ('booleano', 'perfil')
+
+# Tipo esperado de cada operando (ver inferir_tipo). ∪, ∩ y - no aparecen: aceptan conjuntos o
+# relaciones, pero los dos operandos deben ser del mismo tipo
+FIRMAS = {
+    'complemento': ('conjunto',),
+    'producto': ('conjunto', 'conjunto'),
+    'composicion': ('relacion', 'relacion'),
+    'potencia': ('relacion',),
+    'bin': ('relacion', 'conjunto', 'conjunto'),
+    'cierre': ('relacion',),
+    'hasse': ('relacion',),
+    'ref': ('relacion', 'conjunto'),
+    'sim': ('relacion',),
+    'tra': ('relacion',),
+    'ant': ('relacion',),
+    'perfil': ('relacion', 'conjunto'),
+}
+
+# Cómo se nombra cada operación en los mensajes de error
+NOMBRES_OPERACION = {
+    'union': '∪', 'interseccion': '∩', 'diferencia': '-', 'producto': '×',
+    'composicion': '∘', 'potencia': '^n', 'complemento': '^c',
+}
+
+NOMBRES_TIPO = {'conjunto': 'un conjunto', 'relacion': 'una relación'}
+
+
+def buscar_operando(operador, nombre):
+    """
+    Busca un conjunto o relación guardado por nombre.
+
+    Returns:
+        tuple: (valor, tipo) con tipo 'conjunto' o 'relacion'
+    """
+    nombre = nombre.upper()
+    if nombre in operador.relaciones:
+        return operador.relaciones[nombre], 'relacion'
+    if nombre in operador.conjuntos:
+        return operador.conjuntos[nombre], 'conjunto'
+    raise ErrorExpresion(f"'{nombre}' no es un conjunto ni una relación definida")
+
+
+class Evaluador:
+    """
+    Evalúa un árbol optimizado. Las subexpresiones repetidas se calculan una
+    sola vez gracias a la memoria indexada por la estructura del nodo.
+    """
+
+    def __init__(self, operador):
+        self.operador = operador
+        self.memoria = {}
+        self.extra = {}
+
+    def evaluar(self, nodo):
+        """
+        Returns:
+            tuple: (valor, tipo) con tipo 'conjunto', 'relacion', 'booleano' o 'perfil'
+        """
+        resultado = self.memoria.get(nodo)
+        if resultado is None:
+            resultado = self._calcular(nodo)
+            self.memoria[nodo] = resultado
+        return resultado
+
+    def _valores(self, nodo):
+        """Evalúa los hijos verificando que ninguno sea booleano ni un perfil"""
+        valores = []
+        for hijo in nodo.hijos:
+            valor, tipo = self.evaluar(hijo)
+            if tipo in TIPOS_NO_OPERABLES:
+                raise ErrorExpresion(f"No se puede operar con un resultado {tipo} en {nodo}")
+            valores.append((valor, tipo))
+        return valores
+
+    def _calcular(self, nodo):
+        operador = self.operador
+        operacion = nodo.operacion
+        if operacion == 'nombre':
+            return buscar_operando(operador, nodo.dato)
+
+        valores = self._valores(nodo)
+        operandos = [valor for valor, _ in valores]
+        tipo = valores[0][1]
+        if operacion in TIPO_RELACION:
+            tipo = 'relacion'
+        elif operacion in TIPO_BOOLEANO:
+            tipo = 'booleano'
+        elif operacion == 'perfil':
+            tipo = 'perfil'
+
+        if operacion == 'union':
+            return operador.union_conjuntos(*operandos), tipo
+        if operacion == 'interseccion':
+            return operador.interseccion_conjuntos(*operandos), tipo
+        if operacion == 'diferencia':
+            return operador.diferencia_conjuntos(*operandos), tipo
+        if operacion == 'complemento':
+            return operador.complemento_conjunto(operandos[0]), tipo
+        if operacion == 'producto':
+            return operador.producto_cartesiano(*operandos), tipo
+        if operacion == 'composicion':
+            return operador.composicion_relaciones(*operandos), tipo
+        if operacion == 'potencia':
+            return operador.potencia_relacion(operandos[0], nodo.dato), tipo
+        if operacion == 'bin':
+            return operador.operacion_bin(*operandos), tipo
+        if operacion == 'cierre':
+            return operador.cierre_transitivo(operandos[0]), tipo
+        if operacion == 'ref':
+            return operador.es_reflexiva(operandos[0], operandos[1]), tipo
+        if operacion == 'hasse':
+            reduccion = operador.reduccion_transitiva(operandos[0])
+            if reduccion is None:
+                raise ErrorExpresion(f"{nodo.hijos[0]} tiene un ciclo: no tiene diagrama de Hasse")
+            return reduccion, tipo
+        if operacion == 'perfil':
+            return operador.perfil_relacion(operandos[0], operandos[1]), tipo
+        if operacion == 'sim':
+            return operador.es_simetrica(operandos[0]), tipo
+        if operacion == 'ant':
+            contraejemplo = operador.contraejemplo_antisimetria(operandos[0])
+            if contraejemplo is not None:
+                self.extra['contraejemplo'] = list(contraejemplo)
+            return contraejemplo is None, tipo
+        # tra: se guarda el contraejemplo para poder reportarlo
+        contraejemplo = operador.contraejemplo_transitividad(operandos[0])
+        if contraejemplo is not None:
+            self.extra['contraejemplo'] = list(contraejemplo)
+        return contraejemplo is None, tipo
+
+
+def inferir_tipo(operador, nodo):
+    """
+    Calcula el tipo del resultado sin evaluar nada, verificando que cada
+    operando tenga el tipo que espera su operación. Se aplica al árbol tal
+    como lo escribió el usuario, antes de las reescrituras.
+
+    Returns:
+        str: 'conjunto', 'relacion', 'booleano' o 'perfil'
+    """
+    if nodo.operacion == 'nombre':
+        return buscar_operando(operador, nodo.dato)[1]
+
+    tipos = [inferir_tipo(operador, hijo) for hijo in nodo.hijos]
+    nombre = NOMBRES_OPERACION.get(nodo.operacion, nodo.operacion)
+    for hijo, tipo in zip(nodo.hijos, tipos):
+        if tipo in TIPOS_NO_OPERABLES:
+            raise ErrorExpresion(f"No se puede operar con un resultado {tipo} en {nodo}")
+
+    firma = FIRMAS.get(nodo.operacion)
+    if firma is None:
+        if tipos[0] != tipos[1]:
+            raise ErrorExpresion(
+                f"{nombre} espera dos conjuntos o dos relaciones, pero {nodo.hijos[0]} es "
+                f"{NOMBRES_TIPO[tipos[0]]} y {nodo.hijos[1]} es {NOMBRES_TIPO[tipos[1]]}"
+            )
+    else:
+        for posicion, (hijo, tipo, esperado) in enumerate(zip(nodo.hijos, tipos, firma), start=1):
+            if tipo != esperado:
+                donde = f" como operando {posicion}" if len(firma) > 1 else ""
+                raise ErrorExpresion(
+                    f"{nombre} espera {NOMBRES_TIPO[esperado]}{donde}, pero {hijo} es {NOMBRES_TIPO[tipo]}"
+                )
+
+    if nodo.operacion in TIPO_RELACION:
+        return 'relacion'
+    if nodo.operacion in TIPO_BOOLEANO:
+        return 'booleano'
+    if nodo.operacion == 'perfil':
+        return 'perfil'
+    return tipos[0]
+
+
+def planificar(texto):
+    """Analiza y optimiza una expresión, retornando el plan que se ejecutará"""
+    return optimizar(analizar(texto))
+
+
+def evaluar_expresion(operador, texto):
+    """
+    Analiza, verifica los tipos, optimiza y evalúa una expresión sobre el operador.
+
+    Returns:
+        tuple: (valor, tipo, datos_extra) con tipo 'conjunto', 'relacion', 'booleano' o 'perfil'
+    """
+    arbol = analizar(texto)
+    inferir_tipo(operador, arbol)
+    evaluador = Evaluador(operador)
+    valor, tipo = evaluador.evaluar(optimizar(arbol))
+    return valor, tipo, evaluador.extra
@@ -0,0 +1,95 @@
+"""
+Índices auxiliares para operaciones con relaciones.
+Contiene funciones que construyen mapas de sucesores y realizan
+composiciones por hash-join en lugar de comparar todos los pares.
+"""
+
+from src.relacion import Relacion
+
+
+def indexar_sucesores(relacion):
+    """
+    Construye un índice de la relación por su primer componente.
+    Una Relacion ya guarda su índice, que se reutiliza sin recorrerla.
+
+    Args:
+        relacion (set): Conjunto de pares ordenados (a,b)
+
+    Returns:
+        dict: Diccionario a -> conjunto de b tales que (a,b) ∈ relación
+    """
+    if isinstance(relacion, Relacion):
+        return relacion.sucesores
+    sucesores = {}
+    for par in relacion:
+        if len(par) == 2:  # Ignorar elementos que no sean pares ordenados
+            sucesores.setdefault(par[0], set()).add(par[1])
+    return sucesores
+
+
+def componer_indexado(relacion1, sucesores2):
+    """
+    Calcula R₁ ∘ R₂ sondeando el índice de R₂ con cada par de R₁.
+
+    El costo es proporcional a |R₁| más el número de coincidencias,
+    en lugar de |R₁|·|R₂| comparaciones.
+
+    Args:
+        relacion1 (set): Relación izquierda R₁
+        sucesores2 (dict): Índice de R₂ construido con indexar_sucesores
+
+    Returns:
+        set: Conjunto de pares (a,c) de la composición
+    """
+    composicion = set()
+    for par in relacion1:
+        if len(par) == 2:
+            destinos = sucesores2.get(par[1])
+            if destinos:
+                a = par[0]
+                composicion.update((a, c) for c in destinos)
+    return composicion
+
+
+def iterar_violaciones_transitivas(sucesores, filas=None):
+    """
+    Genera, para cada par (a,c) de R∘R que falta en R, la terna (a,b,c) con
+    su primer testigo b. Es el único recorrido de testigos de transitividad:
+    buscar_violacion_transitiva toma la primera terna y
+    testigos.violaciones_transitividad las reúne todas.
+
+    Args:
+        sucesores (dict): Índice construido con indexar_sucesores
+        filas (iterable): Pares (a, sucesores de a) a revisar; por defecto
+            todas las filas del índice
+
+    Yields:
+        tuple: (a, b, c) con (a,b), (b,c) ∈ R y (a,c) ∉ R, una por cada (a,c)
+    """
+    if filas is None:
+        filas = sucesores.items()
+    for a, destinos_a in filas:
+        faltantes = None
+        for b in destinos_a:
+            destinos_b = sucesores.get(b)
+            # issubset recorre los sucesores de b sin crear conjuntos intermedios
+            if destinos_b and not destinos_b.issubset(destinos_a):
+                if faltantes is None:
+                    faltantes = set()
+                for c in destinos_b:
+                    if c not in destinos_a and c not in faltantes:
+                        faltantes.add(c)
+                        yield (a, b, c)
+
+
+def buscar_violacion_transitiva(sucesores):
+    """
+    Busca el primer camino a→b→c cuyo atajo (a,c) falta en la relación.
+
+    Args:
+        sucesores (dict): Índice construido con indexar_sucesores
+
+    Returns:
+        tuple: (a, b, c) de la primera violación encontrada, o None si es transitiva
+    """
+    return next(iterar_violaciones_transitivas(sucesores), None)
@@ -4,17 +4,23 @@ Maneja la interacción con el usuario y los menús.
 """
 
 from src.utilidades import (
-    crear_conjunto_desde_entrada, crear_relacion_desde_entrada,
+    clave_orden, crear_conjunto_desde_entrada, crear_relacion_desde_entrada,
     mostrar_conjunto_formateado, mostrar_relacion_formateada,
-    solicitar_entrada_usuario, confirmar_accion, mostrar_separador
+    solicitar_entrada_usuario, solicitar_y_convertir, confirmar_accion, mostrar_separador
 )
 from src.validadores import (
-    validar_nombre_conjunto, validar_entrada_conjunto, validar_entrada_relacion,
-    validar_numero_entero_positivo, validar_opcion_menu, validar_sobrescritura
+    validar_nombre_conjunto, validar_numero_entero_positivo, validar_opcion_menu, validar_sobrescritura
 )
+from src.perfilado import activar_perfilado
+from src.perfil import PROPIEDADES, NOMBRES_PROPIEDADES, describir_contraejemplo
+from src.espacio_trabajo import guardar_espacio_trabajo, cargar_espacio_trabajo, ErrorEspacioTrabajo
 from ejemplos.casos_prueba import ejecutar_ejemplos_predefinidos
 
 
+# Pares a partir de los cuales un resultado se muestra por partes
+UMBRAL_PAGINACION = 1000
+
+
 def mostrar_menu_principal():
     """Muestra el menú principal de opciones"""
     print("\n" + "=" * 50)
@@ -35,6 +41,15 @@ def mostrar_menu_principal():
     print("13. Composición de relaciones (R₁ ∘ R₂)")
     print("14. Operación bin(E,C,B)")
     print("15. Ejecutar ejemplos predefinidos")
+    print("16. Cierre transitivo de relación (R⁺ / R*)")
+    print("17. Guardar espacio de trabajo en archivo")
+    print("18. Cargar espacio de trabajo desde archivo")
+    print("19. Estadísticas de operaciones (perfilado)")
+    print("20. Clases de equivalencia (A/R) y cierre de equivalencia")
+    print("21. Verificar si relación es antisimétrica")
+    print("22. Relación de orden: orden topológico y diagrama de Hasse")
+    print("23. Explicar un par de una composición o potencia")
+    print("24. Perfil completo de una relación (todas las propiedades)")
     print("0.  Salir")
     mostrar_separador()
 
@@ -55,7 +70,8 @@ def mostrar_conjuntos_y_relaciones(operador):
     print("\nRELACIONES:")
     if operador.relaciones:
         for nombre in sorted(operador.relaciones.keys()):
-            mostrar_relacion_formateada(operador.relaciones[nombre], nombre)
+            mostrar_relacion_formateada(operador.relaciones[nombre], nombre,
+                                        primeros=UMBRAL_PAGINACION)
     else:
         print("  (No hay relaciones definidas)")
     
@@ -136,12 +152,7 @@ def crear_conjunto_interactivo(operador, nombre=None):
     print("Ingresa los elementos del conjunto separados por comas")
     print("Ejemplo: a,b,c,1,2,3")
     
-    entrada = solicitar_entrada_usuario(
-        "Elementos: ",
-        validar_entrada_conjunto
-    )
-    
-    conjunto = crear_conjunto_desde_entrada(entrada)
+    conjunto = solicitar_y_convertir("Elementos: ", crear_conjunto_desde_entrada)
     operador.agregar_conjunto(nombre, conjunto)
     
     print(f"✓ Conjunto '{nombre}' creado exitosamente:")
@@ -174,12 +185,7 @@ def crear_relacion_interactiva(operador, nombre=None):
     print("Ingresa los pares ordenados de la relación")
     print("Ejemplo: (1,a),(2,b),(3,c)")
     
-    entrada = solicitar_entrada_usuario(
-        "Pares ordenados: ",
-        validar_entrada_relacion
-    )
-    
-    relacion = crear_relacion_desde_entrada(entrada)
+    relacion = solicitar_y_convertir("Pares ordenados: ", crear_relacion_desde_entrada)
     operador.agregar_relacion(nombre, relacion)
     
     print(f"✓ Relación '{nombre}' creada exitosamente:")
@@ -188,6 +194,54 @@ def crear_relacion_interactiva(operador, nombre=None):
     return relacion
 
 
+def mostrar_resultado_relacion(resultado):
+    """
+    Muestra una relación resultado. Si supera UMBRAL_PAGINACION pares se
+    pregunta cómo mostrarla en lugar de volcarla completa en la terminal.
+    """
+    total = len(resultado)
+    if total <= UMBRAL_PAGINACION:
+        mostrar_relacion_formateada(resultado)
+        return
+    
+    print(f"La relación tiene {total} pares.")
+    print("  [p] Primeros    [u] Últimos    [g] Página    [c] Solo conteo")
+    print("  [a] Guardar en archivo    [t] Mostrar todo")
+    eleccion = solicitar_entrada_usuario(
+        "¿Cómo mostrarla? ",
+        lambda x: validar_opcion_menu(x.lower(), ['p', 'u', 'g', 'c', 'a', 't'])
+    ).lower()
+    
+    if eleccion == 'p':
+        mostrar_relacion_formateada(resultado, primeros=UMBRAL_PAGINACION)
+    elif eleccion == 'u':
+        mostrar_relacion_formateada(resultado, ultimos=UMBRAL_PAGINACION)
+    elif eleccion == 'g':
+        paginas = -(-total // UMBRAL_PAGINACION)
+        
+        def validar_pagina(entrada):
+            es_valido, mensaje = validar_numero_entero_positivo(entrada)
+            if es_valido and int(entrada) > paginas:
+                return False, f"La página debe estar entre 1 y {paginas}"
+            return es_valido, mensaje
+        
+        pagina = solicitar_entrada_usuario(f"Número de página (1-{paginas}): ", validar_pagina)
+        mostrar_relacion_formateada(resultado, pagina=int(pagina), por_pagina=UMBRAL_PAGINACION)
+    elif eleccion == 'c':
+        mostrar_relacion_formateada(resultado, solo_conteo=True)
+    elif eleccion == 'a':
+        ruta = input("Ruta del archivo: ").strip()
+        try:
+            with open(ruta, 'w', encoding='utf-8') as archivo:
+                mostrar_relacion_formateada(resultado, salida=archivo)
+        except OSError as error:
+            print(f"❌ Error al escribir el archivo: {error}")
+            return
+        print(f"✓ {total} pares escritos en '{ruta}'")
+    else:
+        mostrar_relacion_formateada(resultado)
+
+
 def guardar_resultado_conjunto(operador, resultado, tipo_operacion):
     """Pregunta al usuario si quiere guardar el resultado como un nuevo conjunto"""
     if len(resultado) == 0:
@@ -269,7 +323,7 @@ def ejecutar_operacion_conjuntos(operador, tipo_operacion):
     
     print(f"\nResultado: {nombre1} {simbolo} {nombre2} =")
     if tipo_operacion == "producto":
-        mostrar_relacion_formateada(resultado)
+        mostrar_resultado_relacion(resultado)
         guardar_resultado_relacion(operador, resultado, f"{tipo_operacion} cartesiano")
     else:
         mostrar_conjunto_formateado(resultado)
@@ -294,13 +348,261 @@ def ejecutar_verificacion_propiedades(operador, tipo_propiedad):
         print(f"\n¿Es la relación {nombre_rel} simétrica? {resultado}")
     
     elif tipo_propiedad == "transitiva":
-        resultado = operador.es_transitiva(relacion)
+        contraejemplo = operador.contraejemplo_transitividad(relacion)
+        resultado = contraejemplo is None
         print(f"\n¿Es la relación {nombre_rel} transitiva? {resultado}")
+        if not resultado:
+            a, b, c = contraejemplo
+            print(f"Contraejemplo: ({a},{b}) ∈ {nombre_rel} y ({b},{c}) ∈ {nombre_rel}, pero ({a},{c}) ∉ {nombre_rel}")
+            if confirmar_accion("¿Listar todos los pares que faltan para que sea transitiva?"):
+                faltantes = operador.violaciones_transitividad(relacion)
+                print(f"\nFaltan {len(faltantes)} pares:")
+                for a, c in sorted(faltantes, key=clave_orden)[:UMBRAL_PAGINACION]:
+                    _, b, _ = faltantes.explicar(a, c)
+                    print(f"  ({a},{c}) por ({a},{b}) y ({b},{c})")
+                if len(faltantes) > UMBRAL_PAGINACION:
+                    print(f"  ... ({len(faltantes) - UMBRAL_PAGINACION} más)")
+    
+    elif tipo_propiedad == "antisimetrica":
+        contraejemplo = operador.contraejemplo_antisimetria(relacion)
+        resultado = contraejemplo is None
+        print(f"\n¿Es la relación {nombre_rel} antisimétrica? {resultado}")
+        if not resultado:
+            a, b = contraejemplo
+            print(f"Contraejemplo: ({a},{b}) ∈ {nombre_rel} y ({b},{a}) ∈ {nombre_rel}, pero {a} ≠ {b}")
+
+
+def ejecutar_perfil_relacion(operador):
+    """Muestra todas las propiedades de una relación con sus contraejemplos"""
+    relacion, nombre_rel = obtener_relacion_usuario(operador, "Selecciona la relación:")
+    if relacion is None:
+        return
+    conjunto, nombre_conj = obtener_conjunto_usuario(operador, "Selecciona el conjunto A:")
+    if conjunto is None:
+        return
+    
+    perfil = operador.perfil_relacion(relacion, conjunto)
+    print(f"\nPerfil de {nombre_rel} en {nombre_conj} "
+          f"({perfil['pares']} pares, dominio {perfil['dominio']}, rango {perfil['rango']}):")
+    for propiedad in PROPIEDADES:
+        resultado = perfil[propiedad]
+        linea = f"  - {NOMBRES_PROPIEDADES[propiedad]}: {resultado['cumple']}"
+        if not resultado['cumple']:
+            linea += "  (" + describir_contraejemplo(
+                propiedad, resultado['contraejemplo'], nombre_rel, nombre_conj
+            ) + ")"
+        print(linea)
+
+
+def ejecutar_herramientas_orden(operador):
+    """Antisimetría, diagrama de Hasse y orden topológico de una relación de orden"""
+    relacion, nombre_rel = obtener_relacion_usuario(operador, "Selecciona la relación:")
+    if relacion is None:
+        return
+    conjunto, nombre_conj = obtener_conjunto_usuario(operador, "Selecciona el conjunto A:")
+    if conjunto is None:
+        return
+    
+    contraejemplo = operador.contraejemplo_antisimetria(relacion)
+    if contraejemplo is not None:
+        a, b = contraejemplo
+        print(f"\n✗ {nombre_rel} no es antisimétrica: ({a},{b}) y ({b},{a}) están en {nombre_rel}")
+        print("No hay orden topológico ni diagrama de Hasse para una relación con ciclos.")
+        return
+    
+    orden = operador.orden_topologico(relacion, conjunto)
+    if orden is None:
+        print(f"\n✗ {nombre_rel} tiene un ciclo de longitud mayor que 2: no es un orden")
+        return
+    
+    if operador.es_orden_parcial(relacion, conjunto):
+        print(f"\n✓ {nombre_rel} es un orden parcial en {nombre_conj}")
+    else:
+        print(f"\n{nombre_rel} es antisimétrica y acíclica, pero no es un orden parcial en "
+              f"{nombre_conj} (no es reflexiva o no es transitiva)")
+    
+    mostrados = orden[:UMBRAL_PAGINACION]
+    sufijo = f" ... ({len(orden) - len(mostrados)} más)" if len(orden) > len(mostrados) else ""
+    print(f"\nOrden topológico: " + " < ".join(map(str, mostrados)) + sufijo)
+    
+    hasse = operador.reduccion_transitiva(relacion)
+    print(f"\nDiagrama de Hasse ({len(hasse)} aristas, reducción transitiva de {nombre_rel}):")
+    mostrar_resultado_relacion(hasse)
+    guardar_resultado_relacion(operador, hasse, "diagrama de Hasse")
+
+
+def ejecutar_cierre_transitivo(operador):
+    """Calcula el cierre transitivo R⁺ o reflexivo-transitivo R* de una relación"""
+    relacion, nombre = obtener_relacion_usuario(operador, "Selecciona la relación:")
+    if relacion is None:
+        return
+    
+    if confirmar_accion("¿Incluir también la parte reflexiva (R*)?"):
+        conjunto, nombre_conj = obtener_conjunto_usuario(
+            operador, "Selecciona el conjunto sobre el que R* es reflexiva:"
+        )
+        if conjunto is None:
+            return
+        resultado = operador.cierre_reflexivo_transitivo(relacion, conjunto)
+        print(f"\nCierre reflexivo-transitivo {nombre}* en {nombre_conj} =")
+        tipo_operacion = "cierre reflexivo-transitivo"
+    else:
+        resultado = operador.cierre_transitivo(relacion)
+        print(f"\nCierre transitivo {nombre}⁺ =")
+        tipo_operacion = "cierre transitivo"
+    
+    mostrar_resultado_relacion(resultado)
+    guardar_resultado_relacion(operador, resultado, tipo_operacion)
+
+
+def ejecutar_clases_equivalencia(operador):
+    """Calcula el conjunto cociente A/R, o el cierre de equivalencia si R no lo es"""
+    relacion, nombre_rel = obtener_relacion_usuario(operador, "Selecciona la relación:")
+    if relacion is None:
+        return
+    conjunto, nombre_conj = obtener_conjunto_usuario(operador, "Selecciona el conjunto A:")
+    if conjunto is None:
+        return
+    
+    es_equivalencia = operador.es_equivalencia(relacion, conjunto)
+    if es_equivalencia:
+        print(f"\n✓ {nombre_rel} es una relación de equivalencia en {nombre_conj}")
+        titulo = f"{nombre_conj}/{nombre_rel}"
+    else:
+        print(f"\n✗ {nombre_rel} no es una relación de equivalencia en {nombre_conj}")
+        if not confirmar_accion("¿Calcular las clases de su cierre de equivalencia?"):
+            return
+        titulo = f"{nombre_conj}/≡({nombre_rel})"
+    
+    clases, _ = operador.clases_equivalencia(relacion, conjunto)
+    print(f"\n{titulo} tiene {len(clases)} clases:")
+    for clase in clases[:UMBRAL_PAGINACION]:
+        elementos = sorted(clase, key=clave_orden)
+        print(f"  [{elementos[0]}] = {{" + ", ".join(map(str, elementos)) + "}")
+    if len(clases) > UMBRAL_PAGINACION:
+        print(f"  ... ({len(clases) - UMBRAL_PAGINACION} clases más)")
+    
+    if not es_equivalencia:
+        cierre = operador.cierre_equivalencia(relacion, conjunto)
+        print(f"\nCierre de equivalencia de {nombre_rel} ({len(cierre)} pares):")
+        mostrar_resultado_relacion(cierre)
+        guardar_resultado_relacion(operador, cierre, "cierre de equivalencia")
+
+
+def solicitar_par(mensaje):
+    """Pide un par ordenado (a,c) y lo retorna con sus elementos convertidos"""
+    relacion = solicitar_y_convertir(mensaje, crear_relacion_desde_entrada)
+    while len(relacion) != 1:
+        print("Error: Ingresa exactamente un par, por ejemplo (1,a)")
+        relacion = solicitar_y_convertir(mensaje, crear_relacion_desde_entrada)
+    return next(iter(relacion))
+
+
+def ejecutar_explicar_par(operador):
+    """Explica por qué un par está en R₁ ∘ R₂ (testigo) o en R^n (camino)"""
+    relacion1, nombre1 = obtener_relacion_usuario(operador, "Selecciona la relación R₁ (o R para R^n):")
+    if relacion1 is None:
+        return
+    
+    if confirmar_accion("¿Explicar un par de una potencia R^n? (n = composición R₁ ∘ R₂)"):
+        n = int(solicitar_entrada_usuario(
+            "Ingresa la potencia (número entero positivo): ",
+            validar_numero_entero_positivo
+        ))
+        caminos = operador.potencia_con_caminos(relacion1, n)
+        a, c = solicitar_par("Par a explicar, por ejemplo (1,a): ")
+        camino = caminos.camino(a, c)
+        if camino is None:
+            print(f"\n({a},{c}) ∉ {nombre1}^{n}")
+        else:
+            print(f"\n({a},{c}) ∈ {nombre1}^{n} por el camino " + " → ".join(map(str, camino)))
+        return
+    
+    relacion2, nombre2 = obtener_relacion_usuario(operador, "Selecciona la relación R₂:")
+    if relacion2 is None:
+        return
+    composicion = operador.composicion_con_testigos(relacion1, relacion2, True)
+    a, c = solicitar_par("Par a explicar, por ejemplo (1,a): ")
+    intermedios = composicion.testigos_de(a, c)
+    if not intermedios:
+        print(f"\n({a},{c}) ∉ {nombre1} ∘ {nombre2}")
+        return
+    print(f"\n({a},{c}) ∈ {nombre1} ∘ {nombre2} porque:")
+    for b in sorted(intermedios, key=clave_orden):
+        print(f"  ({a},{b}) ∈ {nombre1} y ({b},{c}) ∈ {nombre2}")
+
+
+def ejecutar_guardar_espacio(operador):
+    """Guarda todos los conjuntos y relaciones en un archivo binario"""
+    ruta = input("Ruta del archivo de destino: ").strip()
+    if not ruta:
+        print("❌ Error: La ruta no puede estar vacía")
+        return
+    try:
+        guardar_espacio_trabajo(operador, ruta)
+    except (OSError, ErrorEspacioTrabajo) as error:
+        print(f"❌ Error al guardar: {error}")
+        return
+    print(f"✅ Espacio de trabajo guardado en '{ruta}' "
+          f"({len(operador.conjuntos)} conjuntos, {len(operador.relaciones)} relaciones)")
+
+
+def ejecutar_cargar_espacio(operador):
+    """Reemplaza los conjuntos y relaciones actuales por los de un archivo"""
+    ruta = input("Ruta del archivo a cargar: ").strip()
+    if not ruta:
+        print("❌ Error: La ruta no puede estar vacía")
+        return
+    if not confirmar_accion("Se reemplazarán todos los conjuntos y relaciones actuales. ¿Continuar?"):
+        return
+    try:
+        cargar_espacio_trabajo(operador, ruta)
+    except (OSError, ErrorEspacioTrabajo) as error:
+        print(f"❌ Error al cargar: {error}")
+        return
+    print(f"✅ Espacio de trabajo cargado desde '{ruta}' "
+          f"({len(operador.conjuntos)} conjuntos, {len(operador.relaciones)} relaciones)")
+
+
+def mostrar_estadisticas_operaciones(operador):
+    """Muestra las estadísticas del perfilado y de la caché de resultados"""
+    if operador.perfilador is None:
+        print("El perfilado está desactivado (use --perfil o la variable CONJUNTOS_PERFIL).")
+        if confirmar_accion("¿Activarlo ahora para el resto de la sesión?"):
+            activar_perfilado(operador)
+            print("✓ Perfilado activado: las siguientes operaciones quedarán registradas")
+        return
+    
+    estadisticas = operador.perfilador.estadisticas()
+    print("\n" + "=" * 78)
+    print("         ESTADÍSTICAS DE OPERACIONES")
+    print("=" * 78)
+    if not estadisticas:
+        print("  (Todavía no se ha ejecutado ninguna operación)")
+    else:
+        print(f"{'operación':<30} {'llamadas':>8} {'total ms':>10} {'máx ms':>9} "
+              f"{'entrada':>9} {'salida':>9}")
+        for nombre, datos in estadisticas.items():
+            print(f"{nombre:<30} {datos['llamadas']:>8} {datos['ms_total']:>10.2f} "
+                  f"{datos['ms_maximo']:>9.2f} {datos['entrada_promedio']:>9.0f} "
+                  f"{datos['salida_promedio']:>9.0f}")
+        print("  (entrada y salida: tamaño promedio en elementos o pares)")
+    
+    cache = operador.estadisticas_cache()
+    print(f"\nCaché: {cache['entradas']}/{cache['capacidad']} resultados, "
+          f"{cache['aciertos']} aciertos, {cache['fallos']} fallos "
+          f"({cache['tasa_aciertos']:.0%}), {cache['desalojos']} desalojos")
+    if operador.perfilador.ruta:
+        print(f"Las estadísticas se guardarán en '{operador.perfilador.ruta}' al salir")
+    mostrar_separador()
+    
+    if confirmar_accion("¿Reiniciar los contadores?"):
+        operador.perfilador.reiniciar()
 
 
 def ejecutar_menu_principal(operador):
     """Ejecuta el bucle principal del menú"""
-    opciones_validas = [str(i) for i in range(16)]
+    opciones_validas = [str(i) for i in range(25)]
     
     while True:
         mostrar_menu_principal()
@@ -363,7 +665,7 @@ def ejecutar_menu_principal(operador):
                 n = int(n_str)
                 resultado = operador.potencia_relacion(relacion, n)
                 print(f"\n{nombre}^{n} =")
-                mostrar_relacion_formateada(resultado)
+                mostrar_resultado_relacion(resultado)
                 guardar_resultado_relacion(operador, resultado, f"potencia {n}")
         
         elif opcion == '13':
@@ -377,7 +679,7 @@ def ejecutar_menu_principal(operador):
             
             resultado = operador.composicion_relaciones(relacion1, relacion2)
             print(f"\nComposición {nombre1} ∘ {nombre2} =")
-            mostrar_relacion_formateada(resultado)
+            mostrar_resultado_relacion(resultado)
             guardar_resultado_relacion(operador, resultado, "composición")
         
         elif opcion == '14':
@@ -395,12 +697,39 @@ def ejecutar_menu_principal(operador):
             
             resultado = operador.operacion_bin(relacion_E, conjunto_C, conjunto_B)
             print(f"\nbin({nombre_E},{nombre_C},{nombre_B}) = ({nombre_C} × {nombre_B}) ∩ {nombre_E} =")
-            mostrar_relacion_formateada(resultado)
+            mostrar_resultado_relacion(resultado)
             guardar_resultado_relacion(operador, resultado, "operación bin")
         
         elif opcion == '15':
             ejecutar_ejemplos_predefinidos(operador)
         
+        elif opcion == '16':
+            ejecutar_cierre_transitivo(operador)
+        
+        elif opcion == '17':
+            ejecutar_guardar_espacio(operador)
+        
+        elif opcion == '18':
+            ejecutar_cargar_espacio(operador)
+        
+        elif opcion == '19':
+            mostrar_estadisticas_operaciones(operador)
+        
+        elif opcion == '20':
+            ejecutar_clases_equivalencia(operador)
+        
+        elif opcion == '21':
+            ejecutar_verificacion_propiedades(operador, "antisimetrica")
+        
+        elif opcion == '22':
+            ejecutar_herramientas_orden(operador)
+        
+        elif opcion == '23':
+            ejecutar_explicar_par(operador)
+        
+        elif opcion == '24':
+            ejecutar_perfil_relacion(operador)
+        
         # Pausa para que el usuario pueda leer el resultado
         if opcion != '0':
             input("\nPresiona Enter para continuar...")
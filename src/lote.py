@@ -0,0 +1,154 @@
+"""
+Modo de ejecución por lotes (no interactivo).
+Ejecuta un guion de comandos sobre un OperadorConjuntos sin pedir datos al
+usuario y escribe cada resultado como una línea JSON.
+
+Formato del guion (una instrucción por línea, '#' inicia un comentario):
+    C = {1,2,3}              Define un conjunto
+    E = {(1,a),(2,b)}        Define una relación
+    R2 = R^3                 Potencia de una relación
+    X = bin(E,C,B)           Operación bin(E,C,B)
+    D = A ∪ B                También: ∩, -, ×, ∘ (o sus equivalentes |, &, -, *, @)
+    N = A^c                  Complemento respecto a U
+    Y = ((A ∪ B) × C) ∩ E    Expresiones compuestas (ver src/expresiones.py)
+    tra(R)                   Propiedades: ref(R,A), sim(R), tra(R), ant(R)
+    H = hasse(R)             Reducción transitiva (diagrama de Hasse)
+    perfil(R,A)              Todas las propiedades de R en A con sus contraejemplos
+    R                        Muestra un conjunto o relación guardado
+"""
+
+import json
+import re
+import time
+
+from src.expresiones import ErrorExpresion, TIPOS_NO_OPERABLES
+from src.expresiones import evaluar_expresion as evaluar_expresion_algebraica
+from src.perfil import PROPIEDADES
+from src.tokenizador import ErrorSintaxis
+from src.utilidades import clave_orden, crear_conjunto_desde_entrada, crear_relacion_desde_entrada
+from src.validadores import validar_nombre_conjunto
+
+
+class ErrorLote(Exception):
+    """Error en una instrucción del guion de comandos"""
+
+
+PATRON_ASIGNACION = re.compile(r'^([A-Za-z0-9_]+)\s*=\s*(.+)$')
+
+
+def evaluar_expresion(operador, expresion):
+    """
+    Evalúa el lado derecho de una instrucción.
+
+    Returns:
+        tuple: (valor, tipo, datos_extra) con tipo 'conjunto', 'relacion', 'booleano' o 'perfil'
+    """
+    expresion = expresion.strip()
+
+    if expresion.startswith('{'):
+        try:
+            if '(' in expresion:
+                return crear_relacion_desde_entrada(expresion), 'relacion', {}
+            return crear_conjunto_desde_entrada(expresion), 'conjunto', {}
+        except ErrorSintaxis as error:
+            raise ErrorLote(str(error)) from error
+
+    # Cualquier otra instrucción es una expresión del álgebra de conjuntos
+    try:
+        return evaluar_expresion_algebraica(operador, expresion)
+    except ErrorExpresion as error:
+        raise ErrorLote(str(error)) from error
+
+
+def a_json(valor, tipo):
+    """Convierte un resultado a una estructura serializable en JSON"""
+    if tipo == 'booleano':
+        return valor
+    if tipo == 'perfil':
+        return {
+            propiedad: {
+                'cumple': valor[propiedad]['cumple'],
+                'contraejemplo': (None if valor[propiedad]['contraejemplo'] is None
+                                  else list(valor[propiedad]['contraejemplo'])),
+            }
+            for propiedad in PROPIEDADES
+        }
+    if tipo == 'relacion':
+        return [[a, b] for a, b in sorted(valor, key=clave_orden)]
+    return sorted(valor, key=clave_orden)
+
+
+def ejecutar_instruccion(operador, linea):
+    """
+    Ejecuta una instrucción del guion y retorna el registro de salida.
+
+    Returns:
+        dict: Registro con el resultado de la instrucción
+    """
+    nombre = None
+    expresion = linea
+    coincidencia = PATRON_ASIGNACION.match(linea)
+    if coincidencia:
+        nombre = coincidencia.group(1).upper()
+        es_valido, mensaje = validar_nombre_conjunto(nombre)
+        if not es_valido:
+            raise ErrorLote(mensaje)
+        expresion = coincidencia.group(2)
+
+    inicio = time.perf_counter()
+    valor, tipo, extra = evaluar_expresion(operador, expresion)
+    milisegundos = (time.perf_counter() - inicio) * 1000
+
+    if nombre is not None:
+        if tipo in TIPOS_NO_OPERABLES:
+            raise ErrorLote(f"No se puede guardar un resultado {tipo}")
+        # Un nombre reasignado con otro tipo deja de existir con el anterior;
+        # si no, buscar_operando seguiría encontrando primero la relación
+        if tipo == 'relacion':
+            operador.conjuntos.pop(nombre, None)
+            operador.agregar_relacion(nombre, valor)
+        else:
+            operador.relaciones.pop(nombre, None)
+            operador.agregar_conjunto(nombre, valor)
+
+    registro = {'nombre': nombre, 'tipo': tipo, 'resultado': a_json(valor, tipo)}
+    if tipo == 'perfil':
+        registro['tamano'] = valor['pares']
+    elif tipo != 'booleano':
+        registro['tamano'] = len(valor)
+    registro.update(extra)
+    registro['ms'] = round(milisegundos, 3)
+    return registro
+
+
+def ejecutar_lote(operador, lineas, salida):
+    """
+    Ejecuta todas las instrucciones y escribe una línea JSON por cada una.
+    Los errores (también los de operandos de tipo inesperado) se reportan
+    en la salida y la ejecución continúa.
+
+    Args:
+        operador: Instancia de OperadorConjuntos
+        lineas (iterable): Líneas del guion
+        salida: Flujo de texto donde escribir los resultados
+
+    Returns:
+        int: Número de instrucciones que terminaron con error
+    """
+    errores = 0
+    for numero, linea in enumerate(lineas, start=1):
+        linea = linea.split('#', 1)[0].strip()
+        if not linea:
+            continue
+        try:
+            registro = ejecutar_instruccion(operador, linea)
+        except ErrorLote as error:
+            errores += 1
+            registro = {'error': str(error)}
+        except (TypeError, ValueError) as error:
+            # Un operando de forma inesperada no detiene el resto del guion
+            errores += 1
+            registro = {'error': f"{type(error).__name__}: {error}"}
+        registro = dict({'linea': numero, 'entrada': linea}, **registro)
+        salida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+    return errores
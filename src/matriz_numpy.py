@@ -0,0 +1,135 @@
+"""
+Backend opcional con NumPy para relaciones densas.
+Representa las relaciones como matrices booleanas y calcula composición,
+potencia y transitividad con productos de matrices vectorizados.
+Si NumPy no está instalado, NUMPY_DISPONIBLE es False y nada de este
+módulo debe usarse.
+"""
+
+try:
+    import numpy as np
+    NUMPY_DISPONIBLE = True
+except ImportError:  # NumPy es una dependencia opcional
+    np = None
+    NUMPY_DISPONIBLE = False
+
+from src.relacion import Relacion
+
+
+# Fracción mínima de pares (|R| / n²) para considerar densa una relación
+UMBRAL_DENSIDAD = 0.05
+
+# Por debajo de este número de elementos el camino en Python puro es suficiente
+MINIMO_ELEMENTOS = 64
+
+# Por encima de este número de elementos cada matriz float32 del producto
+# ocuparía más de 256 MiB (hay tres a la vez): se usa el hash-join
+MAXIMO_ELEMENTOS = 8192
+
+
+def es_densa(*relaciones):
+    """
+    Decide si conviene usar el backend NumPy para las relaciones dadas.
+
+    Returns:
+        bool: True si NumPy está disponible, las relaciones son densas y
+              sus matrices caben en MAXIMO_ELEMENTOS
+    """
+    if not NUMPY_DISPONIBLE:
+        return False
+    elementos = set()
+    total_pares = 0
+    for relacion in relaciones:
+        total_pares += len(relacion)
+        if isinstance(relacion, Relacion):
+            # Dominio y rango ya indexados: no hace falta recorrer los pares
+            elementos.update(relacion.dominio)
+            elementos.update(relacion.rango)
+            continue
+        for a, b in relacion:
+            elementos.add(a)
+            elementos.add(b)
+    n = len(elementos)
+    if n < MINIMO_ELEMENTOS or n > MAXIMO_ELEMENTOS:
+        return False
+    return total_pares / (len(relaciones) * n * n) >= UMBRAL_DENSIDAD
+
+
+def indexar_elementos(*relaciones):
+    """
+    Asigna un índice denso a cada elemento que aparece en las relaciones.
+
+    Returns:
+        tuple: (lista de elementos, diccionario elemento -> índice)
+    """
+    indices = {}
+    for relacion in relaciones:
+        for a, b in relacion:
+            if a not in indices:
+                indices[a] = len(indices)
+            if b not in indices:
+                indices[b] = len(indices)
+    return list(indices), indices
+
+
+def a_matriz(relacion, indices):
+    """Convierte una relación de tuplas en una matriz booleana n×n"""
+    n = len(indices)
+    matriz = np.zeros((n, n), dtype=bool)
+    if relacion:
+        filas = np.fromiter((indices[a] for a, _ in relacion), dtype=np.intp, count=len(relacion))
+        columnas = np.fromiter((indices[b] for _, b in relacion), dtype=np.intp, count=len(relacion))
+        matriz[filas, columnas] = True
+    return matriz
+
+
+def a_pares(matriz, elementos):
+    """Convierte una matriz booleana de vuelta a un conjunto de tuplas"""
+    filas, columnas = np.nonzero(matriz)
+    return {(elementos[i], elementos[j]) for i, j in zip(filas.tolist(), columnas.tolist())}
+
+
+def producto_booleano(matriz1, matriz2):
+    """
+    Producto booleano de matrices. Se usa float32 para aprovechar BLAS;
+    el resultado solo se compara contra cero, así que el redondeo no importa.
+    """
+    return (matriz1.astype(np.float32) @ matriz2.astype(np.float32)) > 0
+
+
+def componer(relacion1, relacion2):
+    """Calcula R₁ ∘ R₂ como producto booleano de matrices"""
+    elementos, indices = indexar_elementos(relacion1, relacion2)
+    resultado = producto_booleano(a_matriz(relacion1, indices), a_matriz(relacion2, indices))
+    return a_pares(resultado, elementos)
+
+
+def potencia(relacion, n):
+    """Calcula R^n con cuadrados sucesivos de la matriz booleana"""
+    elementos, indices = indexar_elementos(relacion)
+    base = a_matriz(relacion, indices)
+    resultado = None
+    while True:
+        if n & 1:
+            resultado = base.copy() if resultado is None else producto_booleano(resultado, base)
+        n >>= 1
+        if not n:
+            return a_pares(resultado, elementos)
+        base = producto_booleano(base, base)
+
+
+def contraejemplo_transitividad(relacion):
+    """
+    Verifica R·R ⊆ R. Si falla, reconstruye una terna (a,b,c) violadora.
+
+    Returns:
+        tuple: (a, b, c) que viola la transitividad, o None si R es transitiva
+    """
+    elementos, indices = indexar_elementos(relacion)
+    matriz = a_matriz(relacion, indices)
+    faltantes = producto_booleano(matriz, matriz) & ~matriz
+    if not faltantes.any():
+        return None
+    i, k = (int(x) for x in np.argwhere(faltantes)[0])
+    j = int(np.flatnonzero(matriz[i] & matriz[:, k])[0])
+    return (elementos[i], elementos[j], elementos[k])
@@ -0,0 +1,99 @@
+"""
+Herramientas para relaciones de orden.
+Contiene la verificación indexada de antisimetría, el orden topológico
+(algoritmo de Kahn) y la reducción transitiva de un grafo acíclico, que
+para un orden parcial es el diagrama de Hasse. Los lazos (a,a) se ignoran
+en el orden y en la reducción, ya que un orden parcial los contiene todos.
+"""
+
+from collections import deque
+
+from src.indices import indexar_sucesores
+
+
+def contraejemplo_antisimetria(relacion):
+    """
+    Busca dos pares (a,b) y (b,a) con a ≠ b. Cada par se consulta una vez
+    en la relación, en lugar de compararlo con todos los demás.
+
+    Returns:
+        tuple: (a, b) que viola la antisimetría, o None si R es antisimétrica
+    """
+    for par in relacion:
+        if len(par) == 2:
+            a, b = par
+            if a != b and (b, a) in relacion:
+                return (a, b)
+    return None
+
+
+def orden_topologico(relacion, conjunto=()):
+    """
+    Ordena los elementos de modo que si (a,b) ∈ R con a ≠ b, a va antes que b.
+    Tiempo lineal en |A| + |R|.
+
+    Args:
+        relacion (set): Relación R
+        conjunto (set): Elementos adicionales a incluir en el orden
+
+    Returns:
+        list: Los elementos de A y de R en orden topológico, o None si R
+              tiene un ciclo (y por lo tanto no es un orden parcial)
+    """
+    sucesores = indexar_sucesores(relacion)
+    grados = dict.fromkeys(conjunto, 0)
+    for a, destinos in sucesores.items():
+        grados.setdefault(a, 0)
+        for b in destinos:
+            if b != a:
+                grados[b] = grados.get(b, 0) + 1
+
+    pendientes = deque(elemento for elemento, grado in grados.items() if grado == 0)
+    orden = []
+    while pendientes:
+        a = pendientes.popleft()
+        orden.append(a)
+        for b in sucesores.get(a, ()):
+            if b != a:
+                grados[b] -= 1
+                if grados[b] == 0:
+                    pendientes.append(b)
+
+    if len(orden) < len(grados):
+        return None
+    return orden
+
+
+def reduccion_transitiva(relacion):
+    """
+    Calcula la menor relación con el mismo cierre transitivo que R (sin lazos).
+    Para un orden parcial son las aristas del diagrama de Hasse.
+
+    Se recorren los elementos en orden topológico inverso guardando como
+    máscara de bits lo alcanzable desde cada uno. Los sucesores directos de
+    a se visitan de menor a mayor posición topológica: (a,b) se conserva
+    solo si b no es alcanzable desde un sucesor ya visitado. Un sucesor
+    posterior nunca alcanza a uno anterior, así que basta una pasada.
+
+    Returns:
+        set: Pares de la reducción transitiva, o None si R tiene un ciclo
+    """
+    orden = orden_topologico(relacion)
+    if orden is None:
+        return None
+    posiciones = {elemento: posicion for posicion, elemento in enumerate(orden)}
+    sucesores = indexar_sucesores(relacion)
+
+    alcanzables = [0] * len(orden)
+    reduccion = set()
+    for posicion in range(len(orden) - 1, -1, -1):
+        a = orden[posicion]
+        destinos = sorted(posiciones[b] for b in sucesores.get(a, ()) if b != a)
+        alcanzable = 0
+        for destino in destinos:
+            if not alcanzable >> destino & 1:
+                reduccion.add((a, orden[destino]))
+                alcanzable |= alcanzables[destino]
+        alcanzables[posicion] = alcanzable | (1 << posicion)
+    return reduccion
+
@@ -0,0 +1,239 @@
+"""
+Ejecución en varios procesos de la composición, la potencia y la
+verificación de transitividad para relaciones grandes.
+
+La relación izquierda se agrupa por su primer componente y se reparte en
+rangos de tamaño parecido entre los procesos de un ProcessPoolExecutor.
+Los índices se entregan a cada proceso una sola vez al iniciarlo (con el
+método 'fork' se heredan sin copiarse), y cada tarea solo recibe el rango
+(inicio, fin) que le toca. Por debajo de UMBRAL_PARALELO pares se calcula
+en el proceso actual, para no pagar el arranque del pool.
+
+La potencia usa un solo pool para todos los pasos de los cuadrados
+sucesivos. Como los operandos cambian en cada paso, se escriben una vez en
+un archivo temporal y cada proceso los lee una sola vez por paso.
+"""
+
+import multiprocessing
+import os
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.indices import (
+    indexar_sucesores, componer_indexado, buscar_violacion_transitiva, iterar_violaciones_transitivas
+)
+from src.potencias import potencia_por_cuadrados, componer_serial
+
+
+# Pares de la relación izquierda a partir de los cuales conviene paralelizar
+UMBRAL_PARALELO = 100_000
+
+# Rangos por proceso: más de uno equilibra la carga si hay filas muy largas
+RANGOS_POR_TRABAJADOR = 4
+
+# 'fork' permite heredar los índices sin serializarlos
+METODO_INICIO = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+
+
+# Índices del proceso trabajador, asignados por _inicializar_trabajador o
+# leídos de un archivo de paso (_ruta_cargada indica cuál está en memoria)
+_izquierda = None
+_derecha = None
+_ruta_cargada = None
+
+
+def _inicializar_trabajador(izquierda, derecha):
+    """Guarda los índices compartidos en el proceso trabajador"""
+    global _izquierda, _derecha
+    _izquierda = izquierda
+    _derecha = derecha
+
+
+def _componer_rango(inicio, fin):
+    """Composición de las filas izquierda[inicio:fin] con el índice derecho"""
+    pares = []
+    for a, intermedios in _izquierda[inicio:fin]:
+        destinos = set()
+        for b in intermedios:
+            siguientes = _derecha.get(b)
+            if siguientes:
+                destinos.update(siguientes)
+        pares.extend((a, c) for c in destinos)
+    return pares
+
+
+def _componer_rango_de_archivo(ruta, inicio, fin):
+    """Como _componer_rango, leyendo antes los índices del paso si hace falta"""
+    global _izquierda, _derecha, _ruta_cargada
+    if _ruta_cargada != ruta:
+        with open(ruta, 'rb') as archivo:
+            _izquierda, _derecha = pickle.load(archivo)
+        _ruta_cargada = ruta
+    return _componer_rango(inicio, fin)
+
+
+def _violacion_rango(inicio, fin):
+    """Primera violación de transitividad cuyo primer elemento está en el rango"""
+    return next(iterar_violaciones_transitivas(_derecha, _izquierda[inicio:fin]), None)
+
+
+def resolver_trabajadores(trabajadores):
+    """Número efectivo de procesos (None o 0 = todos los núcleos)"""
+    if not trabajadores:
+        return os.cpu_count() or 1
+    return trabajadores
+
+
+def conviene(relacion, trabajadores):
+    """Indica si vale la pena repartir la relación entre varios procesos"""
+    return resolver_trabajadores(trabajadores) > 1 and len(relacion) >= UMBRAL_PARALELO
+
+
+def dividir_en_rangos(filas, partes):
+    """
+    Divide la lista de filas (a, destinos) en rangos consecutivos con una
+    cantidad parecida de pares cada uno.
+
+    Returns:
+        list: Tuplas (inicio, fin) sobre la lista de filas
+    """
+    total = sum(len(destinos) for _, destinos in filas)
+    objetivo = max(1, total // max(partes, 1))
+    rangos = []
+    inicio = 0
+    acumulado = 0
+    for posicion, (_, destinos) in enumerate(filas):
+        acumulado += len(destinos)
+        if acumulado >= objetivo:
+            rangos.append((inicio, posicion + 1))
+            inicio = posicion + 1
+            acumulado = 0
+    if inicio < len(filas):
+        rangos.append((inicio, len(filas)))
+    return rangos
+
+
+def _crear_pool(trabajadores, izquierda=None, derecha=None):
+    """Crea el pool, con los índices ya cargados en cada proceso si se indican"""
+    contexto = multiprocessing.get_context(METODO_INICIO) if METODO_INICIO else None
+    if izquierda is None:
+        return ProcessPoolExecutor(max_workers=trabajadores, mp_context=contexto)
+    return ProcessPoolExecutor(
+        max_workers=trabajadores,
+        mp_context=contexto,
+        initializer=_inicializar_trabajador,
+        initargs=(izquierda, derecha),
+    )
+
+
+def componer(relacion1, relacion2, trabajadores=None):
+    """
+    Calcula R₁ ∘ R₂ repartiendo las filas de R₁ entre varios procesos.
+
+    Args:
+        relacion1 (set): Relación izquierda R₁
+        relacion2 (set): Relación derecha R₂
+        trabajadores (int): Número de procesos (None = todos los núcleos)
+
+    Returns:
+        set: Conjunto de pares (a,c) de la composición
+    """
+    sucesores2 = indexar_sucesores(relacion2)
+    if not conviene(relacion1, trabajadores):
+        return componer_indexado(relacion1, sucesores2)
+
+    trabajadores = resolver_trabajadores(trabajadores)
+    filas = list(indexar_sucesores(relacion1).items())
+    rangos = dividir_en_rangos(filas, trabajadores * RANGOS_POR_TRABAJADOR)
+    composicion = set()
+    with _crear_pool(trabajadores, filas, sucesores2) as pool:
+        for parcial in pool.map(_componer_rango, *zip(*rangos)):
+            composicion.update(parcial)
+    return composicion
+
+
+class _ComposicionPorPasos:
+    """
+    Compone los pasos de una potencia en un mismo pool, que se crea con el
+    primer paso grande y se reutiliza hasta cerrar. Los pasos pequeños se
+    calculan en el proceso actual.
+    """
+
+    def __init__(self, trabajadores):
+        self.trabajadores = trabajadores
+        self.pool = None
+        self.directorio = None
+        self.pasos = 0
+
+    def __call__(self, relacion1, relacion2):
+        if not conviene(relacion1, self.trabajadores):
+            return componer_serial(relacion1, relacion2)
+        if self.pool is None:
+            self.directorio = tempfile.TemporaryDirectory(prefix='potencia_')
+            self.pool = _crear_pool(self.trabajadores)
+
+        filas = list(indexar_sucesores(relacion1).items())
+        rangos = dividir_en_rangos(filas, self.trabajadores * RANGOS_POR_TRABAJADOR)
+        self.pasos += 1
+        ruta = os.path.join(self.directorio.name, f'paso_{self.pasos}.pickle')
+        with open(ruta, 'wb') as archivo:
+            pickle.dump((filas, indexar_sucesores(relacion2)), archivo, pickle.HIGHEST_PROTOCOL)
+
+        composicion = set()
+        inicios, fines = zip(*rangos)
+        for parcial in self.pool.map(_componer_rango_de_archivo, [ruta] * len(rangos), inicios, fines):
+            composicion.update(parcial)
+        os.remove(ruta)
+        return composicion
+
+    def cerrar(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=True)
+            self.directorio.cleanup()
+
+
+def potencia(relacion, n, trabajadores=None):
+    """
+    Calcula R^n por cuadrados sucesivos repartiendo cada composición grande
+    entre varios procesos de un único pool para toda la potencia.
+    """
+    if not conviene(relacion, trabajadores):
+        return potencia_por_cuadrados(relacion, n)
+    composicion = _ComposicionPorPasos(resolver_trabajadores(trabajadores))
+    try:
+        return potencia_por_cuadrados(relacion, n, componer=composicion)
+    finally:
+        composicion.cerrar()
+
+
+def contraejemplo_transitividad(relacion, trabajadores=None):
+    """
+    Busca una violación de la transitividad repartiendo las filas entre
+    procesos. En cuanto un proceso encuentra una se cancelan los rangos
+    pendientes.
+
+    Returns:
+        tuple: (a, b, c) que viola la transitividad, o None si R es transitiva
+    """
+    sucesores = indexar_sucesores(relacion)
+    if not conviene(relacion, trabajadores):
+        return buscar_violacion_transitiva(sucesores)
+
+    trabajadores = resolver_trabajadores(trabajadores)
+    filas = list(sucesores.items())
+    rangos = dividir_en_rangos(filas, trabajadores * RANGOS_POR_TRABAJADOR)
+    pool = _crear_pool(trabajadores, filas, sucesores)
+    tareas = []
+    try:
+        tareas = [pool.submit(_violacion_rango, inicio, fin) for inicio, fin in rangos]
+        for tarea in as_completed(tareas):
+            violacion = tarea.result()
+            if violacion is not None:
+                return violacion
+        return None
+    finally:
+        # Los rangos que aún no empezaron se descartan (cancel_futures es de 3.9)
+        for tarea in tareas:
+            tarea.cancel()
+        pool.shutdown(wait=True)
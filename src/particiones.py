@@ -0,0 +1,122 @@
+"""
+Clases de equivalencia y cierre de equivalencia con union-find.
+Cada par (a,b) de la relación une las clases de a y b; con compresión de
+caminos y unión por tamaño el costo total es casi lineal en |A| + |R|.
+"""
+
+from src.utilidades import clave_orden
+
+
+class UnionFind:
+    """Estructura de conjuntos disjuntos sobre elementos arbitrarios"""
+
+    def __init__(self, elementos=()):
+        self.indices = {}
+        self.padres = []
+        self.tamanos = []
+        for elemento in elementos:
+            self.agregar(elemento)
+
+    def agregar(self, elemento):
+        """Agrega el elemento como clase propia si no estaba; retorna su índice"""
+        indice = self.indices.get(elemento)
+        if indice is None:
+            indice = len(self.padres)
+            self.indices[elemento] = indice
+            self.padres.append(indice)
+            self.tamanos.append(1)
+        return indice
+
+    def raiz(self, indice):
+        """Raíz de la clase del índice, acortando el camino a la mitad"""
+        padres = self.padres
+        while padres[indice] != indice:
+            padres[indice] = padres[padres[indice]]
+            indice = padres[indice]
+        return indice
+
+    def unir(self, a, b):
+        """Une las clases de los elementos a y b"""
+        raiz_a = self.raiz(self.agregar(a))
+        raiz_b = self.raiz(self.agregar(b))
+        if raiz_a == raiz_b:
+            return
+        if self.tamanos[raiz_a] < self.tamanos[raiz_b]:
+            raiz_a, raiz_b = raiz_b, raiz_a
+        self.padres[raiz_b] = raiz_a
+        self.tamanos[raiz_a] += self.tamanos[raiz_b]
+
+    def clases(self):
+        """Retorna la lista de clases como listas de elementos"""
+        grupos = {}
+        for elemento, indice in self.indices.items():
+            grupos.setdefault(self.raiz(indice), []).append(elemento)
+        return list(grupos.values())
+
+
+def union_find_de(relacion, conjunto=(), restringir=False):
+    """
+    Construye el union-find con los elementos de A y las uniones de R.
+    Con restringir=True solo se usan los pares de R ∩ (A×A), así ningún
+    elemento fuera de A entra en las clases.
+    """
+    particion = UnionFind(conjunto)
+    elementos = particion.indices
+    for par in relacion:
+        if len(par) == 2:
+            a, b = par
+            if restringir and (a not in elementos or b not in elementos):
+                continue
+            particion.unir(a, b)
+    return particion
+
+
+def clases_equivalencia(relacion, conjunto=None):
+    """
+    Calcula el conjunto cociente A/R.
+    Si R no es de equivalencia, las clases son las de su cierre de
+    equivalencia (la menor relación de equivalencia que contiene a R).
+    Si se indica A, solo cuentan los pares de R entre elementos de A.
+
+    Args:
+        relacion (set): Relación R
+        conjunto (set): Conjunto A (None = los elementos que aparecen en R)
+
+    Returns:
+        tuple: (clases, representantes) donde clases es una lista de
+               frozensets ordenada por representante, y representantes asocia
+               cada elemento con el menor elemento de su clase
+    """
+    clases = []
+    representantes = {}
+    if conjunto is None:
+        particion = union_find_de(relacion)
+    else:
+        particion = union_find_de(relacion, conjunto, restringir=True)
+    for grupo in particion.clases():
+        representante = min(grupo, key=clave_orden)
+        clases.append((representante, frozenset(grupo)))
+        for elemento in grupo:
+            representantes[elemento] = representante
+    clases.sort(key=lambda clase: clave_orden(clase[0]))
+    return [clase for _, clase in clases], representantes
+
+
+def cierre_equivalencia(relacion, conjunto=()):
+    """
+    Calcula el cierre de equivalencia de R: la menor relación reflexiva,
+    simétrica y transitiva que la contiene. Sale directamente de las
+    clases del union-find, sin calcular antes R⁺.
+
+    Args:
+        relacion (set): Relación R
+        conjunto (set): Conjunto A sobre el que el cierre es reflexivo
+            (los elementos de R se incluyen siempre)
+
+    Returns:
+        set: Pares (a,b) con a y b en la misma clase
+    """
+    cierre = set()
+    for grupo in union_find_de(relacion, conjunto).clases():
+        cierre.update((a, b) for a in grupo for b in grupo)
+    return cierre
@@ -0,0 +1,192 @@
+"""
+Perfil completo de una relación en una sola pasada.
+Un único recorrido de R construye los índices de sucesores y predecesores
+y, al mismo tiempo, detecta los contraejemplos de las propiedades que solo
+dependen de cada par. El resto se obtiene de los índices ya construidos.
+Si R es una Relacion sus índices ya existen y la pasada solo revisa lazos
+y pares espejo.
+"""
+
+from src.indices import buscar_violacion_transitiva
+from src.relacion import Relacion
+
+
+# Propiedades del perfil en el orden en que se reportan
+PROPIEDADES = (
+    'reflexiva', 'irreflexiva', 'simetrica', 'antisimetrica', 'transitiva',
+    'funcional', 'inyectiva', 'total', 'sobreyectiva',
+)
+
+# Nombres para mostrar de cada propiedad
+NOMBRES_PROPIEDADES = {
+    'reflexiva': 'Reflexiva en A', 'irreflexiva': 'Irreflexiva',
+    'simetrica': 'Simétrica', 'antisimetrica': 'Antisimétrica',
+    'transitiva': 'Transitiva', 'funcional': 'Funcional',
+    'inyectiva': 'Inyectiva', 'total': 'Total en A',
+    'sobreyectiva': 'Sobreyectiva en A',
+}
+
+
+def perfil_relacion(relacion, conjunto):
+    """
+    Evalúa todas las propiedades de R ⊆ A×A con sus contraejemplos.
+
+    Contraejemplos (tuplas):
+        reflexiva      (a,)        a ∈ A con (a,a) ∉ R
+        irreflexiva    (a,)        (a,a) ∈ R
+        simetrica      (a, b)      (a,b) ∈ R y (b,a) ∉ R
+        antisimetrica  (a, b)      (a,b), (b,a) ∈ R con a ≠ b
+        transitiva     (a, b, c)   (a,b), (b,c) ∈ R y (a,c) ∉ R
+        funcional      (a, b, c)   (a,b), (a,c) ∈ R con b ≠ c
+        inyectiva      (a, b, c)   (a,c), (b,c) ∈ R con a ≠ b
+        total          (a,)        a ∈ A sin imagen
+        sobreyectiva   (b,)        b ∈ A sin preimagen
+
+    Args:
+        relacion (set): Relación R
+        conjunto (set): Conjunto A
+
+    Returns:
+        dict: propiedad -> {'cumple': bool, 'contraejemplo': tuple o None},
+              más 'pares', 'dominio' y 'rango' con los tamaños
+    """
+    if isinstance(relacion, Relacion):
+        return _perfil_indexado(relacion, conjunto)
+
+    sucesores = {}
+    predecesores = {}
+    lazo = sin_espejo = par_simetrico = dos_imagenes = dos_preimagenes = None
+
+    for par in relacion:
+        if len(par) != 2:
+            continue
+        a, b = par
+
+        destinos = sucesores.get(a)
+        if destinos is None:
+            sucesores[a] = {b}
+        else:
+            if dos_imagenes is None and b not in destinos:
+                dos_imagenes = (a, next(iter(destinos)), b)
+            destinos.add(b)
+
+        origenes = predecesores.get(b)
+        if origenes is None:
+            predecesores[b] = {a}
+        else:
+            if dos_preimagenes is None and a not in origenes:
+                dos_preimagenes = (next(iter(origenes)), a, b)
+            origenes.add(a)
+
+        if a == b:
+            if lazo is None:
+                lazo = (a,)
+        elif (b, a) in relacion:
+            if par_simetrico is None:
+                par_simetrico = (a, b)
+        elif sin_espejo is None:
+            sin_espejo = (a, b)
+
+    return _armar_perfil(relacion, conjunto, sucesores, predecesores, {
+        'irreflexiva': lazo,
+        'simetrica': sin_espejo,
+        'antisimetrica': par_simetrico,
+        'funcional': dos_imagenes,
+        'inyectiva': dos_preimagenes,
+    })
+
+
+def _perfil_indexado(relacion, conjunto):
+    """Perfil de una Relacion a partir de sus índices ya construidos"""
+    sucesores = relacion.sucesores
+    predecesores = relacion.predecesores
+    lazo = sin_espejo = par_simetrico = None
+    for a, destinos in sucesores.items():
+        for b in destinos:
+            if a == b:
+                if lazo is None:
+                    lazo = (a,)
+            elif a in sucesores.get(b, ()):
+                if par_simetrico is None:
+                    par_simetrico = (a, b)
+            elif sin_espejo is None:
+                sin_espejo = (a, b)
+        if lazo is not None and sin_espejo is not None and par_simetrico is not None:
+            break
+
+    dos_preimagenes = _con_dos_valores(predecesores)
+    if dos_preimagenes is not None:
+        c, a, b = dos_preimagenes
+        dos_preimagenes = (a, b, c)
+
+    return _armar_perfil(relacion, conjunto, sucesores, predecesores, {
+        'irreflexiva': lazo,
+        'simetrica': sin_espejo,
+        'antisimetrica': par_simetrico,
+        'funcional': _con_dos_valores(sucesores),
+        'inyectiva': dos_preimagenes,
+    })
+
+
+def _con_dos_valores(indice):
+    """Primera entrada del índice con dos valores, como (clave, x, y)"""
+    for clave, valores in indice.items():
+        if len(valores) > 1:
+            iterador = iter(valores)
+            return (clave, next(iterador), next(iterador))
+    return None
+
+
+def _armar_perfil(relacion, conjunto, sucesores, predecesores, por_pares):
+    """Completa los contraejemplos que dependen de A y arma el resultado"""
+    contraejemplos = dict(por_pares)
+    contraejemplos.update({
+        'reflexiva': _primero_sin(conjunto, lambda a: a in sucesores and a in sucesores[a]),
+        'transitiva': buscar_violacion_transitiva(sucesores),
+        'total': _primero_sin(conjunto, lambda a: a in sucesores),
+        'sobreyectiva': _primero_sin(conjunto, lambda b: b in predecesores),
+    })
+
+    perfil = {
+        propiedad: {'cumple': contraejemplos[propiedad] is None,
+                    'contraejemplo': contraejemplos[propiedad]}
+        for propiedad in PROPIEDADES
+    }
+    perfil['pares'] = len(relacion)
+    perfil['dominio'] = len(sucesores)
+    perfil['rango'] = len(predecesores)
+    return perfil
+
+
+def _primero_sin(conjunto, condicion):
+    """Primer elemento del conjunto que no cumple la condición, como tupla (x,)"""
+    for elemento in conjunto:
+        if not condicion(elemento):
+            return (elemento,)
+    return None
+
+
+def describir_contraejemplo(propiedad, contraejemplo, nombre='R', nombre_conjunto='A'):
+    """Texto legible del contraejemplo de una propiedad"""
+    if propiedad == 'reflexiva':
+        return f"{contraejemplo[0]} ∈ {nombre_conjunto} pero ({contraejemplo[0]},{contraejemplo[0]}) ∉ {nombre}"
+    if propiedad == 'irreflexiva':
+        return f"({contraejemplo[0]},{contraejemplo[0]}) ∈ {nombre}"
+    if propiedad == 'simetrica':
+        a, b = contraejemplo
+        return f"({a},{b}) ∈ {nombre} pero ({b},{a}) ∉ {nombre}"
+    if propiedad == 'antisimetrica':
+        a, b = contraejemplo
+        return f"({a},{b}) ∈ {nombre} y ({b},{a}) ∈ {nombre} con {a} ≠ {b}"
+    if propiedad == 'transitiva':
+        a, b, c = contraejemplo
+        return f"({a},{b}) ∈ {nombre} y ({b},{c}) ∈ {nombre} pero ({a},{c}) ∉ {nombre}"
+    if propiedad == 'funcional':
+        a, b, c = contraejemplo
+        return f"({a},{b}) ∈ {nombre} y ({a},{c}) ∈ {nombre}: {a} tiene dos imágenes"
+    if propiedad == 'inyectiva':
+        a, b, c = contraejemplo
+        return f"({a},{c}) ∈ {nombre} y ({b},{c}) ∈ {nombre}: {c} tiene dos preimágenes"
+    if propiedad == 'total':
+        return f"{contraejemplo[0]} ∈ {nombre_conjunto} no tiene imagen"
+    return f"{contraejemplo[0]} ∈ {nombre_conjunto} no tiene preimagen"
@@ -0,0 +1,182 @@
+"""
+Instrumentación opcional de las operaciones de OperadorConjuntos.
+Registra por operación el número de llamadas, la latencia acumulada y
+máxima, y los tamaños de entrada y salida.
+
+Se activa con la opción --perfil de main.py o con la variable de entorno
+CONJUNTOS_PERFIL (=1 para el archivo por defecto, o la ruta del archivo).
+Los métodos solo se envuelven al activarla: desactivada no agrega ningún
+costo a las llamadas.
+"""
+
+import atexit
+import functools
+import json
+import os
+import time
+
+from src.cache import tamano_resultado
+
+
+VARIABLE_ENTORNO = 'CONJUNTOS_PERFIL'
+ARCHIVO_POR_DEFECTO = 'perfil_operaciones.json'
+
+# Métodos de OperadorConjuntos que se instrumentan
+OPERACIONES_PERFILADAS = (
+    'union_conjuntos', 'interseccion_conjuntos', 'diferencia_conjuntos',
+    'complemento_conjunto', 'producto_cartesiano',
+    'es_reflexiva', 'es_simetrica', 'es_transitiva', 'contraejemplo_transitividad',
+    'potencia_relacion', 'composicion_relaciones',
+    'cierre_transitivo', 'cierre_reflexivo_transitivo', 'operacion_bin',
+    'clases_equivalencia', 'cierre_equivalencia',
+    'contraejemplo_antisimetria', 'orden_topologico', 'reduccion_transitiva',
+    'composicion_con_testigos', 'potencia_con_caminos', 'violaciones_transitividad',
+    'perfil_relacion',
+)
+
+
+class EstadisticaOperacion:
+    """Contadores acumulados de una operación"""
+
+    __slots__ = ('llamadas', 'segundos_total', 'segundos_maximo',
+                 'elementos_entrada', 'elementos_salida', 'salida_maxima')
+
+    def __init__(self):
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Pone los contadores en cero"""
+        self.llamadas = 0
+        self.segundos_total = 0.0
+        self.segundos_maximo = 0.0
+        self.elementos_entrada = 0
+        self.elementos_salida = 0
+        self.salida_maxima = 0
+
+    def registrar(self, segundos, entrada, salida):
+        """Agrega una llamada a los contadores"""
+        self.llamadas += 1
+        self.segundos_total += segundos
+        if segundos > self.segundos_maximo:
+            self.segundos_maximo = segundos
+        self.elementos_entrada += entrada
+        self.elementos_salida += salida
+        if salida > self.salida_maxima:
+            self.salida_maxima = salida
+
+    def a_diccionario(self):
+        """Retorna los contadores y los promedios como diccionario"""
+        return {
+            'llamadas': self.llamadas,
+            'ms_total': round(self.segundos_total * 1000, 3),
+            'ms_promedio': round(self.segundos_total * 1000 / self.llamadas, 3) if self.llamadas else 0.0,
+            'ms_maximo': round(self.segundos_maximo * 1000, 3),
+            'entrada_promedio': self.elementos_entrada / self.llamadas if self.llamadas else 0,
+            'salida_promedio': self.elementos_salida / self.llamadas if self.llamadas else 0,
+            'salida_maxima': self.salida_maxima,
+        }
+
+
+def tamano_argumentos(argumentos):
+    """Suma los tamaños de los argumentos que son conjuntos o relaciones"""
+    total = 0
+    for argumento in argumentos:
+        if hasattr(argumento, '__len__'):
+            total += len(argumento)
+    return total
+
+
+class Perfilador:
+    """Acumula las estadísticas de las operaciones de un operador"""
+
+    def __init__(self, ruta=None):
+        """
+        Args:
+            ruta (str): Archivo JSON donde volcar las estadísticas al salir (opcional)
+        """
+        self.ruta = ruta
+        self.operaciones = {}
+
+    def envolver(self, nombre, metodo):
+        """Retorna el método envuelto para registrar cada llamada"""
+        estadistica = self.operaciones.setdefault(nombre, EstadisticaOperacion())
+
+        @functools.wraps(metodo)
+        def envoltura(*args, **kwargs):
+            inicio = time.perf_counter()
+            resultado = metodo(*args, **kwargs)
+            segundos = time.perf_counter() - inicio
+            estadistica.registrar(segundos, tamano_argumentos(args), tamano_resultado(resultado))
+            return resultado
+        return envoltura
+
+    def estadisticas(self):
+        """
+        Retorna las estadísticas de las operaciones llamadas al menos una vez,
+        de mayor a menor tiempo acumulado.
+        """
+        llamadas = [(nombre, estadistica) for nombre, estadistica in self.operaciones.items()
+                    if estadistica.llamadas]
+        llamadas.sort(key=lambda item: item[1].segundos_total, reverse=True)
+        return {nombre: estadistica.a_diccionario() for nombre, estadistica in llamadas}
+
+    def reiniciar(self):
+        """Pone todos los contadores en cero (los envoltorios siguen activos)"""
+        for estadistica in self.operaciones.values():
+            estadistica.reiniciar()
+
+    def volcar(self, ruta=None, cache=None):
+        """
+        Escribe las estadísticas en un archivo JSON.
+
+        Args:
+            ruta (str): Archivo de destino (por defecto el indicado al crearlo)
+            cache (dict): Estadísticas de la caché a incluir (opcional)
+        """
+        ruta = ruta or self.ruta
+        if ruta is None:
+            return
+        documento = {'operaciones': self.estadisticas()}
+        if cache is not None:
+            documento['cache'] = cache
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            json.dump(documento, archivo, ensure_ascii=False, indent=2)
+
+
+def ruta_desde_entorno():
+    """Ruta de volcado indicada por CONJUNTOS_PERFIL, o None si no está activa"""
+    valor = os.environ.get(VARIABLE_ENTORNO, '').strip()
+    if not valor or valor.lower() in ('0', 'no', 'false'):
+        return None
+    if valor.lower() in ('1', 'si', 'sí', 'yes', 'true'):
+        return ARCHIVO_POR_DEFECTO
+    return valor
+
+
+def activar_perfilado(operador, ruta=None):
+    """
+    Instrumenta las operaciones del operador y, si se indica una ruta,
+    programa el volcado de las estadísticas al terminar el programa.
+    Los envoltorios se asignan en la instancia, sin modificar la clase.
+
+    Returns:
+        Perfilador: El perfilador asociado al operador
+    """
+    if operador.perfilador is not None:
+        return operador.perfilador
+
+    perfilador = Perfilador(ruta)
+    # Las llamadas internas (p. ej. es_transitiva → contraejemplo_transitividad)
+    # pasan por el atributo de la instancia, así que también se registran
+    for nombre in OPERACIONES_PERFILADAS:
+        setattr(operador, nombre, perfilador.envolver(nombre, getattr(operador, nombre)))
+    operador.perfilador = perfilador
+
+    if ruta is not None:
+        def volcar_al_salir():
+            try:
+                perfilador.volcar(cache=operador.estadisticas_cache())
+            except OSError as error:
+                print(f"No se pudo guardar el perfil en '{ruta}': {error}")
+        atexit.register(volcar_al_salir)
+    return perfilador
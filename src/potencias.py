@@ -0,0 +1,126 @@
+"""
+Cálculo eficiente de potencias de relaciones.
+Contiene la exponenciación por cuadrados y la detección, sobre los mismos
+cuadrados, del ciclo en el que las potencias de una relación finita
+empiezan a repetirse.
+"""
+
+from src.indices import indexar_sucesores, componer_indexado
+
+
+# Máscara para acumular las huellas en 64 bits
+MASCARA_HUELLA = (1 << 64) - 1
+
+
+class CicloPotencias:
+    """
+    Describe la secuencia periódica R^1, R^2, ... de una relación finita.
+    A partir de R^inicio las potencias se repiten cada 'periodo' pasos.
+    Solo guarda los dos exponentes, nunca las potencias.
+    """
+
+    def __init__(self, inicio, periodo):
+        """
+        Args:
+            inicio (int): Exponente a partir del cual la secuencia es periódica
+            periodo (int): Longitud del ciclo (no necesariamente la mínima)
+        """
+        self.inicio = inicio
+        self.periodo = periodo
+
+    def reducir(self, n):
+        """Retorna el menor exponente m ≤ n con R^m = R^n según el ciclo"""
+        if n >= self.inicio:
+            n = self.inicio + (n - self.inicio) % self.periodo
+        return n
+
+
+def huella(relacion):
+    """
+    Resumen de una relación para compararla sin guardarla: su tamaño y dos
+    sumas independientes de 64 bits de los hashes de sus pares. Dos relaciones
+    distintas con la misma huella son prácticamente imposibles.
+
+    Returns:
+        tuple: (tamaño, suma1, suma2)
+    """
+    suma1 = suma2 = 0
+    for par in relacion:
+        h = hash(par)
+        suma1 += hash((h, 1))
+        suma2 += hash((h, 2))
+    return (len(relacion), suma1 & MASCARA_HUELLA, suma2 & MASCARA_HUELLA)
+
+
+def componer_serial(relacion1, relacion2):
+    """Composición R₁ ∘ R₂ por hash-join en el proceso actual"""
+    return componer_indexado(relacion1, indexar_sucesores(relacion2))
+
+
+def potencia_por_cuadrados(relacion, n, componer=componer_serial, al_elevar=None):
+    """
+    Calcula R^n con O(log n) composiciones mediante cuadrados sucesivos.
+
+    Args:
+        relacion (set): Relación R
+        n (int): Exponente entero positivo
+        componer (function): Función (R₁, R₂) -> R₁ ∘ R₂ a usar en cada paso
+        al_elevar (function): Si se indica, se llama con (2^k, R^(2^k)) por
+            cada cuadrado calculado, empezando por (1, R)
+
+    Returns:
+        set: La relación R^n
+    """
+    resultado = None
+    base = relacion
+    exponente = 1
+    while True:
+        if al_elevar is not None:
+            al_elevar(exponente, base)
+        if n & 1:
+            if resultado is None:
+                resultado = set(base) if base is relacion else base
+            else:
+                resultado = componer(resultado, base)
+        n >>= 1
+        if not n:
+            return resultado
+        base = componer(base, base)
+        exponente *= 2
+
+
+def potencia_detectando_ciclo(relacion, n, componer=componer_serial):
+    """
+    Calcula R^n por cuadrados y, con las mismas composiciones, busca un ciclo:
+    si R^(2^j) = R^(2^k) con j < k, para todo m ≥ 2^j vale R^m = R^(m + 2^k - 2^j).
+    Los cuadrados se comparan por su huella, así que solo se conserva un
+    resumen de tamaño fijo por cuadrado además de los conjuntos en curso.
+    Al detectar el ciclo se hace una composición más, R^(2^k) ∘ R, para ver si
+    las potencias ya se estabilizaron (periodo 1), el caso más común.
+
+    Args:
+        relacion (set): Relación R
+        n (int): Exponente entero positivo
+        componer (function): Función (R₁, R₂) -> R₁ ∘ R₂ a usar en cada paso
+
+    Returns:
+        tuple: (R^n como set, CicloPotencias o None si ningún cuadrado se repitió)
+    """
+    vistas = {}
+    ciclo = []
+
+    def registrar(exponente, base):
+        if ciclo:
+            return
+        clave = huella(base)
+        anterior = vistas.get(clave)
+        if anterior is None:
+            vistas[clave] = exponente
+            return
+        periodo = exponente - anterior
+        if periodo > 1 and huella(componer(base, relacion)) == clave:
+            periodo = 1
+        ciclo.append(CicloPotencias(anterior, periodo))
+
+    resultado = potencia_por_cuadrados(relacion, n, componer, al_elevar=registrar)
+    return resultado, (ciclo[0] if ciclo else None)
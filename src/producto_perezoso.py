@@ -0,0 +1,80 @@
+"""
+Producto cartesiano perezoso.
+Representa A × B sin construir los |A|·|B| pares: la pertenencia y el
+tamaño se responden en O(1) y los pares se generan solo al iterar.
+"""
+
+from collections.abc import Set
+
+
+class ProductoCartesiano(Set):
+    """
+    Vista inmutable de A × B que se comporta como un conjunto de pares.
+    Las operaciones de conjunto heredadas de Set (&, -, <=, ==) recorren el
+    otro operando y consultan la pertenencia, sin materializar el producto.
+    """
+
+    def __init__(self, conjunto1, conjunto2, copiar=True):
+        """
+        Args:
+            conjunto1 (set): Conjunto A (primer componente)
+            conjunto2 (set): Conjunto B (segundo componente)
+            copiar (bool): Si es False se usan los conjuntos dados sin copiarlos
+                           (solo para vistas temporales)
+        """
+        if copiar:
+            # Copias inmutables para que la vista no cambie si los originales cambian
+            conjunto1 = frozenset(conjunto1)
+            conjunto2 = frozenset(conjunto2)
+        self.conjunto1 = conjunto1
+        self.conjunto2 = conjunto2
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        """Los resultados de las operaciones de conjunto son sets normales"""
+        return set(iterable)
+
+    def __contains__(self, par):
+        try:
+            a, b = par
+        except (TypeError, ValueError):
+            return False
+        return a in self.conjunto1 and b in self.conjunto2
+
+    def __len__(self):
+        return len(self.conjunto1) * len(self.conjunto2)
+
+    def __iter__(self):
+        for elemento1 in self.conjunto1:
+            for elemento2 in self.conjunto2:
+                yield (elemento1, elemento2)
+
+    def __repr__(self):
+        return f"ProductoCartesiano({set(self.conjunto1)!r}, {set(self.conjunto2)!r})"
+
+    # No es hashable: el hash de Set recorre los |A|·|B| pares, y uno basado
+    # en los factores no coincidiría con el de un frozenset igual (ni entre
+    # productos vacíos distintos). Para usarlo como clave, materializarlo.
+    __hash__ = None
+
+    # === MÉTODOS CON NOMBRE COMPATIBLES CON set ===
+
+    def intersection(self, otro):
+        """Filtra los pares de 'otro' que pertenecen al producto en O(|otro|)"""
+        return {par for par in otro if par in self}
+
+    def union(self, otro):
+        """Une el producto con otro conjunto (materializa el resultado)"""
+        return set(self).union(otro)
+
+    def difference(self, otro):
+        """Pares del producto que no están en 'otro'"""
+        return {par for par in self if par not in otro}
+
+    def copy(self):
+        """La vista es inmutable, por lo que puede compartirse"""
+        return self
+
+    def materializar(self):
+        """Construye explícitamente el conjunto de todos los pares"""
+        return set(self)
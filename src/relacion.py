@@ -0,0 +1,118 @@
+"""
+Relación inmutable con índices precalculados.
+Relacion es un frozenset de pares que construye su dominio, su rango y sus
+mapas de sucesores y predecesores la primera vez que se piden y los
+conserva. Como no puede modificarse, los índices nunca quedan desactualizados
+y las operaciones repetidas sobre la misma relación guardada dejan de
+reconstruirlos. El hash lo calcula y guarda el propio frozenset.
+"""
+
+
+class Relacion(frozenset):
+    """
+    Conjunto inmutable de pares (a,b) con índices perezosos.
+    Se comporta como un frozenset en pertenencia, recorrido, igualdad y hash;
+    los índices se construyen juntos en una sola pasada. Los mapas de
+    sucesores y predecesores no deben modificarse (sus valores son frozensets).
+    """
+
+    __slots__ = ('_sucesores', '_predecesores')
+
+    def __new__(cls, pares=()):
+        """
+        Args:
+            pares (iterable): Pares ordenados (a,b)
+        """
+        relacion = super().__new__(cls, pares)
+        relacion._sucesores = None
+        relacion._predecesores = None
+        return relacion
+
+    @classmethod
+    def desde(cls, relacion):
+        """Retorna la relación si ya es una Relacion; si no, la convierte"""
+        if isinstance(relacion, cls):
+            return relacion
+        return cls(relacion)
+
+    def __reduce__(self):
+        """Al serializar se envían solo los pares, no los índices"""
+        return (type(self), (frozenset(self),))
+
+    def __repr__(self):
+        return f"Relacion({len(self)} pares)"
+
+    def _indexar(self):
+        """Construye los mapas de sucesores y predecesores en una sola pasada"""
+        sucesores = {}
+        predecesores = {}
+        for par in self:
+            if len(par) == 2:  # Ignorar elementos que no sean pares ordenados
+                a, b = par
+                sucesores.setdefault(a, set()).add(b)
+                predecesores.setdefault(b, set()).add(a)
+        self._sucesores = {a: frozenset(destinos) for a, destinos in sucesores.items()}
+        self._predecesores = {b: frozenset(origenes) for b, origenes in predecesores.items()}
+
+    @property
+    def sucesores(self):
+        """dict: a -> frozenset de b tales que (a,b) ∈ R"""
+        if self._sucesores is None:
+            self._indexar()
+        return self._sucesores
+
+    @property
+    def predecesores(self):
+        """dict: b -> frozenset de a tales que (a,b) ∈ R"""
+        if self._predecesores is None:
+            self._indexar()
+        return self._predecesores
+
+    @property
+    def dominio(self):
+        """Vista de los elementos a con algún (a,b) ∈ R"""
+        return self.sucesores.keys()
+
+    @property
+    def rango(self):
+        """Vista de los elementos b con algún (a,b) ∈ R"""
+        return self.predecesores.keys()
+
+    # Los resultados de operar una relación son sets normales, como en el
+    # resto de las operaciones del programa
+
+    def copy(self):
+        """Retorna los pares como set de tuplas"""
+        return set(self)
+
+    def union(self, *otros):
+        return set(self).union(*otros)
+
+    def intersection(self, *otros):
+        return set(self).intersection(*otros)
+
+    def difference(self, *otros):
+        return set(self).difference(*otros)
+
+    def symmetric_difference(self, otro):
+        return set(self).symmetric_difference(otro)
+
+    def __or__(self, otro):
+        if not isinstance(otro, (set, frozenset)):
+            return NotImplemented
+        return set(self).union(otro)
+
+    def __and__(self, otro):
+        if not isinstance(otro, (set, frozenset)):
+            return NotImplemented
+        return set(self).intersection(otro)
+
+    def __sub__(self, otro):
+        if not isinstance(otro, (set, frozenset)):
+            return NotImplemented
+        return set(self).difference(otro)
+
+    def __xor__(self, otro):
+        if not isinstance(otro, (set, frozenset)):
+            return NotImplemented
+        return set(self).symmetric_difference(otro)
@@ -0,0 +1,231 @@
+"""
+Representación de relaciones como matrices de bits.
+Cada elemento del universo se interna con un índice entero denso y cada
+fila de la relación se guarda como un entero de precisión arbitraria.
+"""
+
+
+class TablaElementos:
+    """Tabla de internado: asigna a cada elemento un índice entero denso"""
+
+    def __init__(self, elementos=()):
+        """Inicializa la tabla con los elementos dados (normalmente el universo U)"""
+        self.elementos = []
+        self.indices = {}
+        for elemento in elementos:
+            self.internar(elemento)
+
+    def internar(self, elemento):
+        """Retorna el índice del elemento, agregándolo a la tabla si no existe"""
+        indice = self.indices.get(elemento)
+        if indice is None:
+            indice = len(self.elementos)
+            self.indices[elemento] = indice
+            self.elementos.append(elemento)
+        return indice
+
+    def mascara(self, conjunto):
+        """
+        Convierte un conjunto en una máscara de bits sobre la tabla.
+        Los elementos que no están en la tabla se ignoran.
+        """
+        mascara = 0
+        for elemento in conjunto:
+            indice = self.indices.get(elemento)
+            if indice is not None:
+                mascara |= 1 << indice
+        return mascara
+
+    def __len__(self):
+        return len(self.elementos)
+
+
+def iterar_bits(mascara):
+    """Genera los índices de los bits encendidos de una máscara, de menor a mayor"""
+    while mascara:
+        bit_bajo = mascara & -mascara
+        yield bit_bajo.bit_length() - 1
+        mascara ^= bit_bajo
+
+
+def contar_bits(mascara):
+    """Cuenta los bits encendidos de una máscara"""
+    return bin(mascara).count('1')
+
+
+class RelacionBits:
+    """
+    Relación almacenada como matriz de bits sobre una TablaElementos.
+    filas[i] tiene encendido el bit j si (elementos[i], elementos[j]) ∈ R.
+
+    Se comporta como un conjunto de pares (iteración, 'in', len), por lo que
+    puede pasarse a OperadorConjuntos y a las funciones de utilidades.
+    """
+
+    def __init__(self, tabla=None, filas=None):
+        """
+        Args:
+            tabla (TablaElementos): Tabla de internado compartida (opcional)
+            filas (list): Lista de máscaras, una por elemento de la tabla (opcional)
+        """
+        self.tabla = tabla if tabla is not None else TablaElementos()
+        self.filas = list(filas) if filas is not None else []
+        self._ajustar_filas()
+
+    @classmethod
+    def desde_pares(cls, relacion, universo=(), tabla=None):
+        """
+        Construye una RelacionBits a partir de un conjunto de tuplas.
+
+        Args:
+            relacion (set): Conjunto de pares ordenados
+            universo (iterable): Elementos a internar primero (normalmente U)
+            tabla (TablaElementos): Tabla existente a reutilizar (opcional)
+
+        Returns:
+            RelacionBits: La relación equivalente
+        """
+        if tabla is None:
+            tabla = TablaElementos(universo)
+        else:
+            for elemento in universo:
+                tabla.internar(elemento)
+
+        filas = {}
+        for par in relacion:
+            if len(par) == 2:
+                origen = tabla.internar(par[0])
+                destino = tabla.internar(par[1])
+                filas[origen] = filas.get(origen, 0) | (1 << destino)
+
+        resultado = cls(tabla)
+        for origen, fila in filas.items():
+            resultado.filas[origen] = fila
+        return resultado
+
+    def _ajustar_filas(self):
+        """Agrega filas vacías si la tabla creció desde la última operación"""
+        faltantes = len(self.tabla) - len(self.filas)
+        if faltantes > 0:
+            self.filas.extend([0] * faltantes)
+
+    def _filas_en_tabla(self, otra):
+        """Retorna las filas de otra relación expresadas sobre la tabla de esta"""
+        if otra.tabla is self.tabla:
+            self._ajustar_filas()
+            otra._ajustar_filas()
+            return otra.filas
+        convertida = RelacionBits.desde_pares(otra, tabla=self.tabla)
+        self._ajustar_filas()
+        return convertida.filas
+
+    # === CONVERSIÓN Y PROTOCOLO DE CONJUNTO ===
+
+    def a_pares(self):
+        """Convierte la relación al formato de conjunto de tuplas"""
+        return set(self)
+
+    def __iter__(self):
+        elementos = self.tabla.elementos
+        for origen, fila in enumerate(self.filas):
+            if fila:
+                a = elementos[origen]
+                for destino in iterar_bits(fila):
+                    yield (a, elementos[destino])
+
+    def __contains__(self, par):
+        try:
+            a, b = par
+        except (TypeError, ValueError):
+            return False
+        origen = self.tabla.indices.get(a)
+        destino = self.tabla.indices.get(b)
+        if origen is None or destino is None or origen >= len(self.filas):
+            return False
+        return bool(self.filas[origen] >> destino & 1)
+
+    def __len__(self):
+        return sum(contar_bits(fila) for fila in self.filas)
+
+    def __eq__(self, otra):
+        if isinstance(otra, RelacionBits):
+            return self.filas_normalizadas() == RelacionBits(self.tabla, self._filas_en_tabla(otra)).filas_normalizadas()
+        if isinstance(otra, (set, frozenset)):
+            return self.a_pares() == otra
+        return NotImplemented
+
+    __hash__ = None
+
+    def filas_normalizadas(self):
+        """Retorna las filas sin las filas vacías finales (para comparar)"""
+        filas = list(self.filas)
+        while filas and not filas[-1]:
+            filas.pop()
+        return filas
+
+    def copy(self):
+        """Retorna una copia independiente que comparte la tabla de elementos"""
+        return RelacionBits(self.tabla, self.filas)
+
+    def __repr__(self):
+        return f"RelacionBits({self.a_pares()!r})"
+
+    # === OPERACIONES ===
+
+    def transpuesta(self):
+        """Calcula la relación inversa R⁻¹"""
+        self._ajustar_filas()
+        filas = [0] * len(self.filas)
+        for origen, fila in enumerate(self.filas):
+            bit_origen = 1 << origen
+            for destino in iterar_bits(fila):
+                filas[destino] |= bit_origen
+        return RelacionBits(self.tabla, filas)
+
+    def componer(self, otra):
+        """
+        Calcula R ∘ S: cada fila del resultado es el OR de las filas de S
+        indicadas por los bits de la fila correspondiente de R.
+        """
+        filas_otra = self._filas_en_tabla(otra)
+        filas = []
+        for fila in self.filas:
+            acumulada = 0
+            for intermedio in iterar_bits(fila):
+                acumulada |= filas_otra[intermedio]
+            filas.append(acumulada)
+        return RelacionBits(self.tabla, filas)
+
+    def es_reflexiva(self, conjunto):
+        """Verifica que (a,a) ∈ R para todo a del conjunto"""
+        self._ajustar_filas()
+        for elemento in conjunto:
+            indice = self.tabla.indices.get(elemento)
+            if indice is None or not self.filas[indice] >> indice & 1:
+                return False
+        return True
+
+    def es_simetrica(self):
+        """Verifica que R coincida con su transpuesta"""
+        return self.filas_normalizadas() == self.transpuesta().filas_normalizadas()
+
+    def contraejemplo_transitividad(self):
+        """
+        Busca (a,b,c) con (a,b),(b,c) ∈ R y (a,c) ∉ R.
+        Para cada b en la fila de a basta comprobar filas[b] & ~filas[a].
+
+        Returns:
+            tuple: La primera terna que viola la transitividad, o None
+        """
+        elementos = self.tabla.elementos
+        for origen, fila in enumerate(self.filas):
+            for intermedio in iterar_bits(fila):
+                faltantes = self.filas[intermedio] & ~fila
+                if faltantes:
+                    destino = next(iterar_bits(faltantes))
+                    return (elementos[origen], elementos[intermedio], elementos[destino])
+        return None
+
+    def es_transitiva(self):
+        """Verifica si la relación es transitiva"""
+        return self.contraejemplo_transitividad() is None
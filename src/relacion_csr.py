@@ -0,0 +1,186 @@
+"""
+Almacenamiento compacto de relaciones grandes en formato CSR.
+Los elementos se internan en una TablaElementos y los pares se guardan en
+dos arreglos de enteros: desplazamientos por fila y destinos ordenados.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Set
+
+from src.relacion_bits import TablaElementos
+
+
+def tipo_indices(cantidad):
+    """Código de tipo de array más pequeño que puede indexar 'cantidad' posiciones"""
+    return 'i' if cantidad < 2 ** 31 else 'q'
+
+
+class RelacionCSR(Set):
+    """
+    Relación inmutable en formato CSR (Compressed Sparse Row).
+    Los destinos de la fila i están en destinos[desplazamientos[i]:desplazamientos[i+1]],
+    ordenados y sin repetir. Ocupa unos pocos bytes por par en lugar de una
+    tupla y una entrada de tabla hash.
+    """
+
+    def __init__(self, tabla, desplazamientos, destinos):
+        """
+        Args:
+            tabla (TablaElementos): Tabla de internado de los elementos
+            desplazamientos (array): Inicio de cada fila (longitud n+1)
+            destinos (array): Índices de destino concatenados por fila
+        """
+        self.tabla = tabla
+        self.desplazamientos = desplazamientos
+        self.destinos = destinos
+
+    @classmethod
+    def desde_pares(cls, pares, tabla=None):
+        """
+        Construye una RelacionCSR a partir de cualquier iterable de pares.
+        Solo guarda los pares en dos arrays compactos antes de ordenarlos, por
+        lo que puede alimentarse directamente desde un generador.
+
+        Args:
+            pares (iterable): Pares ordenados (a,b)
+            tabla (TablaElementos): Tabla existente a reutilizar (opcional)
+
+        Returns:
+            RelacionCSR: La relación en formato compacto
+        """
+        if tabla is None:
+            tabla = TablaElementos()
+        internar = tabla.internar
+        origenes = array('q')
+        destinos_sin_orden = array('q')
+        for par in pares:
+            if len(par) == 2:
+                origenes.append(internar(par[0]))
+                destinos_sin_orden.append(internar(par[1]))
+        return cls._desde_columnas(tabla, origenes, destinos_sin_orden)
+
+    @classmethod
+    def _desde_columnas(cls, tabla, origenes, destinos_sin_orden):
+        """Ordena las columnas origen/destino por conteo y elimina duplicados"""
+        n = len(tabla)
+        tipo = tipo_indices(max(n, len(origenes)) + 1)
+
+        # Conteo por fila y desplazamientos acumulados
+        conteo = array(tipo, bytes(array(tipo).itemsize * (n + 1)))
+        for origen in origenes:
+            conteo[origen + 1] += 1
+        for i in range(n):
+            conteo[i + 1] += conteo[i]
+
+        posiciones = array(tipo, conteo)
+        destinos = array(tipo, bytes(array(tipo).itemsize * len(origenes)))
+        for origen, destino in zip(origenes, destinos_sin_orden):
+            destinos[posiciones[origen]] = destino
+            posiciones[origen] += 1
+        del posiciones
+
+        # Ordenar cada fila y compactar los pares repetidos en el mismo arreglo
+        desplazamientos = array(tipo, bytes(array(tipo).itemsize * (n + 1)))
+        escritura = 0
+        for i in range(n):
+            fila = sorted(destinos[conteo[i]:conteo[i + 1]])
+            anterior = None
+            for destino in fila:
+                if destino != anterior:
+                    destinos[escritura] = destino
+                    escritura += 1
+                    anterior = destino
+            desplazamientos[i + 1] = escritura
+        del destinos[escritura:]
+        return cls(tabla, desplazamientos, destinos)
+
+    # === CONSULTAS ===
+
+    def _fila(self, indice):
+        """Retorna (inicio, fin) de la fila del índice dado"""
+        if indice + 1 >= len(self.desplazamientos):
+            return 0, 0
+        return self.desplazamientos[indice], self.desplazamientos[indice + 1]
+
+    def sucesores(self, elemento):
+        """Genera los b tales que (elemento, b) ∈ R, en orden de internado"""
+        indice = self.tabla.indices.get(elemento)
+        if indice is None:
+            return
+        inicio, fin = self._fila(indice)
+        elementos = self.tabla.elementos
+        for posicion in range(inicio, fin):
+            yield elementos[self.destinos[posicion]]
+
+    def grado_salida(self, elemento):
+        """Número de sucesores de un elemento"""
+        indice = self.tabla.indices.get(elemento)
+        if indice is None:
+            return 0
+        inicio, fin = self._fila(indice)
+        return fin - inicio
+
+    def __contains__(self, par):
+        try:
+            a, b = par
+            origen = self.tabla.indices.get(a)
+            destino = self.tabla.indices.get(b)
+        except (TypeError, ValueError):
+            return False
+        if origen is None or destino is None:
+            return False
+        inicio, fin = self._fila(origen)
+        posicion = bisect_left(self.destinos, destino, inicio, fin)
+        return posicion < fin and self.destinos[posicion] == destino
+
+    def __iter__(self):
+        elementos = self.tabla.elementos
+        desplazamientos = self.desplazamientos
+        destinos = self.destinos
+        for origen in range(len(desplazamientos) - 1):
+            inicio, fin = desplazamientos[origen], desplazamientos[origen + 1]
+            if inicio != fin:
+                a = elementos[origen]
+                for posicion in range(inicio, fin):
+                    yield (a, elementos[destinos[posicion]])
+
+    def __len__(self):
+        return len(self.destinos)
+
+    def __repr__(self):
+        return f"RelacionCSR({len(self)} pares)"
+
+    __hash__ = Set._hash
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        """Los resultados de las operaciones de conjunto son sets normales"""
+        return set(iterable)
+
+    def copy(self):
+        """La relación es inmutable, por lo que puede compartirse"""
+        return self
+
+    # === MÉTODOS CON NOMBRE COMPATIBLES CON set ===
+
+    def union(self, otro):
+        """Une la relación con otro conjunto de pares (resultado como set)"""
+        return set(self).union(otro)
+
+    def intersection(self, otro):
+        """Pares de 'otro' que están en la relación, en O(|otro|·log grado)"""
+        return {par for par in otro if par in self}
+
+    def difference(self, otro):
+        """Pares de la relación que no están en 'otro'"""
+        return {par for par in self if par not in otro}
+
+    def a_pares(self):
+        """Convierte la relación al formato de conjunto de tuplas"""
+        return set(self)
+
+    def memoria_bytes(self):
+        """Bytes ocupados por los arreglos de pares (sin contar la tabla compartida)"""
+        return (len(self.desplazamientos) * self.desplazamientos.itemsize
+                + len(self.destinos) * self.destinos.itemsize)
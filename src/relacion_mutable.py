@@ -0,0 +1,217 @@
+"""
+Relación mutable con propiedades mantenidas de forma incremental.
+Cada inserción o eliminación de un par actualiza contadores de simetría,
+reflexividad y transitividad mirando solo los vecinos de los elementos
+tocados, de modo que las consultas posteriores no recorren la relación.
+"""
+
+from collections.abc import Set
+
+from src.indices import buscar_violacion_transitiva
+
+
+class RelacionMutable(Set):
+    """
+    Relación que admite agregar y eliminar pares uno a uno.
+
+    Contadores mantenidos:
+        sin_espejo    Pares (a,b) con a ≠ b cuyo par (b,a) no está en R
+        diagonal      Elementos a con (a,a) ∈ R
+        violaciones   Ternas (a,b,c) con (a,b),(b,c) ∈ R y (a,c) ∉ R
+    Con ellos es_simetrica y es_transitiva son O(1), y cada modificación
+    cuesta O(grado) de los elementos del par.
+    """
+
+    def __init__(self, pares=(), conjunto=None):
+        """
+        Args:
+            pares (iterable): Pares iniciales
+            conjunto (iterable): Conjunto A sobre el que se vigila la
+                reflexividad en O(1) (opcional)
+        """
+        self._pares = set()
+        self._sucesores = {}
+        self._predecesores = {}
+        self.diagonal = set()
+        self.sin_espejo = 0
+        self.violaciones = 0
+        self.modificaciones = 0
+        self.conjunto_vigilado = None
+        self._faltantes_diagonal = 0
+        for par in pares:
+            if len(par) == 2:
+                self.agregar_par(par[0], par[1])
+        if conjunto is not None:
+            self.vigilar_reflexividad(conjunto)
+
+    # === PROTOCOLO DE CONJUNTO ===
+
+    def __contains__(self, par):
+        return par in self._pares
+
+    def __iter__(self):
+        return iter(self._pares)
+
+    def __len__(self):
+        return len(self._pares)
+
+    def __repr__(self):
+        return f"RelacionMutable({len(self)} pares)"
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        """Los resultados de las operaciones de conjunto son sets normales"""
+        return set(iterable)
+
+    def copy(self):
+        """Retorna una copia inmutable en el tiempo (set de tuplas)"""
+        return set(self._pares)
+
+    # Métodos con nombre compatibles con set; el resultado es un set aparte
+
+    def union(self, otro):
+        return self._pares.union(otro)
+
+    def intersection(self, otro):
+        return self._pares.intersection(otro)
+
+    def difference(self, otro):
+        return self._pares.difference(otro)
+
+    def sucesores(self, elemento):
+        """Conjunto de b tales que (elemento, b) ∈ R (no debe mutarse)"""
+        return self._sucesores.get(elemento, frozenset())
+
+    def predecesores(self, elemento):
+        """Conjunto de a tales que (a, elemento) ∈ R (no debe mutarse)"""
+        return self._predecesores.get(elemento, frozenset())
+
+    # === MODIFICACIONES ===
+
+    def agregar_par(self, a, b):
+        """
+        Agrega el par (a,b) y actualiza los contadores.
+
+        Returns:
+            bool: True si el par no estaba en la relación
+        """
+        if (a, b) in self._pares:
+            return False
+
+        # Violaciones que el nuevo par resuelve: caminos a→y→b ya existentes
+        resueltas = len(self.sucesores(a) & self.predecesores(b))
+
+        self._pares.add((a, b))
+        self._sucesores.setdefault(a, set()).add(b)
+        self._predecesores.setdefault(b, set()).add(a)
+
+        # Violaciones nuevas con (a,b) como primer o segundo tramo
+        nuevas = self._violaciones_con_tramo(a, b)
+        self.violaciones += nuevas - resueltas
+
+        if a == b:
+            self.diagonal.add(a)
+            if self.conjunto_vigilado is not None and a in self.conjunto_vigilado:
+                self._faltantes_diagonal -= 1
+        elif (b, a) in self._pares:
+            self.sin_espejo -= 1
+        else:
+            self.sin_espejo += 1
+
+        self.modificaciones += 1
+        return True
+
+    def eliminar_par(self, a, b):
+        """
+        Elimina el par (a,b) y actualiza los contadores.
+
+        Returns:
+            bool: True si el par estaba en la relación
+        """
+        if (a, b) not in self._pares:
+            return False
+
+        # Violaciones que desaparecen con el tramo (a,b)
+        perdidas = self._violaciones_con_tramo(a, b)
+
+        self._pares.discard((a, b))
+        self._quitar_de_indice(self._sucesores, a, b)
+        self._quitar_de_indice(self._predecesores, b, a)
+
+        # Caminos a→y→b que quedan sin atajo
+        nuevas = len(self.sucesores(a) & self.predecesores(b))
+        self.violaciones += nuevas - perdidas
+
+        if a == b:
+            self.diagonal.discard(a)
+            if self.conjunto_vigilado is not None and a in self.conjunto_vigilado:
+                self._faltantes_diagonal += 1
+        elif (b, a) in self._pares:
+            self.sin_espejo += 1
+        else:
+            self.sin_espejo -= 1
+
+        self.modificaciones += 1
+        return True
+
+    def _violaciones_con_tramo(self, a, b):
+        """
+        Cuenta las ternas que violan la transitividad usando (a,b) como tramo:
+        (a,b),(b,z) sin (a,z) y (x,a),(a,b) sin (x,b). Una terna no puede usar
+        (a,b) en ambos tramos sin ser a = b, y (a,a),(a,a) nunca es violación.
+        """
+        sucesores_a = self.sucesores(a)
+        predecesores_b = self.predecesores(b)
+        cantidad = 0
+        for z in self.sucesores(b):
+            if z not in sucesores_a:
+                cantidad += 1
+        for x in self.predecesores(a):
+            if x not in predecesores_b:
+                cantidad += 1
+        return cantidad
+
+    @staticmethod
+    def _quitar_de_indice(indice, clave, valor):
+        """Quita valor del índice, eliminando la entrada si queda vacía"""
+        valores = indice[clave]
+        valores.discard(valor)
+        if not valores:
+            del indice[clave]
+
+    # === PROPIEDADES ===
+
+    def vigilar_reflexividad(self, conjunto):
+        """Fija el conjunto A para el que es_reflexiva(A) se responde en O(1)"""
+        self.conjunto_vigilado = frozenset(conjunto)
+        self._faltantes_diagonal = len(self.conjunto_vigilado - self.diagonal)
+
+    def es_reflexiva(self, conjunto=None):
+        """
+        Verifica la reflexividad en A. Es O(1) para el conjunto vigilado y
+        O(|A|) para cualquier otro, sin recorrer la relación.
+        """
+        if conjunto is None or (self.conjunto_vigilado is not None
+                                and len(conjunto) == len(self.conjunto_vigilado)
+                                and conjunto == self.conjunto_vigilado):
+            if self.conjunto_vigilado is None:
+                raise ValueError("No hay un conjunto vigilado para la reflexividad")
+            return self._faltantes_diagonal == 0
+        return all(elemento in self.diagonal for elemento in conjunto)
+
+    def es_simetrica(self):
+        """Verifica la simetría en O(1)"""
+        return self.sin_espejo == 0
+
+    def es_transitiva(self):
+        """Verifica la transitividad en O(1)"""
+        return self.violaciones == 0
+
+    def contraejemplo_transitividad(self):
+        """
+        Retorna una terna (a,b,c) que viola la transitividad, o None.
+        Solo recorre el índice de sucesores si el contador indica violaciones.
+        """
+        if self.violaciones == 0:
+            return None
+        return buscar_violacion_transitiva(self._sucesores)
@@ -0,0 +1,215 @@
+"""
+Composición y potencias con testigos.
+Mientras se calcula R₁ ∘ R₂ se guarda, para cada par (a,c) del resultado,
+el elemento intermedio b que lo produjo. Así la pregunta "¿por qué (a,c)
+está en R₁ ∘ R₂?" se responde con una consulta al diccionario, y un camino
+de R^n se reconstruye siguiendo los testigos de cada composición.
+"""
+
+from collections.abc import Set
+
+from src.indices import indexar_sucesores, iterar_violaciones_transitivas
+
+
+def componer_registrando(pares_izquierda, sucesores_derecha, todos=False):
+    """
+    Hash-join que guarda el testigo de cada par del resultado.
+
+    Args:
+        pares_izquierda (iterable): Pares (a,b) de R₁
+        sucesores_derecha (dict): Índice de R₂ (b -> conjunto de c)
+        todos (bool): Guardar todos los testigos (lista) en lugar del primero
+
+    Returns:
+        dict: (a,c) -> b, o (a,c) -> [b, ...] si todos es True
+    """
+    testigos = {}
+    for par in pares_izquierda:
+        if len(par) != 2:
+            continue
+        a, b = par
+        destinos = sucesores_derecha.get(b)
+        if not destinos:
+            continue
+        if todos:
+            for c in destinos:
+                testigos.setdefault((a, c), []).append(b)
+        else:
+            for c in destinos:
+                testigos.setdefault((a, c), b)
+    return testigos
+
+
+class ComposicionConTestigos(Set):
+    """
+    Resultado de R₁ ∘ R₂ junto con sus testigos. Se comporta como la
+    relación resultado (los pares son las claves del índice de testigos,
+    sin una copia aparte).
+    """
+
+    def __init__(self, testigos, todos=False):
+        """
+        Args:
+            testigos (dict): (a,c) -> b, o (a,c) -> lista de b si todos es True
+            todos (bool): Indica si se guardaron todos los testigos
+        """
+        self.testigos = testigos
+        self.todos = todos
+
+    def __contains__(self, par):
+        return par in self.testigos
+
+    def __iter__(self):
+        return iter(self.testigos)
+
+    def __len__(self):
+        return len(self.testigos)
+
+    def __repr__(self):
+        return f"ComposicionConTestigos({len(self)} pares)"
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        """Los resultados de las operaciones de conjunto son sets normales"""
+        return set(iterable)
+
+    def copy(self):
+        """Retorna los pares como set de tuplas"""
+        return set(self.testigos)
+
+    def testigo(self, a, c):
+        """Un b tal que (a,b) ∈ R₁ y (b,c) ∈ R₂, o None si (a,c) no está"""
+        testigo = self.testigos.get((a, c))
+        if self.todos and testigo is not None:
+            return testigo[0]
+        return testigo
+
+    def testigos_de(self, a, c):
+        """Todos los testigos registrados de (a,c) (uno si no se pidieron todos)"""
+        testigo = self.testigos.get((a, c))
+        if testigo is None:
+            return []
+        return list(testigo) if self.todos else [testigo]
+
+    def explicar(self, a, c):
+        """
+        Retorna la terna (a,b,c) que justifica el par, el mismo formato que
+        contraejemplo_transitividad, o None si el par no está.
+        """
+        if (a, c) not in self.testigos:
+            return None
+        return (a, self.testigo(a, c), c)
+
+
+def componer_con_testigos(relacion1, relacion2, todos=False):
+    """
+    Calcula R₁ ∘ R₂ guardando un testigo (o todos) por cada par.
+
+    Returns:
+        ComposicionConTestigos: La composición con su índice de testigos
+    """
+    testigos = componer_registrando(relacion1, indexar_sucesores(relacion2), todos)
+    return ComposicionConTestigos(testigos, todos)
+
+
+def violaciones_transitividad(relacion):
+    """
+    Calcula todos los pares de R∘R que faltan en R, cada uno con su testigo.
+    explicar(a, c) retorna la terna (a,b,c) que viola la transitividad; las
+    ternas salen del mismo recorrido que contraejemplo_transitividad, así
+    que su contraejemplo es la primera de ellas.
+
+    Returns:
+        ComposicionConTestigos: Pares faltantes para que R sea transitiva
+    """
+    sucesores = indexar_sucesores(relacion)
+    faltantes = {(a, c): b for a, b, c in iterar_violaciones_transitivas(sucesores)}
+    return ComposicionConTestigos(faltantes)
+
+
+class _PasoPotencia:
+    """Una potencia R^k calculada como R^i ∘ R^j, con el testigo de cada par"""
+
+    __slots__ = ('exponente', 'testigos', 'izquierda', 'derecha')
+
+    def __init__(self, exponente, testigos, izquierda=None, derecha=None):
+        self.exponente = exponente
+        self.testigos = testigos
+        self.izquierda = izquierda
+        self.derecha = derecha
+
+    def componer(self, otro):
+        """Retorna el paso self ∘ otro registrando los testigos"""
+        testigos = componer_registrando(self.testigos, indexar_sucesores(otro.testigos))
+        return _PasoPotencia(self.exponente + otro.exponente, testigos, self, otro)
+
+
+class PotenciaConCaminos(Set):
+    """
+    R^n calculada por cuadrados sucesivos guardando los testigos de cada
+    composición. Un camino a = x₀ → x₁ → ... → xₙ = c se reconstruye
+    dividiendo recursivamente en los testigos, sin volver a componer.
+    """
+
+    def __init__(self, relacion, n):
+        """
+        Args:
+            relacion (set): Relación R
+            n (int): Exponente entero positivo
+        """
+        base = _PasoPotencia(1, dict.fromkeys(par for par in relacion if len(par) == 2))
+        resultado = None
+        while True:
+            if n & 1:
+                resultado = base if resultado is None else resultado.componer(base)
+            n >>= 1
+            if not n:
+                break
+            base = base.componer(base)
+        self.paso = resultado
+
+    @property
+    def exponente(self):
+        return self.paso.exponente
+
+    def __contains__(self, par):
+        return par in self.paso.testigos
+
+    def __iter__(self):
+        return iter(self.paso.testigos)
+
+    def __len__(self):
+        return len(self.paso.testigos)
+
+    def __repr__(self):
+        return f"PotenciaConCaminos(n={self.exponente}, {len(self)} pares)"
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        """Los resultados de las operaciones de conjunto son sets normales"""
+        return set(iterable)
+
+    def copy(self):
+        """Retorna los pares como set de tuplas"""
+        return set(self.paso.testigos)
+
+    def camino(self, a, c):
+        """
+        Retorna un camino [a, x₁, ..., c] de n pasos de R, o None si (a,c) ∉ R^n.
+        """
+        if (a, c) not in self.paso.testigos:
+            return None
+        camino = [a]
+        # Pila de (paso, destino) pendientes; se procesa de izquierda a derecha
+        pendientes = [(self.paso, c)]
+        actual = a
+        while pendientes:
+            paso, destino = pendientes.pop()
+            if paso.izquierda is None:
+                camino.append(destino)
+                actual = destino
+                continue
+            intermedio = paso.testigos[(actual, destino)]
+            pendientes.append((paso.derecha, destino))
+            pendientes.append((paso.izquierda, intermedio))
+        return camino
@@ -0,0 +1,138 @@
+"""
+Tokenizador de una sola pasada para la entrada de conjuntos y relaciones.
+Valida el formato, reporta la posición de cualquier error y produce los
+elementos ya tipados en un único recorrido de la cadena.
+"""
+
+import re
+
+
+class ErrorSintaxis(ValueError):
+    """Error de formato en la entrada, con la posición del carácter problemático"""
+
+    def __init__(self, mensaje, posicion):
+        super().__init__(f"{mensaje} (posición {posicion + 1})")
+        self.mensaje = mensaje
+        self.posicion = posicion
+
+
+# Un par (a,b): re.split con grupos devuelve [separador, a, b, separador, a, b, ...]
+PATRON_PAR = re.compile(r'\(([^,()]*),([^,()]*)\)')
+
+ESPACIOS_Y_LLAVES = ' \t\r\n{}'
+SEPARADORES_PARES = ESPACIOS_Y_LLAVES + ','
+
+CARACTERES_NUMERICOS = frozenset('0123456789+-.')
+
+
+def convertir_token(token):
+    """
+    Convierte un token ya recortado a int, float o str.
+    Solo intenta la conversión numérica si el token puede ser un número,
+    evitando el costo de la excepción en los elementos de texto.
+    """
+    if token[0] in CARACTERES_NUMERICOS or token[0].isdigit():
+        try:
+            if '.' not in token:
+                return int(token)
+            return float(token)
+        except ValueError:
+            pass
+    return token
+
+
+def analizar_relacion(entrada):
+    """
+    Valida y convierte una relación escrita como (a,b),(c,d),... en una pasada.
+
+    Un único re.split recorre la cadena y separa los elementos de cada par de
+    lo que hay entre pares. Cada elemento distinto se convierte una sola vez.
+
+    Args:
+        entrada (str): Texto de la relación (las llaves son opcionales)
+
+    Returns:
+        set: Conjunto de pares con elementos tipados
+
+    Raises:
+        ErrorSintaxis: Si el formato es incorrecto, indicando la posición
+    """
+    partes = PATRON_PAR.split(entrada)
+    separadores = partes[0::3]
+    primeros = partes[1::3]
+    segundos = partes[2::3]
+
+    # Entre pares solo puede haber comas, espacios y llaves
+    if ''.join(separadores).strip(SEPARADORES_PARES):
+        _reportar_separador_invalido(partes)
+
+    tipados = {}
+    for token in set(primeros).union(segundos):
+        limpio = token.strip()
+        if not limpio:
+            _reportar_elemento_vacio(partes)
+        tipados[token] = convertir_token(limpio)
+
+    return set(zip(map(tipados.__getitem__, primeros), map(tipados.__getitem__, segundos)))
+
+
+def _posiciones_partes(partes):
+    """Genera (índice, posición inicial) de cada parte del resultado de re.split"""
+    posicion = 0
+    for indice, parte in enumerate(partes):
+        if indice % 3 == 1:
+            posicion += 1  # '('
+        elif indice % 3 == 2:
+            posicion += 1  # ','
+        yield indice, posicion
+        posicion += len(parte)
+        if indice % 3 == 2:
+            posicion += 1  # ')'
+
+
+def _reportar_separador_invalido(partes):
+    """Lanza ErrorSintaxis en el primer carácter inválido entre pares"""
+    for indice, posicion in _posiciones_partes(partes):
+        if indice % 3 == 0:
+            for desplazamiento, caracter in enumerate(partes[indice]):
+                if caracter not in SEPARADORES_PARES:
+                    raise ErrorSintaxis(
+                        f"Carácter inesperado '{caracter}'. Use: (a,b),(c,d),...",
+                        posicion + desplazamiento
+                    )
+
+
+def _reportar_elemento_vacio(partes):
+    """Lanza ErrorSintaxis en el primer par con un elemento vacío"""
+    for indice, posicion in _posiciones_partes(partes):
+        if indice % 3 and not partes[indice].strip():
+            raise ErrorSintaxis("Los elementos de un par no pueden estar vacíos", posicion)
+
+
+def analizar_conjunto(entrada):
+    """
+    Valida y convierte un conjunto escrito como a,b,c en una pasada.
+
+    Args:
+        entrada (str): Texto del conjunto (las llaves son opcionales)
+
+    Returns:
+        set: Conjunto con elementos tipados
+
+    Raises:
+        ErrorSintaxis: Si hay elementos vacíos, indicando la posición
+    """
+    elementos = set()
+    if not entrada.strip(ESPACIOS_Y_LLAVES):
+        return elementos
+
+    posicion = 0
+    for parte in entrada.split(','):
+        token = parte.strip(ESPACIOS_Y_LLAVES)
+        if not token:
+            raise ErrorSintaxis("Los elementos no pueden estar vacíos", posicion)
+        if '{' in token or '}' in token:
+            raise ErrorSintaxis("Llave inesperada dentro de un elemento", posicion + parte.find(token))
+        elementos.add(convertir_token(token))
+        posicion += len(parte) + 1
+    return elementos
@@ -3,7 +3,10 @@ Utilidades para el manejo de entrada y salida de datos.
 Contiene funciones para parsing de conjuntos y relaciones.
 """
 
-import re
+import sys
+from itertools import chain, islice
+
+from src.tokenizador import analizar_conjunto, analizar_relacion, convertir_token, ErrorSintaxis
 
 
 def convertir_elemento(elemento_str):
@@ -17,17 +20,9 @@ def convertir_elemento(elemento_str):
         Elemento convertido al tipo apropiado
     """
     elemento_str = elemento_str.strip()
-    
-    try:
-        # Intentar convertir a entero
-        if '.' not in elemento_str:
-            return int(elemento_str)
-        else:
-            # Intentar convertir a float
-            return float(elemento_str)
-    except ValueError:
-        # Si no es número, mantener como string
+    if not elemento_str:
         return elemento_str
+    return convertir_token(elemento_str)
 
 
 def crear_conjunto_desde_entrada(entrada):
@@ -39,45 +34,37 @@ def crear_conjunto_desde_entrada(entrada):
         
     Returns:
         set: Conjunto con los elementos parseados
+        
+    Raises:
+        ErrorSintaxis: Si la entrada tiene elementos vacíos
     """
-    # Limpiar la entrada
-    entrada = entrada.strip().replace('{', '').replace('}', '')
-    elementos = []
-    
-    if entrada:
-        # Dividir por comas y procesar cada elemento
-        partes = entrada.split(',')
-        for parte in partes:
-            elemento = convertir_elemento(parte)
-            elementos.append(elemento)
-    
-    return set(elementos)
+    return analizar_conjunto(entrada)
 
 
 def crear_relacion_desde_entrada(entrada):
     """
     Convierte una entrada de string a relación (conjunto de pares ordenados).
+    La validación y la conversión se hacen en una sola pasada.
     
     Args:
         entrada (str): String con pares ordenados (ej: "(1,a),(2,b),(3,c)")
         
     Returns:
         set: Conjunto de tuplas representando la relación
-    """
-    entrada = entrada.strip().replace('{', '').replace('}', '')
-    pares = set()
-    
-    if entrada:
-        # Buscar patrones como (a,b) usando expresiones regulares
-        patron_pares = r'\(([^,]+),([^)]+)\)'
-        coincidencias = re.findall(patron_pares, entrada)
         
-        for par in coincidencias:
-            elemento1 = convertir_elemento(par[0])
-            elemento2 = convertir_elemento(par[1])
-            pares.add((elemento1, elemento2))
-    
-    return pares
+    Raises:
+        ErrorSintaxis: Si el formato es incorrecto
+    """
+    return analizar_relacion(entrada)
+
+
+def clave_orden(elemento):
+    """Clave de orden estable para elementos mixtos: números antes que textos"""
+    if isinstance(elemento, tuple):
+        return tuple(clave_orden(componente) for componente in elemento)
+    if isinstance(elemento, (int, float)):
+        return (0, elemento, '')
+    return (1, 0, str(elemento))
 
 
 def mostrar_conjunto_formateado(conjunto, nombre=""):
@@ -99,23 +86,118 @@ def mostrar_conjunto_formateado(conjunto, nombre=""):
     print("{" + ", ".join(map(str, elementos_ordenados)) + "}")
 
 
-def mostrar_relacion_formateada(relacion, nombre=""):
+# Pares escritos por cada llamada a write al mostrar relaciones grandes
+PARES_POR_BLOQUE = 4096
+
+
+def pares_ordenados(relacion, descendente=False):
+    """
+    Genera los pares de la relación ya formateados, en el orden de
+    presentación: por el texto del primer elemento y luego del segundo.
+    
+    Cada elemento distinto se convierte a texto una sola vez y los pares se
+    agrupan por su primer elemento, así solo se ordenan textos cortos y cada
+    grupo se ordena cuando se llega a él. Si solo se consumen los primeros
+    pares, el resto de los grupos nunca se ordena.
+    
+    Args:
+        relacion (set): Relación a recorrer
+        descendente (bool): Si es True se generan del último al primero
+        
+    Yields:
+        str: Cada par con el formato (a,b)
+    """
+    textos = {}
+    grupos = {}
+    for par in relacion:
+        a, b = par
+        texto_a = textos.get(a)
+        if texto_a is None:
+            texto_a = textos[a] = str(a)
+        texto_b = textos.get(b)
+        if texto_b is None:
+            texto_b = textos[b] = str(b)
+        grupos.setdefault(texto_a, []).append(texto_b)
+    del textos
+    
+    for texto_a in sorted(grupos, reverse=descendente):
+        prefijo = "(" + texto_a + ","
+        for texto_b in sorted(grupos[texto_a], reverse=descendente):
+            yield prefijo + texto_b + ")"
+
+
+def escribir_por_bloques(textos, salida, separador=", "):
+    """
+    Escribe los textos separados por 'separador' en bloques de tamaño fijo,
+    sin construir la cadena completa en memoria.
+    
+    Returns:
+        int: Número de textos escritos
+    """
+    escritos = 0
+    bloque = []
+    for texto in textos:
+        bloque.append(texto)
+        if len(bloque) == PARES_POR_BLOQUE:
+            salida.write((separador if escritos else "") + separador.join(bloque))
+            escritos += len(bloque)
+            bloque = []
+    if bloque:
+        salida.write((separador if escritos else "") + separador.join(bloque))
+        escritos += len(bloque)
+    return escritos
+
+
+def mostrar_relacion_formateada(relacion, nombre="", primeros=None, ultimos=None,
+                                pagina=None, por_pagina=100, solo_conteo=False, salida=None):
     """
     Muestra una relación de forma ordenada y legible.
+    La salida se escribe por bloques a medida que se genera, por lo que
+    puede mostrarse (o enviarse a un archivo) una relación de millones de pares.
     
     Args:
         relacion (set): Relación a mostrar
         nombre (str): Nombre de la relación (opcional)
+        primeros (int): Mostrar solo los primeros n pares
+        ultimos (int): Mostrar solo los últimos n pares
+        pagina (int): Mostrar solo la página indicada (empezando en 1)
+        por_pagina (int): Pares por página cuando se usa 'pagina'
+        solo_conteo (bool): Mostrar solo el número de pares
+        salida: Flujo de texto de destino (por defecto la salida estándar)
     """
+    if salida is None:
+        salida = sys.stdout
     if nombre:
-        print(f"{nombre}: ", end="")
+        salida.write(f"{nombre}: ")
     
-    # Convertir a lista y ordenar para presentación consistente
-    pares_lista = list(relacion)
-    pares_lista.sort(key=lambda x: (str(x[0]), str(x[1])))
+    total = len(relacion)
+    if solo_conteo:
+        salida.write(f"{total} pares\n")
+        return
     
-    pares_str = [f"({par[0]},{par[1]})" for par in pares_lista]
-    print("{" + ", ".join(pares_str) + "}")
+    omitidos_inicio = 0
+    if primeros is not None:
+        pares = islice(pares_ordenados(relacion), primeros)
+    elif ultimos is not None:
+        # Los últimos n se generan en orden inverso y se invierten al final
+        pares = reversed(list(islice(pares_ordenados(relacion, descendente=True), ultimos)))
+        omitidos_inicio = max(total - ultimos, 0)
+    elif pagina is not None:
+        omitidos_inicio = min((pagina - 1) * por_pagina, total)
+        pares = islice(pares_ordenados(relacion), omitidos_inicio, omitidos_inicio + por_pagina)
+    else:
+        pares = pares_ordenados(relacion)
+    
+    # Los pares omitidos se indican con "..." al inicio y/o al final
+    marca_inicio = ["..."] if omitidos_inicio else []
+    salida.write("{")
+    escritos = escribir_por_bloques(chain(marca_inicio, pares), salida)
+    mostrados = escritos - len(marca_inicio)
+    if omitidos_inicio + mostrados < total:
+        salida.write(", ..." if escritos else "...")
+    salida.write("}\n")
+    if mostrados < total:
+        salida.write(f"  (mostrando {mostrados} de {total} pares)\n")
 
 
 def solicitar_entrada_usuario(mensaje, validador=None):
@@ -142,6 +224,30 @@ def solicitar_entrada_usuario(mensaje, validador=None):
             print(f"Error: {mensaje_error}")
 
 
+def solicitar_y_convertir(mensaje, convertidor):
+    """
+    Solicita entrada del usuario y la convierte en una sola pasada.
+    Si el convertidor lanza ErrorSintaxis se muestra el error con su posición
+    y se vuelve a pedir la entrada.
+    
+    Args:
+        mensaje (str): Mensaje a mostrar al usuario
+        convertidor (function): Función que valida y convierte la entrada
+        
+    Returns:
+        Valor convertido de la entrada
+    """
+    while True:
+        entrada = input(mensaje).strip()
+        try:
+            return convertidor(entrada)
+        except ErrorSintaxis as error:
+            print(f"Error: {error}")
+            if entrada:
+                print("  " + entrada[:error.posicion + 20])
+                print("  " + " " * min(error.posicion, len(entrada)) + "^")
+
+
 def confirmar_accion(mensaje):
     """
     Solicita confirmación del usuario para una acción.
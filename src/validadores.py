@@ -3,7 +3,7 @@ Validadores para entrada de datos del usuario.
 Contiene funciones de validación para diferentes tipos de entrada.
 """
 
-import re
+from src.tokenizador import analizar_conjunto, analizar_relacion, ErrorSintaxis
 
 
 def validar_nombre_conjunto(nombre):
@@ -38,18 +38,10 @@ def validar_entrada_conjunto(entrada):
     Returns:
         tuple: (es_valido, mensaje_error)
     """
-    if not entrada.strip():
-        return True, ""  # Conjunto vacío es válido
-    
-    # Remover llaves si las hay
-    entrada_limpia = entrada.strip().replace('{', '').replace('}', '')
-    
-    # Verificar que tenga formato básico de elementos separados por comas
-    if entrada_limpia:
-        elementos = entrada_limpia.split(',')
-        for elemento in elementos:
-            if not elemento.strip():
-                return False, "Los elementos no pueden estar vacíos"
+    try:
+        analizar_conjunto(entrada)
+    except ErrorSintaxis as error:
+        return False, str(error)
     
     return True, ""
 
@@ -64,22 +56,10 @@ def validar_entrada_relacion(entrada):
     Returns:
         tuple: (es_valido, mensaje_error)
     """
-    if not entrada.strip():
-        return True, ""  # Relación vacía es válida
-    
-    # Verificar que tenga el formato de pares ordenados
-    patron_pares = r'\([^,]+,[^)]+\)'
-    pares_encontrados = re.findall(patron_pares, entrada)
-    
-    if not pares_encontrados:
-        return False, "Debe contener pares ordenados en formato (a,b)"
-    
-    # Verificar que no haya caracteres extraños fuera de los pares
-    entrada_sin_pares = re.sub(patron_pares, '', entrada)
-    entrada_sin_pares = entrada_sin_pares.replace('{', '').replace('}', '').replace(',', '').replace(' ', '')
-    
-    if entrada_sin_pares:
-        return False, "Formato incorrecto. Use: (a,b),(c,d),..."
+    try:
+        analizar_relacion(entrada)
+    except ErrorSintaxis as error:
+        return False, str(error)
     
     return True, ""
 
@@ -0,0 +1,91 @@
+"""
+Pruebas del modo por lotes (src/lote.py).
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from src.conjuntos import OperadorConjuntos
+from src.espacio_trabajo import guardar_espacio_trabajo, cargar_espacio_trabajo
+from src.lote import ejecutar_lote
+from src.relacion_csr import RelacionCSR
+
+
+def ejecutar(operador, guion):
+    """Ejecuta el guion y retorna (registros, errores)"""
+    salida = io.StringIO()
+    errores = ejecutar_lote(operador, guion.strip().splitlines(), salida)
+    return [json.loads(linea) for linea in salida.getvalue().splitlines()], errores
+
+
+class PruebaLoteSobreEspacioCSR(unittest.TestCase):
+    """Un espacio de trabajo cargado deja todas las relaciones como RelacionCSR"""
+
+    def setUp(self):
+        directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(directorio.cleanup)
+        ruta = os.path.join(directorio.name, 'trabajo.rel')
+
+        original = OperadorConjuntos()
+        original.agregar_relacion('S', {(1, 'a'), (5, 6)})
+        guardar_espacio_trabajo(original, ruta)
+
+        self.operador = OperadorConjuntos()
+        cargar_espacio_trabajo(self.operador, ruta)
+        self.addCleanup(self.operador.vaciar)
+
+    def test_relaciones_cargadas_como_csr(self):
+        for relacion in self.operador.relaciones.values():
+            self.assertIsInstance(relacion, RelacionCSR)
+
+    def test_operaciones_de_conjunto_entre_relaciones(self):
+        registros, errores = ejecutar(self.operador, """
+            R ∪ S
+            S - R
+            S ∩ E
+            X = S ∪ E
+            X ∘ R
+        """)
+        self.assertEqual(errores, 0, registros)
+        resultados = [registro['resultado'] for registro in registros]
+        self.assertIn([5, 6], resultados[0])
+        self.assertEqual(resultados[1], [[5, 6]])
+        self.assertEqual(resultados[2], [[1, 'a']])
+        self.assertEqual(registros[3]['tamano'], 4)
+
+
+class PruebaReasignacion(unittest.TestCase):
+    """Un nombre reasignado con otro tipo pierde su valor anterior"""
+
+    def setUp(self):
+        self.operador = OperadorConjuntos()
+
+    def test_relacion_reasignada_como_conjunto(self):
+        registros, errores = ejecutar(self.operador, """
+            X = R^2
+            X = {1,2}
+            X
+            Y = X ∪ C
+        """)
+        self.assertEqual(errores, 0, registros)
+        self.assertEqual(registros[2]['tipo'], 'conjunto')
+        self.assertEqual(registros[2]['resultado'], [1, 2])
+        self.assertEqual(registros[3]['resultado'], [1, 2, 3])
+        self.assertNotIn('X', self.operador.relaciones)
+
+    def test_conjunto_reasignado_como_relacion(self):
+        registros, errores = ejecutar(self.operador, """
+            X = {1,2}
+            X = R ∘ R
+            X
+        """)
+        self.assertEqual(errores, 0, registros)
+        self.assertEqual(registros[2]['tipo'], 'relacion')
+        self.assertNotIn('X', self.operador.conjuntos)
+
+
+if __name__ == '__main__':
+    unittest.main()
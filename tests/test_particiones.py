@@ -0,0 +1,41 @@
+"""
+Pruebas de las clases de equivalencia (src/particiones.py).
+"""
+
+import unittest
+
+from src.conjuntos import OperadorConjuntos
+from src.particiones import clases_equivalencia
+
+
+class PruebaClasesEquivalencia(unittest.TestCase):
+
+    def setUp(self):
+        self.relacion = {(1, 1), (2, 2), (1, 2), (2, 1), (3, 3)}
+
+    def test_sin_conjunto_usa_los_elementos_de_la_relacion(self):
+        clases, representantes = clases_equivalencia(self.relacion)
+        self.assertEqual(clases, [frozenset({1, 2}), frozenset({3})])
+        self.assertEqual(representantes, {1: 1, 2: 1, 3: 3})
+
+    def test_los_pares_fuera_de_a_no_agregan_elementos(self):
+        clases, representantes = clases_equivalencia(self.relacion, {1, 2})
+        self.assertEqual(clases, [frozenset({1, 2})])
+        self.assertEqual(representantes, {1: 1, 2: 1})
+
+    def test_los_pares_fuera_de_a_no_unen_clases(self):
+        # 1 y 2 solo se conectan a través de 3, que no está en A
+        relacion = {(1, 3), (3, 2), (4, 4)}
+        clases, _ = clases_equivalencia(relacion, {1, 2, 4})
+        self.assertEqual(clases, [frozenset({1}), frozenset({2}), frozenset({4})])
+
+    def test_operador_con_conjunto(self):
+        operador = OperadorConjuntos()
+        operador.agregar_relacion('R', self.relacion)
+        operador.agregar_conjunto('A', {1, 2})
+        clases, _ = operador.clases_equivalencia(operador.relaciones['R'], operador.conjuntos['A'])
+        self.assertEqual(clases, [frozenset({1, 2})])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+"""
+Pruebas de RelacionMutable (src/relacion_mutable.py).
+"""
+
+import unittest
+
+from src.conjuntos import OperadorConjuntos
+
+
+class PruebaOperacionesDeConjunto(unittest.TestCase):
+
+    def setUp(self):
+        self.operador = OperadorConjuntos()
+        self.mutable = self.operador.hacer_mutable('E')
+        self.otra = {(1, 'a'), (9, 9)}
+
+    def test_operaciones_del_operador(self):
+        pares = set(self.mutable)
+        self.assertEqual(self.operador.union_conjuntos(self.mutable, self.otra), pares | self.otra)
+        self.assertEqual(self.operador.interseccion_conjuntos(self.mutable, self.otra), {(1, 'a')})
+        self.assertEqual(self.operador.diferencia_conjuntos(self.mutable, self.otra), pares - self.otra)
+
+    def test_el_resultado_no_comparte_estado(self):
+        union = self.operador.union_conjuntos(self.mutable, self.otra)
+        union.add((7, 7))
+        self.assertNotIn((7, 7), self.mutable)
+        self.assertTrue(self.mutable.agregar_par(8, 8))
+        self.assertNotIn((8, 8), union)
+
+
+if __name__ == '__main__':
+    unittest.main()